@@ -4,21 +4,85 @@ Converts XML/JSON to standardized format, then processes with Ollama
 Handles different column names and formats automatically
 """
 
+from __future__ import annotations
+
 import pandas as pd
 import json
+import logging
 import xml.etree.ElementTree as ET
 from claim_processor import ClaimProcessor
-from typing import Dict, List, Any, Optional
+from typing import Dict, Final, List, Any, Optional, Tuple, Union
 import os
-from datetime import datetime
+from datetime import datetime, date
 import re
+import sys
+import sysconfig
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 import base64
+import hashlib
+from bisect import bisect_left, bisect_right
+from functools import cached_property, lru_cache
+from collections import OrderedDict, defaultdict
 from io import BytesIO
 from PIL import Image
+# Tesseract's internal OpenMP threading is inefficient - run it single-threaded and
+# parallelize across images/parties instead. Must be set before tesseract/tesserocr load.
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
 import pytesseract
 import requests
+from requests.adapters import HTTPAdapter
+try:
+    # In-process Tesseract API: keeps the engine and traineddata loaded between calls
+    # instead of spawning a tesseract subprocess per image (pytesseract)
+    from tesserocr import PyTessBaseAPI, OEM
+    TESSEROCR_SUPPORT = True
+except ImportError:
+    TESSEROCR_SUPPORT = False
+try:
+    # OpenCV adaptive threshold for OCR preprocessing (grayscale-only without it)
+    import cv2
+    import numpy as np
+    CV2_SUPPORT = True
+except ImportError:
+    CV2_SUPPORT = False
+try:
+    # C++ fuzzy matching for OCR Party IDs (difflib fallback)
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_SUPPORT = True
+except ImportError:
+    from difflib import SequenceMatcher
+    RAPIDFUZZ_SUPPORT = False
+try:
+    # Aho-Corasick automaton: every keyword family found in a single pass over the OCR text
+    import ahocorasick
+    AHOCORASICK_SUPPORT = True
+except ImportError:
+    AHOCORASICK_SUPPORT = False
+try:
+    # libjpeg-turbo SIMD decoder for JPEG uploads (Pillow decodes everything else)
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    TURBOJPEG_SUPPORT = True
+except ImportError:
+    TURBOJPEG_SUPPORT = False
+try:
+    # Text-layer extraction for born-digital PDFs (skips rasterization + OCR)
+    import pypdfium2 as pdfium
+    PDFIUM_SUPPORT = True
+except ImportError:
+    PDFIUM_SUPPORT = False
+try:
+    # libxml2-backed XML parsing (xml_to_json); ElementTree remains the fallback
+    from lxml import etree as lxml_etree
+    LXML_SUPPORT = True
+except ImportError:
+    LXML_SUPPORT = False
+try:
+    # Rust-backed JSON parsing for the per-row Excel path (stdlib json fallback)
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
 try:
     from pdf2image import convert_from_bytes
     PDF_SUPPORT = True
@@ -38,6 +102,8 @@ except ImportError:
         print("Warning: hijri-converter not installed. Hijri date conversion disabled.")
         print("Install it with: pip install hijri-converter")
 
+logger = logging.getLogger(__name__)
+
 # Configure Tesseract OCR path
 # Note: Windows .exe files won't work on Linux, so we prioritize system installation
 # Try system Tesseract first (recommended for Linux), then custom paths, then Windows path
@@ -147,6 +213,684 @@ if PDF_SUPPORT:
         else:
             print(f"⚠ Warning: Poppler not found, PDF conversion may not work")
 
+# JSON parsing for Excel rows: orjson.JSONDecodeError subclasses json.JSONDecodeError.
+# Rows are always materialized as full dicts (no lazy simdjson documents): XML rows arrive
+# as dicts from xml_to_json anyway, and every row is mutated (License_Type_From_Make_Model)
+# and handed whole to the claim processor.
+if ORJSON_SUPPORT:
+    def _json_loads(data: str) -> Any:
+        return orjson.loads(data)
+else:
+    def _json_loads(data: str) -> Any:
+        return json.loads(data)
+
+# Request field aliases, in lookup order (camelCase from the API, snake_case from Excel exports)
+_PARTY_FIELD_KEYS: Final[Dict[str, Tuple[str, ...]]] = {
+    "party_id": ("ID", "id", "Id"),
+    "name": ("name", "Name"),
+    "liability": ("Liability", "liability"),
+    "gender_id": ("GenderID", "genderID"),
+    "age": ("age", "Age"),
+    "nationality": ("nationality", "Nationality"),
+    "license_no": ("licenseNo", "license_no"),
+    "phone": ("phoneNo", "phone_no"),
+    "license_type": ("licenseType", "license_type"),
+    "car_make": ("carMake", "car_make"),
+    "car_model": ("carModel", "car_model"),
+    "car_year": ("carMfgYear", "car_year"),
+    "plate_no": ("plateNo", "plate_no"),
+    "chassis_no": ("chassisNo", "chassis_no"),
+    "vehicle_owner_id": ("VehicleOwnerId", "vehicleOwnerId", "vehicle_owner_id"),
+}
+_INSURANCE_INFO_KEYS: Final[Tuple[str, ...]] = ("Insurance_Info", "insurance_info", "InsuranceInfo")
+_INSURANCE_FIELD_KEYS: Final[Dict[str, Tuple[str, ...]]] = {
+    "policy_number": ("policyNumber", "policy_number"),
+    "ic_arabic_name": ("ICArabicName", "ic_arabic_name"),
+    "ic_english_name": ("ICEnglishName", "ic_english_name", "EnglishNam", "english_nam", "EnglishName", "english_name"),
+    "policy_expiry": ("policyExpiryDate", "policy_expiry"),
+    "vehicle_id": ("vehicleID", "vehicle_id"),
+}
+_ACCIDENT_FIELD_KEYS: Final[Dict[str, Tuple[str, ...]]] = {
+    "case_number": ("caseNumber", "case_number"),
+    "surveyor": ("surveyorName", "surveyor_name"),
+    "call_date": ("callDate", "call_date"),
+    "call_time": ("callTime", "call_time"),
+    "city": ("city", "City"),
+    "location": ("location", "Location"),
+    "coordinates": ("LocationCoordinates", "location_coordinates"),
+    "landmark": ("landmark", "Landmark"),
+    "description": ("AccidentDescription", "accident_description"),
+}
+_DAA_FIELD_KEYS: Final[Dict[str, Tuple[str, ...]]] = {
+    "isDAA": ("isDAA", "is_daa", "IsDAA"),
+    "Suspect_as_Fraud": ("Suspect_as_Fraud", "suspect_as_fraud", "SuspectAsFraud"),
+    "DaaReasonEnglish": ("DaaReasonEnglish", "daa_reason_english", "DaaReason", "daaReasonEnglish"),
+}
+
+
+def _first_present(data: Dict[str, Any], keys: tuple, default: Any = "") -> Any:
+    """Value of the first alias present in data (same as nested data.get(a, data.get(b, default)))"""
+    for key in keys:
+        if key in data:
+            return data[key]
+    return default
+
+
+def _first_truthy(data: Dict[str, Any], keys: tuple) -> Any:
+    """First truthy alias value in data, or None (same as data.get(a) or data.get(b) or None)"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
+
+def _first_text(data: Dict[str, Any], keys: tuple) -> Optional[str]:
+    """First truthy alias value as stripped text, or None (NaN from a JSON NaN literal counts as missing)"""
+    value = _first_truthy(data, keys)
+    if value is None or value != value:
+        return None
+    return str(value).strip()
+
+
+# Where converted requests keep their Case_Info node, in lookup order (first non-empty wins)
+_CASE_INFO_PATHS: Final[Tuple[Tuple[str, ...], ...]] = (
+    ("EICWS", "cases", "Case_Info"),
+    ("cases", "Case_Info"),
+    ("Case_Info",),
+)
+
+
+def _locate_case_info(json_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Case_Info node of a converted request, or None when no known layout has one"""
+    for path in _CASE_INFO_PATHS:
+        node = json_data
+        for key in path:
+            node = node.get(key) if isinstance(node, dict) else None
+        if node and isinstance(node, dict):
+            return node
+    return None
+
+
+def _case_party_list(case_info: Dict[str, Any]) -> List[Any]:
+    """Party entries under case_info["parties"] (Party_Info list, single Party_Info, or a bare list)"""
+    parties_raw = case_info.get("parties", {})
+    if isinstance(parties_raw, dict):
+        party_info_list = parties_raw.get("Party_Info", [])
+        if isinstance(party_info_list, list):
+            return party_info_list
+        if isinstance(party_info_list, dict):
+            return [party_info_list]
+    elif isinstance(parties_raw, list):
+        return parties_raw
+    return []
+
+
+# Case number fields checked in a converted request (top level, then accident_details) when the
+# claim processor reports none
+_CASE_NUMBER_KEYS: Final[Tuple[str, ...]] = ('Case_Number', 'case_number', 'CaseNumber', 'caseNumber',
+                                             'CaseNo', 'caseNo', 'Case_No', 'case_no', 'ClaimNumber', 'claimNumber')
+
+
+def _request_case_number(json_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Case number carried by the request itself, or None. A value that is empty or a
+    "Case_" placeholder at the top level falls through to accident_details.
+    """
+    case_number = None
+    for source in (json_data, json_data.get('accident_details')):
+        if not isinstance(source, dict):
+            continue
+        key = next((key for key in _CASE_NUMBER_KEYS if key in source), None)
+        if key is not None:
+            case_number = str(source[key]).strip()
+        if case_number and not case_number.startswith("Case_"):
+            break
+    return case_number
+
+
+def _is_blank_cell(value: Any) -> bool:
+    """True for NaN/None cells and whitespace-only text (str cells checked without a stripped copy)"""
+    if isinstance(value, str):
+        return not value or value.isspace()
+    return pd.isna(value) or str(value).strip() == ""
+
+
+# License expiry date with the year range baked into the pattern:
+# Gregorian 2010-2100, Hijri 1400-1600, or 2-digit year 10-50 (20xx).
+# Dates of birth / old licenses (e.g. 1985, 2005) never match, so no Python year filter is needed.
+_EXPIRY_DATE_RE = re.compile(r'(?<!\d)\d{1,2}[/-]\d{1,2}[/-](?:20[1-9]\d|2100|1[45]\d{2}|1600|[1-4]\d|50)(?!\d)')
+
+# License expiry priority patterns for extract_license_expiry_from_image - ONLY "تاريخ إنتهاء الرخصة" (License Expiry Date)
+# CRITICAL: These patterns MUST contain the full phrase "تاريخ إنتهاء الرخصة"
+# We do NOT extract dates from "تاريخ إضافة الرخصة" (Upload Date) or any other field
+# Note: "إنتهاء" (with kasra and hamza) vs "انتهاء" (with fatha) - both are valid, as are "الرخصة" / "الرخصه";
+# each pattern covers all spellings with [إا] / [ةه] instead of one pattern per variant
+# Patterns handle invisible Unicode characters and flexible spacing
+# IMPORTANT: OCR may show "Expiry Date" or "License Expiry" - both are handled
+_PRIORITY_RES = tuple(re.compile(p, re.IGNORECASE | re.UNICODE) for p in [
+    # HIGHEST PRIORITY: Full phrase "تاريخ إنتهاء الرخصة" with "Expiry Date" (most common in OCR)
+    r'تاريخ\s*[إا]نتهاء\s*الرخص[ةه]\s*[/\s]*\s*Expiry\s*Date\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'تاريخ\s*[إا]نتهاء\s*الرخص[ةه]\s*[/\s]*\s*Expiry\s*Date\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    # Full phrase with "License Expiry"
+    r'تاريخ\s*[إا]نتهاء\s*الرخص[ةه]\s*[/\s]*\s*License\s*Expiry\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    # Full phrase "تاريخ إنتهاء الرخصة" (Arabic only)
+    r'تاريخ\s*[إا]نتهاء\s*الرخص[ةه]\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    # Table format: "تاريخ" followed by "إنتهاء الرخصة" (flexible spacing for table columns)
+    r'تاريخ[:\s]*[إا]نتهاء\s*الرخصة\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    # OCR variation: انتهاءء الرخصة (with two hamzas)
+    r'تاريخ\s*انتهاءء\s*الرخص[ةه]\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+])
+
+# Upload Date patterns - dates near these are skipped unless an expiry keyword is also nearby
+_UPLOAD_RES = tuple(re.compile(p, re.IGNORECASE | re.UNICODE) for p in [
+    r'تاريخ\s*إضافة\s*الرخصة',
+    r'تاريخ\s*إضافه\s*الرخصة',
+    r'تاريخ\s*اضافة\s*الرخصة',
+    r'تاريخ\s*الرفع',
+    r'Upload\s*Date',
+    r'إضافة\s*الرخصة',
+    r'رفع\s*الرخصة'
+])
+
+# Upload Date values (extract_upload_date), tried in order
+_UPLOAD_DATE_RES = tuple(re.compile(p, re.IGNORECASE | re.UNICODE) for p in [
+    r'تاريخ\s*إضافة\s*الرخصة[:\s/]*\s*Expiry\s*Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'تاريخ\s*إضافةالرخصة[:\s/]*\s*Expiry\s*Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'Upload\s*Date[:\s/]*\s*تاريخ\s*إضافة[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'Upload\s*Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'تاريخ\s*إضافة\s*الرخصة[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'تاريخ\s*إضافةالرخصة[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
+])
+
+# Keywords to EXCLUDE around license expiry dates (إصدار الرخصة - Issue Date, Upload Date, Version Date)
+# IMPORTANT: Exclude Upload Date (تاريخ إضافة الرخصة) which is often 19/11/2025
+# IMPORTANT: Exclude Version Date (تاريخ الإصدار / Version Date) which is 19/11/2025
+_EXCLUDE_KEYWORDS = (
+    # Issue/Version Date keywords
+    'إصدار', 'اصدار', 'تاريخ الإصدار', 'تاريخ الاصدار', 
+    'Issue Date', 'Issue', 'Date of Issue', 'Issued',
+    'تاريخ الصدور', 'صدر', 'صدرت',
+    'Version Date', 'Version',
+    # Upload Date keywords - CRITICAL: These must be excluded
+    'Upload Date', 'تاريخ إضافة', 'تاريخ الرفع', 'تاريخ إضافة الرخصة', 'تاريخ إضافةالرخصة',  # No space variant
+    'تاريخ الرفع الرخصة', 'إضافة الرخصة', 'إضافةالرخصة',  # No space variant
+    'رفع الرخصة', 'رفعالرخصة',  # No space variant
+    'تاريخ اضافة', 'تاريخ اضافة الرخصة', 'تاريخ اضافةالرخصة',  # No space variant
+    'اضافة الرخصة', 'اضافةالرخصة',  # No space variant
+    # Common OCR variations
+    'تاريخ إضافه', 'تاريخ اضافه', 'إضافه', 'اضافه', 'تاريخ إضافهالرخصة', 'إضافهالرخصة'
+)
+
+# Report header keywords - dates near these are report/accident dates, never license expiry
+_REPORT_HEADER_KEYWORDS = (
+    'Version Date', 'تاريخ الإصدار', 'تاريخ الاصدار', 'Version',
+    'Accident Time', 'وقت الحادث', 'Accident Date', 'تاريخ الحادث',
+    'Case Number', 'رقم الحالة', 'Case',
+    'Final Report', 'التقرير', 'Report',
+    'Liability Determination Report'
+)
+
+
+def _find_all_occurrences(text: str, keyword: str) -> List[int]:
+    """Sorted start positions of every (case-sensitive) occurrence of keyword in text"""
+    positions = []
+    pos = text.find(keyword)
+    while pos != -1:
+        positions.append(pos)
+        pos = text.find(keyword, pos + len(keyword))
+    return positions
+
+
+# Expiry keywords - when present near a date they take priority over exclude keywords
+_EXPIRY_CONTEXT_KEYWORDS = ('إنتهاء', 'انتهاء', 'Expiry', 'Expires')
+
+# Keyword families located once per OCR text by _scan_keyword_positions
+_KEYWORD_FAMILIES = (
+    ('header', _REPORT_HEADER_KEYWORDS),
+    ('exclude', _EXCLUDE_KEYWORDS),
+    ('expiry', _EXPIRY_CONTEXT_KEYWORDS),
+)
+
+
+def _keyword_lookahead_re(keywords) -> re.Pattern:
+    """Case-insensitive alternation reporting every (overlapping) start position, shortest keyword first"""
+    alternation = '|'.join(re.escape(kw) for kw in sorted(keywords, key=len))
+    return re.compile(f'(?=({alternation}))', re.IGNORECASE)
+
+
+# Regex fallback when pyahocorasick is not installed - one alternation scan per family
+_KEYWORD_FAMILY_RES = tuple((family, _keyword_lookahead_re(keywords)) for family, keywords in _KEYWORD_FAMILIES)
+
+if AHOCORASICK_SUPPORT:
+    # Built once per process; payload is every (family, keyword) sharing the lowercased word
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _family, _keywords in _KEYWORD_FAMILIES:
+        for _kw in _keywords:
+            _kw_lower = _kw.lower()
+            _entries = _KEYWORD_AUTOMATON.get(_kw_lower, ())
+            if (_family, _kw_lower) not in _entries:
+                _KEYWORD_AUTOMATON.add_word(_kw_lower, _entries + ((_family, _kw_lower),))
+    _KEYWORD_AUTOMATON.make_automaton()
+
+
+def _scan_keyword_positions(text: str) -> Dict[str, List[tuple]]:
+    """
+    Locate every report-header / exclude / expiry keyword in text (case-insensitive).
+    
+    Returns:
+        {family: [(start, end, keyword), ...]} sorted by position
+    """
+    positions = {family: [] for family, _ in _KEYWORD_FAMILIES}
+    text_lower = text.lower() if AHOCORASICK_SUPPORT else None
+    # lower() can change length for a few non-Arabic characters - positions must stay aligned
+    if text_lower is not None and len(text_lower) == len(text):
+        for end_idx, entries in _KEYWORD_AUTOMATON.iter(text_lower):
+            for family, kw in entries:
+                positions[family].append((end_idx - len(kw) + 1, end_idx + 1, kw))
+        for matches in positions.values():
+            matches.sort()
+    else:
+        for family, family_re in _KEYWORD_FAMILY_RES:
+            positions[family] = [(m.start(1), m.end(1), m.group(1)) for m in family_re.finditer(text)]
+    return positions
+
+# Characters deleted from OCR text before regex matching:
+# - invisible formatting marks: LRM, RLM, zero-width space / non-joiner / joiner, BOM, word joiner
+# - Arabic tatweel (U+0640) and harakat (U+064B-U+065F), which OCR sprinkles inside keywords
+_OCR_CLEAN_TRANS = str.maketrans('', '', '\u200E\u200F\u200B\u200C\u200D\uFEFF\u2060\u0640'
+                                 + ''.join(map(chr, range(0x064B, 0x0660))))
+
+_DATE_RE = re.compile(r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})')
+
+# Expiry label keywords for the pre-extraction diagnostics - one pass reports every occurrence
+# (lookahead, so 'License Expiry Date' still yields both 'License Expiry' and 'Expiry Date')
+_EXPIRY_LABEL_KEYWORDS_RE = re.compile('(?=(' + '|'.join(
+    re.escape(kw) for kw in ('تاريخ إنتهاء', 'تاريخ انتهاء', 'Expiry Date', 'License Expiry')) + '))')
+
+# Any digit (ASCII or Arabic-Indic, like the \d in the date patterns) - fast reject for date scans
+_HAS_DIGIT_RE = re.compile(r'\d')
+
+# Party ID scanning (extract_party_ids_with_positions) - each regex is a single pass over the OCR text;
+# the lookahead alternations still report overlapping keyword starts (e.g. 'رقم الهوية' and 'الهوية')
+# Positions are character offsets into the combined OCR text, not image coordinates: the matching
+# (keyword windows, Upload Date/Date of Birth exclusion, party<->date proximity) runs on the text of
+# all pages joined, and per-token boxes from image_to_data would not carry the label context.
+_PARTY_ID_RE = re.compile(r'\b(\d{8,10})\b')
+_PARTY_ID_AFTER_KEYWORD_RE = re.compile(
+    r'(?=(?:رقم\s*الهوية|ID\s*Number|Party\s*ID|رقم\s*الهويه|الهوية|الهويه)[:\s]*(\d{8,10}))',
+    re.IGNORECASE
+)
+_PARTY_ID_KEYWORDS_RE = _keyword_lookahead_re(['رقم الهوية', 'رقم الهويه', 'ID Number', 'Party ID', 'الهوية', 'الهويه'])
+_PARTY_ROW_KEYWORDS = ('طرف', 'Party', 'مسؤولية', 'Liability', 'رخصة', 'License', 'تأمين', 'Insurance')
+_CASE_NUMBER_RE = re.compile(r'[A-Z]{2}\d+')
+_PHONE_NUMBER_RE = re.compile(r'[+\s]\d{8,10}')
+
+# Default exclude keywords for extract_all_expiry_dates_with_positions (Upload Date and Date of Birth)
+_POSITION_EXCLUDE_KEYWORDS = (
+    'إصدار', 'اصدار', 'تاريخ الإصدار', 'Version Date', 'Upload Date', 
+    'تاريخ إضافة', 'تاريخ الرفع', 'تاريخ إضافة الرخصة', 'تاريخ إضافةالرخصة',  # No space variant
+    'إضافة الرخصة', 'إضافةالرخصة',  # No space variant
+    'رفع الرخصة', 'رفعالرخصة',  # No space variant
+    'تاريخ اضافة', 'تاريخ اضافة الرخصة', 'تاريخ اضافةالرخصة',  # No space variant
+    'اضافة الرخصة', 'اضافةالرخصة',  # No space variant
+    # Date of Birth keywords
+    'تاريخ الميلاد', 'تاريخ ميلاد', 'Date of Birth', 'Birth Date', 'DOB',
+    'ميلاد', 'ولادة', 'تاريخ الولادة'
+)
+
+# Priority patterns for extract_all_expiry_dates_with_positions (written in lowercase, see below)
+# Arabic patterns - MUST contain "تاريخ إنتهاء الرخصة"
+_POSITION_ARABIC_PATTERNS = (
+    r'تاريخ\s*[إا]نتهاء\s*الرخص[ةه]\s*[/\s]*\s*expiry\s*date\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'تاريخ\s*[إا]نتهاء\s*الرخص[ةه]\s*[:\s|]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+)
+
+# English patterns - for translated OCR text
+# CRITICAL: These patterns work with English-only text (after translation)
+_POSITION_ENGLISH_PATTERNS = (
+    r'license\s*expiry\s*date\s*[:\s|]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'license\s*expiry\s*date\s*[:\s|]*(\d{4}[/-]\d{1,2}[/-]\d{1,2})',  # YYYY-MM-DD format
+    r'expiry\s*date\s*[:\s|]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'expiry\s*date\s*[:\s|]*(\d{4}[/-]\d{1,2}[/-]\d{1,2})',  # YYYY-MM-DD format
+    # Pattern for table format with pipe separators
+    r'expiry\s*date\s*\|\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'license\s*expiry\s*date\s*\|\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+)
+
+_POSITION_PRIORITY_PATTERNS = _POSITION_ARABIC_PATTERNS + _POSITION_ENGLISH_PATTERNS
+_POSITION_PRIORITY_RES = tuple(re.compile(p, re.IGNORECASE | re.UNICODE) for p in _POSITION_PRIORITY_PATTERNS)
+# Case-sensitive twins run against the lowercased OCR text: CPython's re cannot use its fast literal
+# prefix search under IGNORECASE, so each English pattern scans ~8x faster this way
+_POSITION_PRIORITY_LOWER_RES = tuple(re.compile(p) for p in _POSITION_PRIORITY_PATTERNS)
+
+# Upload Date / Date of Birth keyword positions (extract_all_expiry_dates_with_positions), one scan each
+_UPLOAD_KEYWORD_POSITIONS_RE = re.compile('(?=(' + '|'.join([
+    r'تاريخ\s*إضافة\s*الرخصة',
+    r'تاريخ\s*إضافةالرخصة',  # No space between إضافة and الرخصة
+    r'تاريخ\s*إضافه\s*الرخصة',
+    r'تاريخ\s*إضافهالرخصة',  # No space variant
+    r'تاريخ\s*اضافة\s*الرخصة',
+    r'تاريخ\s*اضافةالرخصة',  # No space variant
+    r'تاريخ\s*الرفع',
+    r'Upload\s*Date',
+    r'إضافة\s*الرخصة',
+    r'إضافةالرخصة',  # No space variant
+    r'رفع\s*الرخصة',
+    r'رفعالرخصة'  # No space variant
+]) + '))', re.IGNORECASE)
+_BIRTH_KEYWORD_POSITIONS_RE = re.compile('(?=(' + '|'.join([
+    r'تاريخ\s*الميلاد',
+    r'تاريخ\s*ميلاد',
+    r'تاريخ\s*الولادة',
+    r'Date\s*of\s*Birth',
+    r'Birth\s*Date',
+    r'DOB',
+    r'ميلاد',
+    r'ولادة'
+]) + '))', re.IGNORECASE)
+
+# PDF rasterization DPI for OCR (poppler default is 200) - 150 is enough for printed license reports
+PDF_OCR_DPI = 150
+
+# Images wider than this are downscaled before OCR (Tesseract runtime scales with pixel count)
+OCR_MAX_IMAGE_SIDE = 2000
+
+# Max number of OCR texts kept in the per-processor content-hash cache (oldest evicted first)
+OCR_CACHE_MAX_ENTRIES = 128
+
+# Max number of (make, model) -> license type results kept per processor (cleared when full)
+LICENSE_TYPE_CACHE_MAX_ENTRIES = 4096
+
+# Max number of Arabic -> English translations kept per processor (cleared when full)
+TRANSLATION_CACHE_MAX_ENTRIES = 1024
+
+# Max characters of Arabic phrases sent in one OCR translation prompt (translate_ocr_to_english)
+OCR_TRANSLATION_MAX_CHARS = 4500
+
+# OCR output shorter than this (stripped) is treated as a failed read
+OCR_MIN_TEXT_CHARS = 10
+
+# Max pages of one case's base64 file OCR'd concurrently in the pre-extraction
+OCR_PAGE_WORKERS = 4
+
+# Max resident tesserocr engines per language (each holds its traineddata in memory, ~100 MB+ for
+# ara+eng) - OCR calls beyond this wait for an engine instead of loading another one
+TESSEROCR_ENGINES_PER_LANG = 4
+
+# Keep-alive connections kept open to Ollama for the translation calls (row x party threads)
+OLLAMA_HTTP_POOL_SIZE = 32
+
+# Free-threaded CPython (PEP 703, 3.13t) - Python-side work in worker threads runs in parallel
+if hasattr(sys, '_is_gil_enabled'):
+    GIL_DISABLED = not sys._is_gil_enabled()
+else:
+    GIL_DISABLED = bool(sysconfig.get_config_var('Py_GIL_DISABLED'))
+
+# pytesseract config strings per page segmentation mode (6 = uniform block, 4 = single column)
+_CFG_PSM6 = '--psm 6 --oem 3'
+_CFG_PSM4 = '--psm 4 --oem 3'
+_TESSERACT_CONFIGS = {6: _CFG_PSM6, 4: _CFG_PSM4}
+
+
+def _split_base64_pages(file_content: Union[str, bytes]) -> List[Union[str, bytes]]:
+    """
+    Split a case's base64 file (text, or the raw bytes) into pages: blank-line separated blocks,
+    else one page per line when every line is long enough to be a whole image, else the whole file
+    """
+    newline = '\n' if isinstance(file_content, str) else b'\n'
+    blank_line = newline * 2
+    if blank_line in file_content:
+        return [page.strip() for page in file_content.split(blank_line) if page.strip()]
+    # A file without newlines splits into a single line - no separate newline scan needed
+    lines = file_content.split(newline)
+    if len(lines) > 1 and all(len(line) > 100 for line in lines):
+        return [line.strip() for line in lines if line.strip()]
+    return [file_content]
+
+
+_NONDIGIT_RE = re.compile(r'[^\d]')
+
+# _validate_ymd results: day/month out of range, year outside both calendars, Gregorian, Hijri
+_YMD_BAD_DAY_MONTH = 0
+_YMD_BAD_YEAR = -1
+_YMD_GREGORIAN = 1
+_YMD_HIJRI = 2
+
+
+def _validate_ymd(year: int, month: int, day: int) -> int:
+    """Range-check date parts: day 1-31, month 1-12, year Gregorian 1900-2100 or Hijri 1400-1600"""
+    if not (1 <= day <= 31 and 1 <= month <= 12):
+        return _YMD_BAD_DAY_MONTH
+    if 1900 <= year <= 2100:
+        return _YMD_GREGORIAN
+    if 1400 <= year <= 1600:
+        return _YMD_HIJRI
+    return _YMD_BAD_YEAR
+
+
+def _split_yyyymmdd(digits: str):
+    """(year, month, day) from an 8-digit YYYYMMDD string - one int() plus divmod instead of three slices"""
+    year, month_day = divmod(int(digits), 10000)
+    month, day = divmod(month_day, 100)
+    return year, month, day
+
+
+def _int_date_parts(parts: List[str]) -> Optional[tuple]:
+    """int() of the three parts of a split date string, or None if any of them isn't an integer"""
+    if parts[0].isdecimal() and parts[1].isdecimal() and parts[2].isdecimal():
+        return int(parts[0]), int(parts[1]), int(parts[2])
+    # int() also accepts padded / signed parts (' 11', '+3') - keep that leniency for OCR text
+    try:
+        return int(parts[0]), int(parts[1]), int(parts[2])
+    except ValueError:
+        return None
+
+
+# hijri-converter follows the Umm al-Qura calendar printed on Saudi licenses. Closed-form tabular
+# (Kuwaiti) arithmetic would be cheaper but lands a day or two off for roughly half of all months,
+# and a library call is only ~3us - so keep the library and memoize it instead.
+@lru_cache(maxsize=8192)
+def _hijri_to_gregorian(year: int, month: int, day: int):
+    """Hijri -> Gregorian date; memoized since claims in a batch share expiry dates"""
+    return Hijri(year, month, day).to_gregorian()
+
+
+@lru_cache(maxsize=64)
+def _gregorian_to_hijri(year: int, month: int, day: int):
+    """Gregorian -> Hijri date; used for today's date, so one conversion per calendar day"""
+    return Gregorian(year, month, day).to_hijri()
+
+
+# Already-normalized date (normalize_date_format / convert_hijri_to_gregorian)
+_YMD_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Excel "_xHHHH_" unicode escapes in cell values (clean_data)
+_EXCEL_UNICODE_RE = re.compile(r'_x([0-9A-Fa-f]{4})_')
+
+# The five XML entities decoded by clean_data, in one pass. '&amp;lt;', '&amp;gt;' and
+# '&amp;apos;' decode twice (to '<', '>', "'"), as the former chain of str.replace calls
+# ('&quot;', '&amp;', '&lt;', '&gt;', '&apos;' in that order) did.
+_HTML_ENTITY_RE = re.compile(r'&(?:amp;)?(lt|gt|apos);|&(quot|amp);')
+_HTML_ENTITIES = {'lt': '<', 'gt': '>', 'apos': "'", 'quot': '"', 'amp': '&'}
+
+
+def _replace_html_entity(match) -> str:
+    return _HTML_ENTITIES[match.group(1) or match.group(2)]
+
+# Substrings that mark a likely request column when no name matches (find_request_column)
+_REQUEST_COLUMN_HINT_RE = re.compile(r'request|data|xml|json|claim')
+
+# First non-whitespace character of a request payload: '<' for XML, '{' for JSON (detect_and_convert)
+_PAYLOAD_FIRST_CHAR_RE = re.compile(r'\s*(\S)')
+
+# XML 1.0 control characters that make ElementTree reject a document (xml_to_json)
+_XML_CTRL_RE = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]')
+_XML_CTRL_TABLE = dict.fromkeys(list(range(0x00, 0x09)) + [0x0B, 0x0C] + list(range(0x0E, 0x20)) + [0x7F])
+
+
+def _strip_xml_control_chars(text: str) -> str:
+    """Delete XML-invalid control characters from text"""
+    # str.translate has a cached fast path for pure-ASCII strings (~8x faster than the regex there),
+    # but is several times slower than the regex on Arabic text - pick per string (isascii() is O(1))
+    if text.isascii():
+        return text.translate(_XML_CTRL_TABLE)
+    return _XML_CTRL_RE.sub('', text)
+
+# Namespace prefix fixes applied in order when ElementTree reports an unbound prefix (xml_to_json)
+_XML_NAMESPACE_FIXES = (
+    (re.compile(r'<s0:(\w+)'), r'<\1'),
+    (re.compile(r'</s0:(\w+)'), r'</\1'),
+    (re.compile(r'<xsi:(\w+)'), r'<\1'),
+    (re.compile(r'</xsi:(\w+)'), r'</\1'),
+    (re.compile(r'\ss0:(\w+)='), r' \1='),
+    (re.compile(r'\sxsi:(\w+)='), r' \1='),
+    (re.compile(r'\sxsi:nil="[^"]*"'), ''),
+)
+
+# Strict parsers for xml_to_json's fast path, reused across rows but kept per thread: a shared
+# lxml parser serializes concurrent parses on its context lock, and Excel rows are converted
+# on a thread pool. Encoding override because the cleaned document is always handed over as
+# UTF-8 bytes, whatever its declaration says
+_LXML_PARSERS = threading.local()
+
+
+def _lxml_parser():
+    """This thread's reusable strict lxml parser"""
+    parser = getattr(_LXML_PARSERS, 'parser', None)
+    if parser is None:
+        # Request XML is untrusted - no entity expansion, DTD loading or network access (XXE)
+        parser = _LXML_PARSERS.parser = lxml_etree.XMLParser(
+            encoding='utf-8', resolve_entities=False, no_network=True, load_dtd=False)
+    return parser
+
+
+def _xml_local_name(tag: str) -> str:
+    """Tag without its '{namespace}' prefix"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _xml_element_to_dict(root) -> Any:
+    """
+    Convert an XML element tree (ElementTree or lxml) to nested dicts/lists/strings.
+    
+    Leaf elements become their stripped text (or a copy of their attributes, or None);
+    repeated child tags become lists; parents keep their own text under '_text' and
+    attributes under '_attributes'. Walks the tree iteratively: reversed document
+    order visits every child before its parent, so no recursion is needed.
+    """
+    values = {}
+    for element in reversed([el for el in root.iter() if isinstance(el.tag, str)]):
+        # Read text/attrib once: every lxml property access builds a new proxy object
+        text = element.text
+        if text:
+            text = text.strip()
+        attrib = element.attrib
+        # lxml also yields comments / processing instructions as children
+        children = [child for child in element if isinstance(child.tag, str)] if len(element) else None
+        if not children:
+            if text:
+                value = text
+            elif attrib:
+                value = dict(attrib)
+            else:
+                value = None
+        else:
+            value = {}
+            for child in children:
+                child_tag = _xml_local_name(child.tag)
+                child_data = values.pop(id(child))
+                if child_tag not in value:
+                    value[child_tag] = child_data
+                elif isinstance(value[child_tag], list):
+                    value[child_tag].append(child_data)
+                else:
+                    value[child_tag] = [value[child_tag], child_data]
+            if text:
+                value['_text'] = text
+            if attrib:
+                value['_attributes'] = dict(attrib)
+        values[id(element)] = value
+    return values[id(root)]
+
+
+class _BlankDefaultDict(dict):
+    """format_map field source - a missing key renders as "" (like .get(key, ""))"""
+    def __missing__(self, key):
+        return ""
+
+
+# Per-party analysis text (party worker in _process_single_row) - {accident[...]} and
+# {party[...]} are _BlankDefaultDict lookups, so absent fields render empty
+_PARTY_ANALYSIS_TEMPLATE = """
+Accident Description (Arabic):
+{accident_description}
+
+Case Information:
+- Case Number: {accident[Case_Number]}
+- Surveyor: {accident[Surveyor]}
+- Date: {accident[Call_Date]} Time: {accident[Call_Time]}
+- Location: {accident[Location]}, {accident[City]}
+- Coordinates: {accident[Coordinates]}
+
+Party {party_number} Information:
+- Name: {party[Name]}
+- ID: {party[Party_ID]}
+- Gender: {party[Gender]}
+- Age: {party[Age]}
+- Nationality: {party[Nationality]}
+- License No: {party[License_No]}
+- Phone: {party[Phone]}
+- Liability: {party[Liability]}%
+- Vehicle: {party[Vehicle_Make]} {party[Vehicle_Model]} ({party[Vehicle_Year]})
+- Plate No: {party[Plate_No]}
+- Chassis: {party[Chassis_No]}
+- Insurance Company: {party[Insurance_Name]}
+- Policy Number: {party[Policy_Number]}
+- Policy Expiry: {party[Policy_Expiry]}
+- Damage: {party[Damage_Type]}
+- Act/Violation: {party[Act_Violation]}
+"""
+
+# Instructions for _request_arabic_translation, split around the text to translate
+_TRANSLATION_PROMPT_PREFIX = """You are a professional translator specializing in motor vehicle accident reports and insurance claims (LD reports).
+Translate the following text from Arabic to English using accurate insurance and motor accident terminology.
+
+CRITICAL INSTRUCTIONS FOR LD REPORT TRANSLATION:
+1. Translate ONLY Arabic text to English using standard motor accident report terminology
+2. Keep ALL English text EXACTLY as is (do not modify English words, numbers, dates, IDs, or formatting)
+3. Use standard LD report terminology:
+   - "حادث مروري" → "Motor Vehicle Accident" or "Traffic Accident"
+   - "مسؤولية" → "Liability"
+   - "متضرر" → "Victim" or "Injured Party"
+   - "متسبب" → "At-Fault Party" or "Responsible Party"
+   - "رخصة قيادة" → "Driving License" or "Driver's License"
+   - "مركبة" → "Vehicle"
+   - "تأمين" → "Insurance"
+   - "بوليصة" → "Policy"
+   - "مطالبة" → "Claim"
+   - "أضرار" → "Damages"
+   - "انتهاك" → "Violation" or "Traffic Violation"
+   - "عكس السير" → "Wrong-Way Driving" or "Reversing Direction"
+   - "تجاوز الإشارة الحمراء" → "Running Red Light" or "Red Light Violation"
+   - "التعاونية للتأمين" → "Tawuniya Cooperative Insurance Company"
+   - "قاعدة" → "Rule"
+   - "قرار" → "Decision"
+   - "مرفوض" → "REJECTED"
+   - "مقبول" → "ACCEPTED"
+   - "مقبول مع حق الرجوع" → "ACCEPTED_WITH_RECOVERY"
+4. Preserve ALL structure, formatting, line breaks, and spacing
+5. Do NOT add any explanations, notes, or comments
+6. Return ONLY the translated text
+
+Text to translate:
+"""
+_TRANSLATION_PROMPT_SUFFIX = "\n\nTranslation (Arabic parts only, keep English unchanged, use LD report terminology):"
+
+# A classification citing the 100% liability rule (Rule #1) - one case-insensitive scan
+# instead of lowercasing the text and testing each phrase
+_RULE1_CLASSIFICATION_RE = re.compile(r'100%|basic rule|rule #1', re.IGNORECASE)
+
 
 class UnifiedClaimProcessor:
     """Unified processor that handles XML/JSON and different column names"""
@@ -230,11 +974,37 @@ class UnifiedClaimProcessor:
         self.make_model_mapping_file = make_model_mapping_file
         self.base_dir = base_dir
         self._mapping_df = None
+        # OCR text cache keyed by image content hash - the same license image is OCR'd
+        # once per party (and again without Party ID matching), so repeat calls are free
+        self._ocr_cache = OrderedDict()
+        self._ocr_cache_lock = threading.Lock()
+        # Idle resident tesserocr engines keyed by language. A tesserocr API is not thread-safe, so
+        # each call checks one out - up to TESSEROCR_ENGINES_PER_LANG at once per language (semaphore)
+        self._tess_idle_apis = {}
+        self._tess_api_slots = {}
+        self._tess_failed_langs = set()
+        self._tess_api_lock = threading.Lock()
+        # License type lookups keyed by normalized (make, model) - the same vehicles repeat across rows
+        self._license_type_cache = {}
+        # Successful Ollama translations keyed by source text - classifications and rule
+        # reasonings repeat across parties and rows
+        self._translation_cache = {}
+        # Shared keep-alive session for the Ollama translation calls - one TCP connect per pooled
+        # connection instead of one per request
+        self._ollama_session = requests.Session()
+        self._ollama_session.mount('http://', HTTPAdapter(pool_maxsize=OLLAMA_HTTP_POOL_SIZE))
+        self._ollama_session.mount('https://', HTTPAdapter(pool_maxsize=OLLAMA_HTTP_POOL_SIZE))
+        # Texts currently being translated -> Event set when the request finishes
+        self._translation_in_flight = {}
+        self._translation_lock = threading.Lock()
+        # Base64 file names per directory: {base64_files_path: (directory mtime, {case file stem: path})}
+        self._base64_file_index = {}
         # Load make/model mapping for License_Type_From_Make_Model extraction
         self._load_make_model_mapping()
     
     def _load_make_model_mapping(self):
         """Load the Make/Model to License type mapping from Excel file"""
+        self._license_type_cache.clear()
         try:
             if os.path.exists(self.make_model_mapping_file):
                 self._mapping_df = pd.read_excel(self.make_model_mapping_file)
@@ -267,12 +1037,23 @@ class UnifiedClaimProcessor:
             return ""
         
         # Normalize inputs (strip, case-insensitive)
-        car_make_clean = str(car_make).strip()
-        car_model_clean = str(car_model).strip()
+        car_make_clean = str(car_make).strip().upper()
+        car_model_clean = str(car_model).strip().upper()
         
         if not car_make_clean or not car_model_clean:
             return ""
         
+        cache_key = (car_make_clean, car_model_clean)
+        license_type = self._license_type_cache.get(cache_key)
+        if license_type is None:
+            license_type = self._match_license_type(car_make_clean, car_model_clean)
+            if len(self._license_type_cache) >= LICENSE_TYPE_CACHE_MAX_ENTRIES:
+                self._license_type_cache.clear()
+            self._license_type_cache[cache_key] = license_type
+        return license_type
+    
+    def _match_license_type(self, car_make_clean: str, car_model_clean: str) -> str:
+        """Scan the mapping sheet for an upper-cased, stripped make/model pair"""
         try:
             # Find the correct column names (handle spaces)
             najm_make_col = None
@@ -301,8 +1082,8 @@ class UnifiedClaimProcessor:
             
             # Try exact match first (case-insensitive, handle Arabic text)
             mask = (
-                (self._mapping_df[najm_make_col].astype(str).str.strip().str.upper() == car_make_clean.upper()) &
-                (self._mapping_df[najm_model_col].astype(str).str.strip().str.upper() == car_model_clean.upper())
+                (self._mapping_df[najm_make_col].astype(str).str.strip().str.upper() == car_make_clean) &
+                (self._mapping_df[najm_model_col].astype(str).str.strip().str.upper() == car_model_clean)
             )
             matches = self._mapping_df[mask]
             
@@ -312,13 +1093,13 @@ class UnifiedClaimProcessor:
             
             # Try partial/fuzzy matching if exact match fails
             # Match Make exactly, Model contains or vice versa
-            mask_make = self._mapping_df[najm_make_col].astype(str).str.strip().str.upper() == car_make_clean.upper()
+            mask_make = self._mapping_df[najm_make_col].astype(str).str.strip().str.upper() == car_make_clean
             if mask_make.any():
                 make_matches = self._mapping_df[mask_make]
                 # Try to find model that contains the input or vice versa
                 for idx, row in make_matches.iterrows():
                     model_val = str(row[najm_model_col]).strip().upper()
-                    if model_val == car_model_clean.upper() or car_model_clean.upper() in model_val or model_val in car_model_clean.upper():
+                    if model_val == car_model_clean or car_model_clean in model_val or model_val in car_model_clean:
                         license_type = row[license_type_col]
                         if pd.notna(license_type):
                             return str(license_type).strip()
@@ -328,6 +1109,11 @@ class UnifiedClaimProcessor:
         
         return ""
     
+    def _translation_pending(self, text: Any) -> bool:
+        """True when _translate_arabic_to_english(text) would make an Ollama round trip"""
+        return (isinstance(text, str) and not text.isascii() and text not in self._translation_cache
+                and re.search(r'[\u0600-\u06FF]', text) is not None)
+    
     def _translate_arabic_to_english(self, text: str) -> str:
         """
         Translate Arabic text to English using Ollama.
@@ -342,53 +1128,47 @@ class UnifiedClaimProcessor:
         if not text or not text.strip():
             return text
         
+        # ASCII-only text cannot contain Arabic - skip the scan below
+        if text.isascii():
+            return text
+        
         # Check if text contains Arabic characters
         has_arabic = bool(re.search(r'[\u0600-\u06FF]', text))
         if not has_arabic:
             # No Arabic text, return as is
             return text
         
+        translated_text = self._translation_cache.get(text)
+        if translated_text is not None:
+            return translated_text
+        
+        # Parties are translated in parallel and often share a classification - the first thread
+        # asks Ollama, the others wait for its result instead of sending the same request again
+        with self._translation_lock:
+            in_flight = self._translation_in_flight.get(text)
+            is_owner = in_flight is None
+            if is_owner:
+                in_flight = self._translation_in_flight[text] = threading.Event()
+        if not is_owner:
+            in_flight.wait()
+            return self._translation_cache.get(text, text)
+        try:
+            return self._request_arabic_translation(text)
+        finally:
+            with self._translation_lock:
+                del self._translation_in_flight[text]
+            in_flight.set()
+    
+    def _request_arabic_translation(self, text: str) -> str:
+        """Send text to the Ollama translation model - caches and returns the translation, or text on failure"""
         try:
             # Use Ollama to translate Arabic to English with LD report terminology
             # Improved prompt for accurate motor accident report translation
-            translation_prompt = f"""You are a professional translator specializing in motor vehicle accident reports and insurance claims (LD reports).
-Translate the following text from Arabic to English using accurate insurance and motor accident terminology.
-
-CRITICAL INSTRUCTIONS FOR LD REPORT TRANSLATION:
-1. Translate ONLY Arabic text to English using standard motor accident report terminology
-2. Keep ALL English text EXACTLY as is (do not modify English words, numbers, dates, IDs, or formatting)
-3. Use standard LD report terminology:
-   - "حادث مروري" → "Motor Vehicle Accident" or "Traffic Accident"
-   - "مسؤولية" → "Liability"
-   - "متضرر" → "Victim" or "Injured Party"
-   - "متسبب" → "At-Fault Party" or "Responsible Party"
-   - "رخصة قيادة" → "Driving License" or "Driver's License"
-   - "مركبة" → "Vehicle"
-   - "تأمين" → "Insurance"
-   - "بوليصة" → "Policy"
-   - "مطالبة" → "Claim"
-   - "أضرار" → "Damages"
-   - "انتهاك" → "Violation" or "Traffic Violation"
-   - "عكس السير" → "Wrong-Way Driving" or "Reversing Direction"
-   - "تجاوز الإشارة الحمراء" → "Running Red Light" or "Red Light Violation"
-   - "التعاونية للتأمين" → "Tawuniya Cooperative Insurance Company"
-   - "قاعدة" → "Rule"
-   - "قرار" → "Decision"
-   - "مرفوض" → "REJECTED"
-   - "مقبول" → "ACCEPTED"
-   - "مقبول مع حق الرجوع" → "ACCEPTED_WITH_RECOVERY"
-4. Preserve ALL structure, formatting, line breaks, and spacing
-5. Do NOT add any explanations, notes, or comments
-6. Return ONLY the translated text
-
-Text to translate:
-{text}
-
-Translation (Arabic parts only, keep English unchanged, use LD report terminology):"""
+            translation_prompt = _TRANSLATION_PROMPT_PREFIX + text + _TRANSLATION_PROMPT_SUFFIX
             
             # Use faster translation_model for translation (accident descriptions, reasoning, etc.)
             translation_model_to_use = getattr(self, 'translation_model', 'llama3.2:latest')
-            response = requests.post(
+            response = self._ollama_session.post(
                 f"{self.ollama_base_url}/api/generate",
                 json={
                     "model": translation_model_to_use,  # Use faster model for translation (not decision model)
@@ -432,6 +1212,11 @@ Translation (Arabic parts only, keep English unchanged, use LD report terminolog
                     translated_text = '\n'.join(cleaned_lines).strip()
                     # Remove leading/trailing quotes if present
                     translated_text = re.sub(r'^["\']+|["\']+$', '', translated_text)
+                    if translated_text:
+                        # Only successful translations are cached - failures fall back to the source text
+                        if len(self._translation_cache) >= TRANSLATION_CACHE_MAX_ENTRIES:
+                            self._translation_cache.clear()
+                        self._translation_cache[text] = translated_text
                     return translated_text if translated_text else text
             else:
                 print(f"  ⚠️ Translation API error: {response.status_code}")
@@ -768,9 +1553,8 @@ Translation (Arabic parts only, keep English unchanged, use LD report terminolog
                 "corrected_decision": None
             }
         
-        # SPECIAL RULE: If there's ANY party with 100% liability from a non-cooperative company,
-        # ALL cooperative parties (including 0% liability) should be REJECTED
-        has_100_percent_non_cooperative = False
+        # Other parties' info (with the decision fallbacks), extracted once for both scans below
+        other_party_infos = []
         for idx, party_decision in enumerate(all_parties):
             if idx == current_party_idx:
                 continue
@@ -783,9 +1567,16 @@ Translation (Arabic parts only, keep English unchanged, use LD report terminolog
             other_party_info = self.extract_party_info(party_raw_data)
             
             # Fallback from decision
+            if not other_party_info.get("Party_ID") and "party_id" in party_decision:
+                other_party_info["Party_ID"] = str(party_decision.get("party_id", ""))
             if other_party_info.get("Liability") == 0 and "liability" in party_decision:
                 other_party_info["Liability"] = int(party_decision.get("liability", 0))
-            
+            other_party_infos.append((idx, other_party_info))
+        
+        # SPECIAL RULE: If there's ANY party with 100% liability from a non-cooperative company,
+        # ALL cooperative parties (including 0% liability) should be REJECTED
+        has_100_percent_non_cooperative = False
+        for idx, other_party_info in other_party_infos:
             other_liability = other_party_info.get("Liability", 0)
             other_insurance = str(other_party_info.get("Insurance_Name", "")).strip()
             
@@ -829,23 +1620,7 @@ Translation (Arabic parts only, keep English unchanged, use LD report terminolog
         
         # Get all other parties with liability > 0%
         at_fault_parties = []
-        for idx, party_decision in enumerate(all_parties):
-            if idx == current_party_idx:
-                continue
-            
-            # Get party info for this other party
-            party_raw_data = parties_data.get(idx, {})
-            if not party_raw_data and "party_info" in party_decision:
-                party_raw_data = party_decision.get("party_info", {})
-            
-            other_party_info = self.extract_party_info(party_raw_data)
-            
-            # Fallback from decision
-            if not other_party_info.get("Party_ID") and "party_id" in party_decision:
-                other_party_info["Party_ID"] = str(party_decision.get("party_id", ""))
-            if other_party_info.get("Liability") == 0 and "liability" in party_decision:
-                other_party_info["Liability"] = int(party_decision.get("liability", 0))
-            
+        for idx, other_party_info in other_party_infos:
             other_liability = other_party_info.get("Liability", 0)
             other_insurance = str(other_party_info.get("Insurance_Name", "")).strip()
             
@@ -983,7 +1758,20 @@ Translation (Arabic parts only, keep English unchanged, use LD report terminolog
             
             # Translate Arabic phrases only (not the whole text)
             # This preserves the report structure
-            phrases_to_translate = list(arabic_phrases.keys())[:20]  # Limit to 20 phrases to avoid timeout
+            # Limit to 20 phrases and OCR_TRANSLATION_MAX_CHARS to avoid timeout - a phrase can run
+            # across lines, so on Arabic-heavy OCR a single one may be most of the document
+            phrases_to_translate = []
+            phrases_chars = 0
+            for phrase in arabic_phrases:
+                if len(phrases_to_translate) >= 20:
+                    break
+                if phrases_chars + len(phrase) > OCR_TRANSLATION_MAX_CHARS:
+                    continue
+                phrases_to_translate.append(phrase)
+                phrases_chars += len(phrase)
+            
+            if not phrases_to_translate:
+                return ocr_text
             translate_prompt = f"""Translate ONLY the Arabic phrases below to English. 
 Keep the translation concise and preserve the meaning.
 Do NOT translate numbers, dates, or English text.
@@ -993,10 +1781,9 @@ Arabic phrases to translate:
 
 Translation (one line per phrase, format: original|translation):"""
 
-            import requests
             # Use faster translation_model for OCR translation
             translation_model_to_use = getattr(self, 'translation_model', 'llama3.2:latest')
-            response = requests.post(
+            response = self._ollama_session.post(
                 f"{self.ollama_base_url}/api/generate",
                 json={
                     "model": translation_model_to_use,  # Use faster model for OCR translation
@@ -1103,55 +1890,30 @@ Translation (one line per phrase, format: original|translation):"""
         """
         party_ids_with_pos = []
         
-        # Step 1: Patterns to find Party ID with position tracking (near keywords)
-        id_patterns = [
-            (r'رقم\s*الهوية[:\s]*(\d{8,10})', 'رقم الهوية'),
-            (r'ID\s*Number[:\s]*(\d{8,10})', 'ID Number'),
-            (r'Party\s*ID[:\s]*(\d{8,10})', 'Party ID'),
-            (r'رقم\s*الهويه[:\s]*(\d{8,10})', 'رقم الهويه'),  # Alternative spelling
-            (r'الهوية[:\s]*(\d{8,10})', 'الهوية'),
-            (r'الهويه[:\s]*(\d{8,10})', 'الهويه'),
-        ]
-        
-        for pattern, keyword in id_patterns:
-            for match in re.finditer(pattern, ocr_text, re.IGNORECASE | re.UNICODE):
-                party_id = match.group(1)
-                start_pos = match.start(1)  # Position of the ID number
-                end_pos = match.end(1)
-                # Clean party ID (remove any non-digit characters)
-                party_id_clean = re.sub(r'[^\d]', '', party_id)
-                if len(party_id_clean) >= 8:  # Ensure it's at least 8 digits
-                    party_ids_with_pos.append((party_id_clean, start_pos, end_pos))
+        # Step 1: Party IDs directly after an ID keyword (all keyword variants in one scan)
+        for match in _PARTY_ID_AFTER_KEYWORD_RE.finditer(ocr_text):
+            party_ids_with_pos.append((match.group(1), match.start(1), match.end(1)))
         
         # Step 2: Also search for Party IDs near ID keywords (expanded context)
-        id_keywords = ['رقم الهوية', 'رقم الهويه', 'ID Number', 'Party ID', 'الهوية', 'الهويه']
-        for keyword in id_keywords:
-            for match in re.finditer(re.escape(keyword), ocr_text, re.IGNORECASE | re.UNICODE):
-                keyword_end = match.end()
-                # Look for 8-10 digit number within 100 characters after keyword (expanded)
-                context_start = keyword_end
-                context_end = min(len(ocr_text), keyword_end + 100)
-                context = ocr_text[context_start:context_end]
-                
-                id_match = re.search(r'\b(\d{8,10})\b', context)
-                if id_match:
-                    party_id = id_match.group(1)
-                    party_id_clean = re.sub(r'[^\d]', '', party_id)
-                    if len(party_id_clean) >= 8:
-                        start_pos = context_start + id_match.start(1)
-                        end_pos = context_start + id_match.end(1)
-                        # Avoid duplicates
-                        if not any(pid == party_id_clean and abs(pos - start_pos) < 10 for pid, pos, _ in party_ids_with_pos):
-                            party_ids_with_pos.append((party_id_clean, start_pos, end_pos))
+        for match in _PARTY_ID_KEYWORDS_RE.finditer(ocr_text):
+            keyword_end = match.end(1)
+            # Look for 8-10 digit number within 100 characters after keyword (expanded)
+            context_start = keyword_end
+            context_end = min(len(ocr_text), keyword_end + 100)
+            context = ocr_text[context_start:context_end]
+            
+            id_match = _PARTY_ID_RE.search(context)
+            if id_match:
+                party_id_clean = id_match.group(1)
+                start_pos = context_start + id_match.start(1)
+                end_pos = context_start + id_match.end(1)
+                # Avoid duplicates
+                if not any(pid == party_id_clean and abs(pos - start_pos) < 10 for pid, pos, _ in party_ids_with_pos):
+                    party_ids_with_pos.append((party_id_clean, start_pos, end_pos))
         
         # Step 3: Extract all 8-10 digit numbers that might be Party IDs (in table contexts)
         # Look for numbers that appear in lines containing party-related keywords
-        party_related_keywords = ['طرف', 'Party', 'مسؤولية', 'Liability', 'رخصة', 'License', 'تأمين', 'Insurance']
-        
-        # Find all 8-10 digit numbers
-        all_number_matches = list(re.finditer(r'\b(\d{8,10})\b', ocr_text))
-        
-        for num_match in all_number_matches:
+        for num_match in _PARTY_ID_RE.finditer(ocr_text):
             num_value = num_match.group(1)
             num_start = num_match.start(1)
             num_end = num_match.end(1)
@@ -1160,11 +1922,6 @@ Translation (one line per phrase, format: original|translation):"""
             if any(pid == num_value and abs(pos - num_start) < 10 for pid, pos, _ in party_ids_with_pos):
                 continue
             
-            # Get context around this number (200 chars before and after)
-            context_start = max(0, num_start - 200)
-            context_end = min(len(ocr_text), num_end + 200)
-            context = ocr_text[context_start:context_end]
-            
             # Check if this number is in a line with party-related keywords
             # Get the line containing this number
             line_start = ocr_text.rfind('\n', 0, num_start)
@@ -1178,26 +1935,16 @@ Translation (one line per phrase, format: original|translation):"""
             line_text = ocr_text[line_start:line_end]
             
             # Check if line contains party-related keywords
-            has_party_keyword = any(kw in line_text for kw in party_related_keywords)
+            if not any(kw in line_text for kw in _PARTY_ROW_KEYWORDS):
+                continue
             
-            # Also check if it's NOT a date (dates usually have / or - separators nearby)
-            # Check 20 chars before and after for date separators
+            # Also check if it's NOT a date (dates usually have / or - separators nearby),
+            # a case number (letters like DM, AK) or a phone number (+ or spaces) - 20 chars either side
             nearby_text = ocr_text[max(0, num_start - 20):min(len(ocr_text), num_end + 20)]
-            is_likely_date = bool(re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', nearby_text))
-            
-            # Check if it's NOT a case number (case numbers usually have letters like DM, AK)
-            is_likely_case_number = bool(re.search(r'[A-Z]{2}\d+', nearby_text))
-            
-            # Check if it's NOT a phone number (phone numbers often have + or spaces)
-            is_likely_phone = bool(re.search(r'[+\s]\d{8,10}', nearby_text))
+            if _DATE_RE.search(nearby_text) or _CASE_NUMBER_RE.search(nearby_text) or _PHONE_NUMBER_RE.search(nearby_text):
+                continue
             
-            # If it's in a party-related context and not a date/case/phone, it's likely a Party ID
-            if has_party_keyword and not is_likely_date and not is_likely_case_number and not is_likely_phone:
-                party_id_clean = re.sub(r'[^\d]', '', num_value)
-                if len(party_id_clean) >= 8:
-                    # Avoid duplicates
-                    if not any(pid == party_id_clean and abs(pos - num_start) < 10 for pid, pos, _ in party_ids_with_pos):
-                        party_ids_with_pos.append((party_id_clean, num_start, num_end))
+            party_ids_with_pos.append((num_value, num_start, num_end))
         
         # Sort by position
         party_ids_with_pos.sort(key=lambda x: x[1])
@@ -1217,101 +1964,43 @@ Translation (one line per phrase, format: original|translation):"""
             exclude_keywords: Keywords that indicate dates to exclude (e.g., Upload Date)
         """
         if exclude_keywords is None:
-            exclude_keywords = [
-                'إصدار', 'اصدار', 'تاريخ الإصدار', 'Version Date', 'Upload Date', 
-                'تاريخ إضافة', 'تاريخ الرفع', 'تاريخ إضافة الرخصة', 'تاريخ إضافةالرخصة',  # No space variant
-                'إضافة الرخصة', 'إضافةالرخصة',  # No space variant
-                'رفع الرخصة', 'رفعالرخصة',  # No space variant
-                'تاريخ اضافة', 'تاريخ اضافة الرخصة', 'تاريخ اضافةالرخصة',  # No space variant
-                'اضافة الرخصة', 'اضافةالرخصة',  # No space variant
-                # Date of Birth keywords
-                'تاريخ الميلاد', 'تاريخ ميلاد', 'Date of Birth', 'Birth Date', 'DOB',
-                'ميلاد', 'ولادة', 'تاريخ الولادة'
-            ]
+            exclude_keywords = _POSITION_EXCLUDE_KEYWORDS
         
         dates_with_pos = []
         
-        # Priority patterns for expiry dates
-        # Arabic patterns - MUST contain "تاريخ إنتهاء الرخصة"
-        arabic_patterns = [
-            r'تاريخ\s*إنتهاء\s*الرخصة\s*[/\s]*\s*Expiry\s*Date\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'تاريخ\s*إنتهاء\s*الرخصه\s*[/\s]*\s*Expiry\s*Date\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'تاريخ\s*إنتهاء\s*الرخصة\s*[:\s|]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'تاريخ\s*إنتهاء\s*الرخصه\s*[:\s|]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'تاريخ\s*انتهاء\s*الرخصة\s*[/\s]*\s*Expiry\s*Date\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'تاريخ\s*انتهاء\s*الرخصه\s*[/\s]*\s*Expiry\s*Date\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'تاريخ\s*انتهاء\s*الرخصة\s*[:\s|]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'تاريخ\s*انتهاء\s*الرخصه\s*[:\s|]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-        ]
-        
-        # English patterns - for translated OCR text
-        # CRITICAL: These patterns work with English-only text (after translation)
-        english_patterns = [
-            r'License\s*Expiry\s*Date\s*[:\s|]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'License\s*Expiry\s*Date\s*[:\s|]*(\d{4}[/-]\d{1,2}[/-]\d{1,2})',  # YYYY-MM-DD format
-            r'Expiry\s*Date\s*[:\s|]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Expiry\s*Date\s*[:\s|]*(\d{4}[/-]\d{1,2}[/-]\d{1,2})',  # YYYY-MM-DD format
-            # Pattern for table format with pipe separators
-            r'Expiry\s*Date\s*\|\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'License\s*Expiry\s*Date\s*\|\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-        ]
-        
-        # Combine all patterns
-        priority_patterns = arabic_patterns + english_patterns
-        
-        # Upload Date patterns - to identify and exclude
-        # Note: Handle both with space (تاريخ إضافة الرخصة) and without space (تاريخ إضافةالرخصة)
-        upload_patterns = [
-            r'تاريخ\s*إضافة\s*الرخصة',
-            r'تاريخ\s*إضافةالرخصة',  # No space between إضافة and الرخصة
-            r'تاريخ\s*إضافه\s*الرخصة',
-            r'تاريخ\s*إضافهالرخصة',  # No space variant
-            r'تاريخ\s*اضافة\s*الرخصة',
-            r'تاريخ\s*اضافةالرخصة',  # No space variant
-            r'تاريخ\s*الرفع',
-            r'Upload\s*Date',
-            r'إضافة\s*الرخصة',
-            r'إضافةالرخصة',  # No space variant
-            r'رفع\s*الرخصة',
-            r'رفعالرخصة'  # No space variant
-        ]
-        
         # Clean OCR text
-        ocr_text_clean = ocr_text
-        invisible_chars = ['\u200E', '\u200F', '\u200B', '\u200C', '\u200D', '\uFEFF', '\u2060']
-        for char in invisible_chars:
-            ocr_text_clean = ocr_text_clean.replace(char, '')
+        ocr_text_clean = ocr_text.translate(_OCR_CLEAN_TRANS)
         
         # Find all Upload Date positions first (to exclude dates near them)
-        upload_date_positions = []
-        for pattern in upload_patterns:
-            for match in re.finditer(pattern, ocr_text_clean, re.IGNORECASE | re.UNICODE):
-                upload_date_positions.append((match.start(), match.end()))
+        upload_date_positions = [m.span(1) for m in _UPLOAD_KEYWORD_POSITIONS_RE.finditer(ocr_text_clean)]
         
         # Find all Date of Birth positions (to exclude dates near them)
-        birth_date_patterns = [
-            r'تاريخ\s*الميلاد',
-            r'تاريخ\s*ميلاد',
-            r'تاريخ\s*الولادة',
-            r'Date\s*of\s*Birth',
-            r'Birth\s*Date',
-            r'DOB',
-            r'ميلاد',
-            r'ولادة'
-        ]
-        birth_date_positions = []
-        for pattern in birth_date_patterns:
-            for match in re.finditer(pattern, ocr_text_clean, re.IGNORECASE | re.UNICODE):
-                birth_date_positions.append((match.start(), match.end()))
+        birth_date_positions = [m.span(1) for m in _BIRTH_KEYWORD_POSITIONS_RE.finditer(ocr_text_clean)]
+        
+        # Report header keyword occurrences, located once per document and looked up per line by bisect
+        header_keyword_positions = [(kw, _find_all_occurrences(ocr_text_clean, kw)) for kw in _REPORT_HEADER_KEYWORDS]
         
         # Find all matches for expiry date patterns
         # CRITICAL: Extract ALL dates from each matched line, not just the first one
         matched_patterns = []
-        for pattern_idx, pattern in enumerate(priority_patterns):
-            matches_found = list(re.finditer(pattern, ocr_text_clean, re.IGNORECASE | re.UNICODE))
+        # Every pattern ends in a date - text without a single digit (pure-text page, failed OCR)
+        # can't match any of them, so skip the scans outright
+        if not _HAS_DIGIT_RE.search(ocr_text_clean):
+            scan_text, scan_res = ocr_text_clean, ()
+        else:
+            # Scan the lowercased text with the case-sensitive patterns when lowercasing keeps every
+            # position (it always does for Arabic/ASCII OCR text); match groups are digits either way
+            ocr_text_lower = ocr_text_clean.lower()
+            if len(ocr_text_lower) == len(ocr_text_clean):
+                scan_text, scan_res = ocr_text_lower, _POSITION_PRIORITY_LOWER_RES
+            else:
+                scan_text, scan_res = ocr_text_clean, _POSITION_PRIORITY_RES
+        for pattern_idx, priority_re in enumerate(scan_res):
+            matches_found = list(priority_re.finditer(scan_text))
             if matches_found:
-                matched_patterns.append((pattern_idx, pattern, len(matches_found)))
-                print(f"    🔍 Pattern {pattern_idx + 1} ({'Arabic' if pattern_idx < len(arabic_patterns) else 'English'}): matched {len(matches_found)} time(s)")
+                matched_patterns.append((pattern_idx, priority_re.pattern, len(matches_found)))
+                logger.debug("🔍 Pattern %d (%s): matched %d time(s)", pattern_idx + 1,
+                             'Arabic' if pattern_idx < len(_POSITION_ARABIC_PATTERNS) else 'English', len(matches_found))
             for match in matches_found:
                 date_found = match.group(1).strip()
                 if date_found:
@@ -1345,70 +2034,31 @@ Translation (one line per phrase, format: original|translation):"""
                         'License Expiry Date' in full_line
                     )
                     
-                    print(f"    🔍 Line contains expiry keyword: {line_contains_expiry_keyword}")
-                    print(f"    🔍 Full line: '{full_line[:200]}'")
+                    logger.debug("🔍 Line contains expiry keyword: %s", line_contains_expiry_keyword)
+                    logger.debug("🔍 Full line: '%.200s'", full_line)
                     
                     # Extract ALL dates from this line
-                    date_pattern = r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
-                    all_dates_in_line = re.findall(date_pattern, full_line)
+                    # _EXPIRY_DATE_RE only matches valid expiry years, so Dates of Birth never get here
+                    all_dates_in_line = _EXPIRY_DATE_RE.findall(full_line)
                     
-                    # Filter out Upload Dates (19/11/2025 is common) and Dates of Birth
+                    # Upload Date keyword position in the line (Arabic, then English) - same for every date in it.
+                    # 'تاريخ إضافةالرخصة' / 'License Upload Date' contain the shorter keywords, so two finds cover all four
+                    upload_date_pos_in_line = full_line.find('تاريخ إضافة')
+                    if upload_date_pos_in_line == -1:
+                        upload_date_pos_in_line = full_line.find('Upload Date')
+
+                    # Filter out Upload Dates (19/11/2025 is common)
                     valid_dates_in_line = []
                     for date_str in all_dates_in_line:
                         # Skip common Upload Date format
                         if date_str in ['19/11/2025', '19-11-2025', '2025-11-19']:
-                            print(f"    ⚠️ Skipping Upload Date: {date_str}")
-                            continue
-                        
-                        # CRITICAL: Check if date is likely a Date of Birth (old dates before 2000)
-                        # This must be done BEFORE checking expiry keyword, as birth dates should NEVER be used
-                        date_parts = date_str.replace('/', '-').split('-')
-                        is_birth_date = False
-                        year = None
-                        if len(date_parts) == 3:
-                            try:
-                                # Determine year position
-                                if len(date_parts[0]) == 4:  # YYYY-MM-DD
-                                    year = int(date_parts[0])
-                                elif len(date_parts[2]) == 4:  # DD-MM-YYYY
-                                    year = int(date_parts[2])
-                                elif len(date_parts[1]) == 4:  # DD-YYYY-MM (uncommon)
-                                    year = int(date_parts[1])
-                                else:
-                                    # Try 2-digit year
-                                    if len(date_parts[2]) == 2:  # DD-MM-YY
-                                        yy = int(date_parts[2])
-                                        year = 1900 + yy if yy > 50 else 2000 + yy
-                                    elif len(date_parts[0]) == 2:  # YY-MM-DD
-                                        yy = int(date_parts[0])
-                                        year = 1900 + yy if yy > 50 else 2000 + yy
-                                
-                                # License expiry dates are typically 2000-2030+ (or Hijri 1400+)
-                                # Dates before 2000 (Gregorian) are likely birth dates
-                                # EXCEPTION: Hijri dates can be 1400-1600 range, which is valid
-                                if year:
-                                    if year < 2000 and year >= 1400:
-                                        # Could be Hijri date - check if it's in valid Hijri range
-                                        # Hijri years 1400-1600 are valid for license expiry
-                                        # But years < 1400 are likely errors or birth dates
-                                        if year < 1400:
-                                            is_birth_date = True
-                                            print(f"    🚫 Skipping Date of Birth: {date_str} (year {year} < 1400 - invalid)")
-                                    elif year < 2000:
-                                        # Gregorian date before 2000 - definitely birth date
-                                        is_birth_date = True
-                                        print(f"    🚫 Skipping Date of Birth: {date_str} (year {year} < 2000)")
-                            except (ValueError, IndexError):
-                                pass
-                        
-                        if is_birth_date:
-                            print(f"    🚫 Date {date_str} EXCLUDED - identified as Date of Birth (year: {year})")
+                            logger.debug("⚠️ Skipping Upload Date: %s", date_str)
                             continue
-                        
-                        # If line contains expiry keyword, include dates (but we've already filtered birth dates)
+
+                        # If line contains expiry keyword, include dates (birth dates never matched)
                         if line_contains_expiry_keyword:
                             valid_dates_in_line.append(date_str)
-                            print(f"    ✅ Including date {date_str} (line contains expiry keyword)")
+                            logger.debug("✅ Including date %s (line contains expiry keyword)", date_str)
                         else:
                             # Line doesn't contain expiry keyword - check if it's a recent Gregorian date that might be Upload Date
                             date_parts = date_str.replace('/', '-').split('-')
@@ -1425,24 +2075,30 @@ Translation (one line per phrase, format: original|translation):"""
                                     if year and 2024 <= year <= 2026:
                                         # Check if it's in the Upload Date column area
                                         date_pos_in_line = full_line.find(date_str)
-                                        # Check for both with space and without space variants
-                                        # Check for Upload Date keywords (Arabic or English)
-                                        upload_date_pos_in_line = full_line.find('تاريخ إضافة')
-                                        if upload_date_pos_in_line == -1:
-                                            upload_date_pos_in_line = full_line.find('تاريخ إضافةالرخصة')  # No space variant
-                                        if upload_date_pos_in_line == -1:
-                                            upload_date_pos_in_line = full_line.find('Upload Date')  # English
-                                        if upload_date_pos_in_line == -1:
-                                            upload_date_pos_in_line = full_line.find('License Upload Date')  # English
                                         if upload_date_pos_in_line != -1 and abs(date_pos_in_line - upload_date_pos_in_line) < 50:
-                                            print(f"    ⚠️ Skipping Upload Date in line: {date_str}")
+                                            logger.debug("⚠️ Skipping Upload Date in line: %s", date_str)
                                             continue
                                 except (ValueError, IndexError):
                                     pass
                             
                             valid_dates_in_line.append(date_str)
                     
-                    print(f"    🔍 Line contains {len(all_dates_in_line)} date(s), {len(valid_dates_in_line)} valid: {valid_dates_in_line}")
+                    logger.debug("🔍 Line contains %d date(s), %d valid: %s", len(all_dates_in_line), len(valid_dates_in_line), valid_dates_in_line)
+                    
+                    # Get context around the match - shared by every date in the line
+                    context_start = max(0, match_start - 200)  # Larger context to check for Upload Date
+                    context_end = min(len(ocr_text_clean), match_end + 200)
+                    context = ocr_text_clean[context_start:context_end]
+                    
+                    # Check for exclude keywords in context (first one in exclude_keywords order, absolute position)
+                    exclude_keyword_pos = -1
+                    for kw in exclude_keywords:
+                        pos = context.find(kw)
+                        if pos != -1:
+                            exclude_keyword_pos = context_start + pos
+                            break
+                    has_exclude_keyword = exclude_keyword_pos != -1
+                    has_expiry_keyword = any(kw in context for kw in _EXPIRY_CONTEXT_KEYWORDS)
                     
                     # Process each valid date from the line
                     # CRITICAL: Track which dates we've already processed to avoid duplicates
@@ -1465,78 +2121,27 @@ Translation (one line per phrase, format: original|translation):"""
                         
                         # Skip if we've already processed a date at this exact position (duplicate)
                         if (date_start, date_end) in processed_date_positions:
-                            print(f"    ⚠️ Skipping duplicate date {date_to_process} at position {date_start}-{date_end}")
+                            logger.debug("⚠️ Skipping duplicate date %s at position %d-%d", date_to_process, date_start, date_end)
                             continue
                         processed_date_positions.append((date_start, date_end))
                         
-                        # Get context around the match
-                        context_start = max(0, match_start - 200)  # Larger context to check for Upload Date
-                        context_end = min(len(ocr_text_clean), match_end + 200)
-                        context = ocr_text_clean[context_start:context_end]
-                        
-                        # CRITICAL: Check if this date is a Date of Birth (old dates, typically before 2000)
-                        # License expiry dates are usually in the future or recent past (2000-2030+)
-                        # Dates of birth are typically old (before 2000, like 1980s, 1990s)
-                        # THIS CHECK MUST HAPPEN FIRST - even if in expiry line, birth dates should be excluded
-                        is_likely_birth_date = False
-                        date_parts = date_to_process.replace('/', '-').split('-')
-                        year = None
-                        if len(date_parts) == 3:
-                            try:
-                                # Determine year position
-                                if len(date_parts[0]) == 4:  # YYYY-MM-DD
-                                    year = int(date_parts[0])
-                                elif len(date_parts[2]) == 4:  # DD-MM-YYYY
-                                    year = int(date_parts[2])
-                                elif len(date_parts[1]) == 4:  # DD-YYYY-MM (uncommon but possible)
-                                    year = int(date_parts[1])
-                                else:
-                                    # Try to parse 2-digit year (assume 19xx or 20xx)
-                                    if len(date_parts[2]) == 2:  # DD-MM-YY
-                                        yy = int(date_parts[2])
-                                        year = 1900 + yy if yy > 50 else 2000 + yy
-                                    elif len(date_parts[0]) == 2:  # YY-MM-DD
-                                        yy = int(date_parts[0])
-                                        year = 1900 + yy if yy > 50 else 2000 + yy
-                                
-                                # CRITICAL: Exclude dates before 2010 (more strict)
-                                # License expiry dates are typically 2010-2030+ (or Hijri 1400+)
-                                # Dates before 2010 are likely birth dates or very old licenses
-                                if year:
-                                    # For Gregorian dates: exclude if < 2010
-                                    if 1900 <= year < 2010:
-                                        is_likely_birth_date = True
-                                        print(f"    🚫 Date {date_to_process} has year {year} (before 2010) - EXCLUDING as Date of Birth/Old License")
-                                        print(f"    🚫 This date will NOT be used as License Expiry Date")
-                                    # For Hijri dates: valid range is 1400-1600
-                                    elif 1400 <= year <= 1600:
-                                        # Valid Hijri date - keep it
-                                        pass
-                                    elif year < 1400:
-                                        # Invalid Hijri date - exclude
-                                        is_likely_birth_date = True
-                                        print(f"    🚫 Date {date_to_process} has year {year} (invalid Hijri < 1400) - EXCLUDING")
-                                    elif year > 2100:
-                                        # Invalid future date - likely OCR error
-                                        is_likely_birth_date = True
-                                        print(f"    🚫 Date {date_to_process} has year {year} (invalid > 2100) - EXCLUDING as OCR error")
-                            except (ValueError, IndexError):
-                                pass
+                        date_center = (date_start + date_end) // 2
                         
+                        # Dates with birth/old-license years (before 2010, or Hijri < 1400) were
+                        # already rejected by _EXPIRY_DATE_RE - only keyword proximity is left to check
                         # Check if date is near "Date of Birth" keywords
                         is_near_birth_keyword = False
                         for birth_start, birth_end in birth_date_positions:
-                            date_center = (date_start + date_end) // 2
                             birth_center = (birth_start + birth_end) // 2
                             distance = abs(date_center - birth_center)
                             if distance < 300:  # Within 300 characters
                                 is_near_birth_keyword = True
-                                print(f"    🚫 Date {date_to_process} is near Date of Birth keyword (distance: {distance}) - EXCLUDING")
+                                logger.debug("🚫 Date %s is near Date of Birth keyword (distance: %d) - EXCLUDING", date_to_process, distance)
                                 break
                         
                         # CRITICAL: If this is a birth date, EXCLUDE IT IMMEDIATELY - don't process further
-                        if is_likely_birth_date or is_near_birth_keyword:
-                            print(f"    🚫 SKIPPING Date {date_to_process} - identified as Date of Birth")
+                        if is_near_birth_keyword:
+                            logger.debug("🚫 SKIPPING Date %s - identified as Date of Birth", date_to_process)
                             continue  # Skip this date entirely
                         
                         # CRITICAL: Check if this date is near an Upload Date
@@ -1548,14 +2153,13 @@ Translation (one line per phrase, format: original|translation):"""
                         # BUT: We've already filtered out birth dates above
                         if line_contains_expiry_keyword:
                             # Date is in line with expiry keyword and is NOT a birth date - likely expiry date
-                            print(f"    ✅ Date {date_to_process} is in line containing 'تاريخ إنتهاء الرخصة' - KEEPING (table row, year: {year})")
+                            logger.debug("✅ Date %s is in line containing 'تاريخ إنتهاء الرخصة' - KEEPING (table row)", date_to_process)
                             is_near_upload_date = False  # Explicitly set to False - skip upload date exclusion checks
                         else:
                             # Line doesn't contain expiry keyword - check if it's near Upload Date
-                            print(f"    ⚠️ Date {date_to_process} is NOT in line with expiry keyword - checking Upload Date proximity...")
+                            logger.debug("⚠️ Date %s is NOT in line with expiry keyword - checking Upload Date proximity...", date_to_process)
                             for upload_start, upload_end in upload_date_positions:
                                 # Calculate distance between expiry date and upload date
-                                date_center = (date_start + date_end) // 2
                                 upload_center = (upload_start + upload_end) // 2
                                 distance = abs(date_center - upload_center)
                                 
@@ -1567,7 +2171,7 @@ Translation (one line per phrase, format: original|translation):"""
                                     expiry_keyword_pos = match_start  # Position of "تاريخ إنتهاء الرخصة"
                                     if abs(upload_center - date_center) < abs(expiry_keyword_pos - date_center):
                                         is_near_upload_date = True
-                                        print(f"    ⚠️ Date {date_to_process} is closer to Upload Date (distance: {distance}) than Expiry keyword - EXCLUDING")
+                                        logger.debug("⚠️ Date %s is closer to Upload Date (distance: %d) than Expiry keyword - EXCLUDING", date_to_process, distance)
                                         break
                             
                             # ADDITIONAL SAFEGUARD: Only check if line does NOT contain expiry keyword
@@ -1600,40 +2204,22 @@ Translation (one line per phrase, format: original|translation):"""
                                         # If Upload keyword is present and Expiry keyword is NOT, exclude
                                         if has_upload_keyword_nearby and not has_expiry_keyword_nearby:
                                             is_near_upload_date = True
-                                            print(f"    ⚠️ Date {date_to_process} appears to be Upload Date (recent Gregorian year {year} with Upload keyword) - EXCLUDING")
+                                            logger.debug("⚠️ Date %s appears to be Upload Date (recent Gregorian year %d with Upload keyword) - EXCLUDING", date_to_process, year)
                                 except (ValueError, IndexError):
                                     pass  # Ignore parsing errors
                         
-                        # Check for exclude keywords in context
-                        has_exclude_keyword = any(kw in context for kw in exclude_keywords)
-                        has_expiry_keyword = any(kw in context for kw in ['إنتهاء', 'انتهاء', 'Expiry', 'Expires'])
-                        
                         # CRITICAL FIX: Even if line contains expiry keyword, exclude dates that are specifically 
                         # near "Version Date", "Accident Time", "Case Number", "Final Report" etc. (report header dates)
                         # These should NEVER be treated as license expiry dates, regardless of expiry keyword presence
-                        report_header_keywords = [
-                            'Version Date', 'تاريخ الإصدار', 'تاريخ الاصدار', 'Version',
-                            'Accident Time', 'وقت الحادث', 'Accident Date', 'تاريخ الحادث',
-                            'Case Number', 'رقم الحالة', 'Case',
-                            'Final Report', 'التقرير', 'Report',
-                            'Liability Determination Report'
-                        ]
                         is_near_report_header = False
-                        date_center = (date_start + date_end) // 2
                         
-                        for header_kw in report_header_keywords:
-                            # Find all occurrences of header keyword in the context
-                            header_positions = []
-                            search_start = 0
-                            while True:
-                                pos = full_line.find(header_kw, search_start)
-                                if pos == -1:
-                                    break
-                                header_positions.append(line_start + pos)
-                                search_start = pos + len(header_kw)
+                        for header_kw, kw_positions in header_keyword_positions:
+                            # Occurrences of the header keyword lying fully inside the current line
+                            first = bisect_left(kw_positions, line_start)
+                            last = bisect_right(kw_positions, line_end - len(header_kw))
                             
                             # Check if date is near any header keyword (within 200 chars)
-                            for header_pos in header_positions:
+                            for header_pos in kw_positions[first:last]:
                                 header_center = header_pos + len(header_kw) // 2
                                 distance_to_header = abs(header_center - date_center)
                                 if distance_to_header < 200:
@@ -1641,7 +2227,8 @@ Translation (one line per phrase, format: original|translation):"""
                                     expiry_keyword_pos = match_start if line_contains_expiry_keyword else -1
                                     if expiry_keyword_pos == -1 or distance_to_header < abs(expiry_keyword_pos - date_center):
                                         is_near_report_header = True
-                                        print(f"    🚫 Date {date_to_process} is near report header keyword '{header_kw}' (distance: {distance_to_header}) - EXCLUDING as report/accident date")
+                                        logger.debug("🚫 Date %s is near report header keyword '%s' (distance: %d) - EXCLUDING as report/accident date",
+                                                     date_to_process, header_kw, distance_to_header)
                                         break
                             
                             if is_near_report_header:
@@ -1661,31 +2248,23 @@ Translation (one line per phrase, format: original|translation):"""
                             for existing_date, existing_pos, _ in dates_with_pos:
                                 if existing_date == date_to_process and abs(existing_pos - date_start) < 10:
                                     is_duplicate = True
-                                    print(f"    ⚠️ Skipping duplicate date {date_to_process} at position {date_start} (already found at {existing_pos})")
+                                    logger.debug("⚠️ Skipping duplicate date %s at position %d (already found at %d)", date_to_process, date_start, existing_pos)
                                     break
                             if not is_duplicate:
                                 dates_with_pos.append((date_to_process, date_start, date_end))
-                                print(f"    ✅ Extracted expiry date: {date_to_process} (from line containing expiry keyword, year: {year})")
+                                logger.debug("✅ Extracted expiry date: %s (from line containing expiry keyword)", date_to_process)
                             continue  # Skip further processing for this date if it was handled above
                         # Only include if:
                         # 1. Has expiry keyword (from the pattern match itself)
                         # 2. NOT near Upload Date
                         # 3. NOT a Date of Birth (old dates or near birth keywords)
                         # 4. NOT near other exclude keywords (unless expiry keyword is also present)
-                        elif has_expiry_keyword and not is_near_upload_date and not is_likely_birth_date and not is_near_birth_keyword:
+                        elif has_expiry_keyword and not is_near_upload_date and not is_near_birth_keyword:
                                 # Additional check: if exclude keyword is present, make sure expiry keyword is closer
                                 if has_exclude_keyword:
-                                    # Find positions of expiry and exclude keywords relative to date
+                                    # Expiry keyword (the match itself) vs first exclude keyword, relative to date
                                     expiry_keyword_pos = match_start
-                                    exclude_keyword_pos = -1
-                                    for kw in exclude_keywords:
-                                        pos = context.find(kw)
-                                        if pos != -1:
-                                            exclude_keyword_pos = context_start + pos
-                                            break
-                                    
                                     if exclude_keyword_pos != -1:
-                                        date_center = (date_start + date_end) // 2
                                         expiry_dist = abs(expiry_keyword_pos - date_center)
                                         exclude_dist = abs(exclude_keyword_pos - date_center)
                                         
@@ -1699,13 +2278,13 @@ Translation (one line per phrase, format: original|translation):"""
                                                 # Check if it's the same date value AND very close position (likely duplicate)
                                                 if existing_date == date_to_process and abs(existing_pos - date_start) < 10:
                                                     is_duplicate = True
-                                                    print(f"    ⚠️ Skipping duplicate date {date_to_process} at position {date_start} (already found at {existing_pos})")
+                                                    logger.debug("⚠️ Skipping duplicate date %s at position %d (already found at %d)", date_to_process, date_start, existing_pos)
                                                     break
                                             if not is_duplicate:
                                                 dates_with_pos.append((date_to_process, date_start, date_end))
-                                                print(f"    ✅ Extracted expiry date: {date_to_process} (expiry keyword closer than exclude keyword)")
+                                                logger.debug("✅ Extracted expiry date: %s (expiry keyword closer than exclude keyword)", date_to_process)
                                         else:
-                                            print(f"    ⚠️ Date {date_to_process} excluded: exclude keyword closer than expiry keyword")
+                                            logger.debug("⚠️ Date %s excluded: exclude keyword closer than expiry keyword", date_to_process)
                                     else:
                                         # No exclude keyword found in context - include
                                         # CRITICAL: Only deduplicate if it's the EXACT same date at similar position
@@ -1713,7 +2292,7 @@ Translation (one line per phrase, format: original|translation):"""
                                         for existing_date, existing_pos, _ in dates_with_pos:
                                             if existing_date == date_to_process and abs(existing_pos - date_start) < 10:
                                                 is_duplicate = True
-                                                print(f"    ⚠️ Skipping duplicate date {date_to_process} at position {date_start} (already found at {existing_pos})")
+                                                logger.debug("⚠️ Skipping duplicate date %s at position %d (already found at %d)", date_to_process, date_start, existing_pos)
                                                 break
                                         if not is_duplicate:
                                             dates_with_pos.append((date_to_process, date_start, date_end))
@@ -1724,7 +2303,7 @@ Translation (one line per phrase, format: original|translation):"""
                                     for existing_date, existing_pos, _ in dates_with_pos:
                                         if existing_date == date_to_process and abs(existing_pos - date_start) < 10:
                                             is_duplicate = True
-                                            print(f"    ⚠️ Skipping duplicate date {date_to_process} at position {date_start} (already found at {existing_pos})")
+                                            logger.debug("⚠️ Skipping duplicate date %s at position %d (already found at %d)", date_to_process, date_start, existing_pos)
                                             break
                                     if not is_duplicate:
                                         dates_with_pos.append((date_to_process, date_start, date_end))
@@ -1732,17 +2311,20 @@ Translation (one line per phrase, format: original|translation):"""
         # Sort by position
         dates_with_pos.sort(key=lambda x: x[1])
         print(f"    📅 Total expiry dates extracted: {len(dates_with_pos)}")
+        # Everything below re-scans the OCR text purely for diagnostics - skip it unless debug logging is on
+        if not logger.isEnabledFor(logging.DEBUG):
+            return dates_with_pos
         if matched_patterns:
-            print(f"    🔍 Matched patterns: {len(matched_patterns)} pattern(s) found matches")
+            logger.debug("🔍 Matched patterns: %d pattern(s) found matches", len(matched_patterns))
         else:
-            print(f"    ⚠️ No patterns matched - checking why...")
+            logger.debug("⚠️ No patterns matched - checking why...")
             # Check if expiry keywords exist in text
             expiry_keywords_check = [
                 'تاريخ إنتهاء', 'تاريخ انتهاء', 'Expiry Date', 'License Expiry', 'License Expiry Date'
             ]
             found_keywords = [kw for kw in expiry_keywords_check if kw in ocr_text_clean]
             if found_keywords:
-                print(f"    🔍 DEBUG: Found expiry keywords in text: {found_keywords}")
+                logger.debug("🔍 Found expiry keywords in text: %s", found_keywords)
                 # Show sample context around keywords
                 for kw in found_keywords[:2]:  # Show first 2
                     idx = ocr_text_clean.find(kw)
@@ -1750,33 +2332,33 @@ Translation (one line per phrase, format: original|translation):"""
                         context_start = max(0, idx - 100)
                         context_end = min(len(ocr_text_clean), idx + len(kw) + 200)
                         context = ocr_text_clean[context_start:context_end]
-                        print(f"    🔍 DEBUG: Context around '{kw}' (pos {idx}): '{context}'")
+                        logger.debug("🔍 Context around '%s' (pos %d): '%s'", kw, idx, context)
             else:
-                print(f"    ⚠️ DEBUG: NO expiry keywords found in text at all!")
+                logger.debug("⚠️ NO expiry keywords found in text at all!")
         if dates_with_pos:
-            for date, pos, _ in dates_with_pos:
+            for date_text, pos, _ in dates_with_pos:
                 # Show context around each date for debugging
                 context_start = max(0, pos - 150)
-                context_end = min(len(ocr_text), pos + len(date) + 150)
+                context_end = min(len(ocr_text), pos + len(date_text) + 150)
                 context = ocr_text[context_start:context_end]
-                print(f"       - {date} at position {pos}")
-                print(f"         Context: '{context}'")
+                logger.debug("   - %s at position %d", date_text, pos)
+                logger.debug("     Context: '%s'", context)
         else:
-            print(f"    ⚠️ DEBUG: No dates extracted - checking why...")
+            logger.debug("⚠️ No dates extracted - checking why...")
             # Check if expiry keywords exist
             expiry_keywords = ['تاريخ إنتهاء', 'تاريخ انتهاء', 'Expiry Date', 'License Expiry']
             found_keywords = [kw for kw in expiry_keywords if kw in ocr_text]
             if found_keywords:
-                print(f"    🔍 DEBUG: Found expiry keywords: {found_keywords}")
+                logger.debug("🔍 Found expiry keywords: %s", found_keywords)
             else:
-                print(f"    🔍 DEBUG: NO expiry keywords found in OCR text")
+                logger.debug("🔍 NO expiry keywords found in OCR text")
             # Check for any date patterns
             any_date_pattern = r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'
             any_dates = re.findall(any_date_pattern, ocr_text)
             if any_dates:
-                print(f"    🔍 DEBUG: Found {len(any_dates)} date-like patterns (may be excluded): {any_dates[:5]}...")
+                logger.debug("🔍 Found %d date-like patterns (may be excluded): %s...", len(any_dates), any_dates[:5])
             else:
-                print(f"    🔍 DEBUG: NO date patterns found in OCR at all")
+                logger.debug("🔍 NO date patterns found in OCR at all")
         return dates_with_pos
     
     def extract_license_type(self, ocr_text: str, party_id: str = None) -> str:
@@ -1843,7 +2425,7 @@ Translation (one line per phrase, format: original|translation):"""
         # If party_id provided, search near it (in same table row)
         if party_id:
             party_id_str = str(party_id).strip()
-            party_id_clean = re.sub(r'[^\d]', '', party_id_str)
+            party_id_clean = _NONDIGIT_RE.sub('', party_id_str)
             # Try both cleaned and original
             party_positions = []
             if party_id_clean:
@@ -2219,7 +2801,7 @@ Translation (one line per phrase, format: original|translation):"""
         # by looking for license type in the same "section" as the party (e.g., between party ID and expiry date)
         if party_id:
             party_id_str = str(party_id).strip()
-            party_id_clean = re.sub(r'[^\d]', '', party_id_str)
+            party_id_clean = _NONDIGIT_RE.sub('', party_id_str)
             party_positions = []
             if party_id_clean:
                 pos = ocr_text.find(party_id_clean)
@@ -2376,15 +2958,6 @@ Translation (one line per phrase, format: original|translation):"""
         Returns:
             Upload date string, or "not identify" if not found
         """
-        upload_date_patterns = [
-            r'تاريخ\s*إضافة\s*الرخصة[:\s/]*\s*Expiry\s*Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'تاريخ\s*إضافةالرخصة[:\s/]*\s*Expiry\s*Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Upload\s*Date[:\s/]*\s*تاريخ\s*إضافة[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Upload\s*Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'تاريخ\s*إضافة\s*الرخصة[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'تاريخ\s*إضافةالرخصة[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-        ]
-        
         # If party_id provided, search near it
         if party_id:
             party_id_str = str(party_id).strip()
@@ -2395,8 +2968,8 @@ Translation (one line per phrase, format: original|translation):"""
                 context_end = min(len(ocr_text), party_pos + len(party_id_str) + 500)
                 context = ocr_text[context_start:context_end]
                 
-                for pattern in upload_date_patterns:
-                    match = re.search(pattern, context, re.IGNORECASE | re.UNICODE)
+                for upload_date_re in _UPLOAD_DATE_RES:
+                    match = upload_date_re.search(context)
                     if match:
                         upload_date = match.group(1).strip()
                         # Normalize date format
@@ -2404,8 +2977,8 @@ Translation (one line per phrase, format: original|translation):"""
                         return upload_date
         
         # Search entire text
-        for pattern in upload_date_patterns:
-            match = re.search(pattern, ocr_text, re.IGNORECASE | re.UNICODE)
+        for upload_date_re in _UPLOAD_DATE_RES:
+            match = upload_date_re.search(ocr_text)
             if match:
                 upload_date = match.group(1).strip()
                 upload_date = self.normalize_date_format(upload_date)
@@ -2452,35 +3025,23 @@ Translation (one line per phrase, format: original|translation):"""
             return "not identify"
         
         # Find closest date (prefer unused dates, but allow reuse if necessary)
-        min_distance = float('inf')
-        closest_date = None
-        closest_date_info = None
+        # min() keeps the first of several equally close dates, like the original scan did
+        def distance_to_party(date_info):
+            _, date_start, date_end = date_info
+            return abs(target_party_pos - (date_start + date_end) // 2)
         
-        # First pass: Try to find closest unused date
-        for date, date_start, date_end in date_positions:
-            if date in used_dates:
-                continue  # Skip already used dates
-                
-            date_pos = (date_start + date_end) // 2
-            distance = abs(target_party_pos - date_pos)
-            
-            if distance < min_distance:
-                min_distance = distance
-                closest_date = date
-                closest_date_info = (date, date_start, date_end, distance)
+        candidates = [date_info for date_info in date_positions if date_info[0] not in used_dates]
         
         # If no unused date found, use closest date anyway (better than "not identify")
-        if closest_date is None:
+        if not candidates:
             print(f"    ⚠️ All dates already used, using closest date for Party ID {target_party_id}")
-            min_distance = float('inf')
-            for date, date_start, date_end in date_positions:
-                date_pos = (date_start + date_end) // 2
-                distance = abs(target_party_pos - date_pos)
-                
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_date = date
-                    closest_date_info = (date, date_start, date_end, distance)
+            candidates = date_positions
+        
+        closest_date = None
+        if candidates:
+            closest_date_info = min(candidates, key=distance_to_party)
+            closest_date = closest_date_info[0]
+            min_distance = distance_to_party(closest_date_info)
         
         if closest_date:
             status = "✅ UNIQUE" if closest_date not in used_dates else "⚠️ REUSED"
@@ -2612,25 +3173,25 @@ Translation (one line per phrase, format: original|translation):"""
                     # This ensures we only use dates that passed the birth date filter
                     print(f"    🔍 DEBUG ROW-BASED: Checking {len(date_positions)} pre-filtered dates against row {party_row_idx + 1}")
                     valid_dates_in_row = []
-                    for date, date_start_pos, date_end_pos in date_positions:
+                    for date_text, date_start_pos, date_end_pos in date_positions:
                         # Check if this date is within the row boundaries
                         date_center = (date_start_pos + date_end_pos) // 2
                         in_row = row_start <= date_center <= row_end
-                        is_used = date in used_dates
+                        is_used = date_text in used_dates
                         
-                        print(f"    🔍 DEBUG ROW-BASED: Date '{date}' at pos {date_start_pos}-{date_end_pos} (center: {date_center})")
+                        print(f"    🔍 DEBUG ROW-BASED: Date '{date_text}' at pos {date_start_pos}-{date_end_pos} (center: {date_center})")
                         print(f"       - Row boundaries: {row_start}-{row_end}")
                         print(f"       - In row: {in_row}")
                         print(f"       - Already used: {is_used}")
                         
                         if in_row:
                             if not is_used:
-                                valid_dates_in_row.append(date)
-                                print(f"    ✅ DEBUG ROW-BASED: ✓ Date {date} ADDED to valid dates (in row, not used)")
+                                valid_dates_in_row.append(date_text)
+                                print(f"    ✅ DEBUG ROW-BASED: ✓ Date {date_text} ADDED to valid dates (in row, not used)")
                             else:
-                                print(f"    ⚠️ DEBUG ROW-BASED: ✗ Date {date} SKIPPED (already used)")
+                                print(f"    ⚠️ DEBUG ROW-BASED: ✗ Date {date_text} SKIPPED (already used)")
                         else:
-                            print(f"    ⚠️ DEBUG ROW-BASED: ✗ Date {date} SKIPPED (not in row)")
+                            print(f"    ⚠️ DEBUG ROW-BASED: ✗ Date {date_text} SKIPPED (not in row)")
                     
                     print(f"    🔍 DEBUG ROW-BASED: Found {len(valid_dates_in_row)} valid pre-filtered date(s) in row: {valid_dates_in_row}")
                     valid_dates = valid_dates_in_row
@@ -2724,12 +3285,12 @@ Translation (one line per phrase, format: original|translation):"""
                         parties_in_this_row = []
                         for pid_check in party_ids:
                             pid_check_str = str(pid_check).strip()
-                            pid_check_clean = re.sub(r'[^\d]', '', pid_check_str)
+                            pid_check_clean = _NONDIGIT_RE.sub('', pid_check_str)
                             if pid_check_clean in row_text or pid_check_str in row_text:
                                 parties_in_this_row.append(pid_check_clean if pid_check_clean else pid_check_str)
                         
                         # Find this party's index in the row
-                        party_id_clean = re.sub(r'[^\d]', '', str(party_id).strip())
+                        party_id_clean = _NONDIGIT_RE.sub('', str(party_id).strip())
                         if not party_id_clean:
                             party_id_clean = str(party_id).strip()
                         
@@ -2750,9 +3311,9 @@ Translation (one line per phrase, format: original|translation):"""
                         else:
                             # Fallback: use first available unused date
                             matched_date = None
-                            for date in valid_dates:
-                                if date not in used_dates:
-                                    matched_date = date
+                            for date_text in valid_dates:
+                                if date_text not in used_dates:
+                                    matched_date = date_text
                                     print(f"    ✅ DEBUG ROW-BASED: Using first unused date: {matched_date}")
                                     break
                             if not matched_date and valid_dates:
@@ -2833,11 +3394,11 @@ Translation (one line per phrase, format: original|translation):"""
             party_ids_with_pos = []
             for party_id in parties_to_match:
                 party_id_str = str(party_id).strip()
-                party_id_clean = re.sub(r'[^\d]', '', party_id_str)
+                party_id_clean = _NONDIGIT_RE.sub('', party_id_str)
                 found = False
                 for pid, start_pos, end_pos in party_positions:
                     pid_str = str(pid).strip()
-                    pid_clean = re.sub(r'[^\d]', '', pid_str)
+                    pid_clean = _NONDIGIT_RE.sub('', pid_str)
                     # Try exact match first
                     if pid_clean == party_id_clean or pid_str == party_id_str:
                         party_ids_with_pos.append((party_id, (start_pos + end_pos) // 2, start_pos, end_pos))
@@ -2864,7 +3425,7 @@ Translation (one line per phrase, format: original|translation):"""
             print(f"    📊 Party order (by position): {[pid for pid, _, _, _ in party_ids_with_pos]}")
             
             # Dates are already sorted by position (from extract_all_expiry_dates_with_positions)
-            print(f"    📊 Date order (by position): {[date for date, _, _ in date_positions]}")
+            print(f"    📊 Date order (by position): {[date_text for date_text, _, _ in date_positions]}")
             
             # CRITICAL: ORDER-BASED MATCHING - assign dates in order, ensuring uniqueness
             date_idx = 0
@@ -2873,11 +3434,11 @@ Translation (one line per phrase, format: original|translation):"""
                 matched = False
                 # Start from date_idx and look for unused dates
                 while date_idx < len(date_positions):
-                    date, date_start, date_end = date_positions[date_idx]
-                    if date not in used_dates:
-                        matches[party_id] = date
-                        used_dates.add(date)
-                        print(f"    ✅ ORDER-BASED: Party ID {party_id} → Date {date_idx + 1} ({date})")
+                    date_text, date_start, date_end = date_positions[date_idx]
+                    if date_text not in used_dates:
+                        matches[party_id] = date_text
+                        used_dates.add(date_text)
+                        print(f"    ✅ ORDER-BASED: Party ID {party_id} → Date {date_idx + 1} ({date_text})")
                         date_idx += 1
                         matched = True
                         break
@@ -2906,6 +3467,330 @@ Translation (one line per phrase, format: original|translation):"""
         print(f"    ✅ Final matches: {matches}")
         return matches
     
+    @cached_property
+    def _fallback_processor(self):
+        """Shared ExcelOCRLicenseProcessor for the OCR fallback, imported and built on first use"""
+        from excel_ocr_license_processor import ExcelOCRLicenseProcessor
+        return ExcelOCRLicenseProcessor()
+    
+    def _ocr_cache_key(self, image_data: Any, pipeline: bytes = b'license') -> Optional[bytes]:
+        """
+        Content hash of the raw OCR input, used as the OCR text cache key.
+        Hashes the base64 string / bytes directly so a cache hit skips decoding entirely.
+        The digest is prefixed with the OCR pipeline name - pipelines that preprocess the image
+        differently read different text from the same input, so they must not share entries.
+        Returns None for inputs that should not be cached (file paths can change on disk).
+        """
+        try:
+            if isinstance(image_data, bytes):
+                raw = image_data
+            elif isinstance(image_data, str):
+                image_data_clean = image_data.strip()
+                if len(image_data_clean) <= 100 and os.path.exists(image_data_clean):
+                    return None
+                raw = image_data_clean.encode('utf-8')
+            elif isinstance(image_data, Image.Image):
+                raw = f"{image_data.mode}:{image_data.size}".encode('utf-8') + image_data.tobytes()
+            else:
+                return None
+            return pipeline + b':' + hashlib.blake2b(raw, digest_size=16).digest()
+        except Exception:
+            return None
+    
+    def _get_cached_ocr_text(self, cache_key: Optional[bytes]) -> Optional[str]:
+        """Return cached OCR text for cache_key (or None on miss)"""
+        if cache_key is None:
+            return None
+        with self._ocr_cache_lock:
+            ocr_text = self._ocr_cache.get(cache_key)
+            if ocr_text is not None:
+                self._ocr_cache.move_to_end(cache_key)
+            return ocr_text
+    
+    def _store_cached_ocr_text(self, cache_key: Optional[bytes], ocr_text: str):
+        """
+        Store OCR text for cache_key, evicting the oldest entry when the cache is full.
+        Text too short to extract from is not stored - an empty read is retried next time.
+        """
+        if cache_key is None or len(ocr_text.strip()) < OCR_MIN_TEXT_CHARS:
+            return
+        with self._ocr_cache_lock:
+            self._ocr_cache[cache_key] = ocr_text
+            self._ocr_cache.move_to_end(cache_key)
+            while len(self._ocr_cache) > OCR_CACHE_MAX_ENTRIES:
+                self._ocr_cache.popitem(last=False)
+    
+    def _tesseract_image_to_string(self, image: Image.Image, lang: str = 'ara+eng', psm: int = 6,
+                                   retry_psm: Optional[int] = None) -> str:
+        """
+        Run Tesseract OCR on a PIL image.
+        Uses the in-process tesserocr API when installed (engine stays resident, no temp files),
+        otherwise falls back to the pytesseract subprocess wrapper.
+        
+        Args:
+            image: PIL Image to OCR
+            lang: Tesseract language(s), e.g. 'ara+eng'
+            psm: Tesseract page segmentation mode (6 = uniform block, 4 = single column)
+            retry_psm: If set, re-run with this mode when the first read is shorter than OCR_MIN_TEXT_CHARS
+        """
+        if TESSEROCR_SUPPORT and lang not in self._tess_failed_langs:
+            with self._tess_api_lock:
+                slots = self._tess_api_slots.get(lang)
+                if slots is None:
+                    slots = self._tess_api_slots[lang] = threading.Semaphore(TESSEROCR_ENGINES_PER_LANG)
+            with slots:
+                with self._tess_api_lock:
+                    idle = self._tess_idle_apis.get(lang)
+                    api = idle.pop() if idle else None
+                if api is None:
+                    try:
+                        api = PyTessBaseAPI(lang=lang, oem=OEM.DEFAULT)
+                    except Exception as e:
+                        print(f"    ⚠️ tesserocr init failed for '{lang}' ({str(e)[:100]}) - using pytesseract")
+                        self._tess_failed_langs.add(lang)
+                if api is not None:
+                    try:
+                        api.SetPageSegMode(psm)
+                        api.SetImage(image)
+                        ocr_text = api.GetUTF8Text()
+                        if retry_psm is not None and len(ocr_text.strip()) < OCR_MIN_TEXT_CHARS:
+                            # The image is still loaded in the API - only segmentation + recognition rerun
+                            try:
+                                api.SetPageSegMode(retry_psm)
+                                api.Recognize()
+                                ocr_text = api.GetUTF8Text()
+                            except Exception:
+                                pass
+                        return ocr_text
+                    finally:
+                        with self._tess_api_lock:
+                            idle = self._tess_idle_apis.setdefault(lang, [])
+                            if len(idle) < TESSEROCR_ENGINES_PER_LANG:
+                                idle.append(api)
+                                api = None
+                        if api is not None:
+                            # Idle list already full - free this engine's model memory
+                            api.End()
+        ocr_text = pytesseract.image_to_string(image, lang=lang, config=_TESSERACT_CONFIGS.get(psm) or f'--psm {psm} --oem 3')
+        if retry_psm is not None and len(ocr_text.strip()) < OCR_MIN_TEXT_CHARS:
+            try:
+                ocr_text = pytesseract.image_to_string(image, lang=lang, config=_TESSERACT_CONFIGS.get(retry_psm) or f'--psm {retry_psm} --oem 3')
+            except Exception:
+                pass
+        return ocr_text
+    
+    def _preprocess_image_for_ocr(self, image: Image.Image) -> Image.Image:
+        """
+        Prepare an image for Tesseract: grayscale, downscale very large scans and
+        binarize with an adaptive threshold (when OpenCV is available).
+        A clean binary image is faster to recognize and needs the PSM 4 retry less often.
+        """
+        gray = image.convert('L') if image.mode != 'L' else image.copy()
+        if gray.size[0] > OCR_MAX_IMAGE_SIDE:
+            gray.thumbnail((OCR_MAX_IMAGE_SIDE, OCR_MAX_IMAGE_SIDE), Image.LANCZOS)
+        if CV2_SUPPORT:
+            binary = cv2.adaptiveThreshold(np.asarray(gray), 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                                           cv2.THRESH_BINARY, 31, 10)
+            return Image.fromarray(binary)
+        return gray
+    
+    def _extract_pdf_text_layer(self, pdf_bytes: bytes) -> Optional[str]:
+        """
+        Read the embedded text of the first PDF page, if it is usable in place of OCR.
+        
+        Returns:
+            Page text when it has at least 20 characters and an expiry keyword, else None
+            (scanned PDFs, or Arabic text stored in presentation forms, go through OCR)
+        """
+        if not PDFIUM_SUPPORT:
+            return None
+        pdf = None
+        try:
+            pdf = pdfium.PdfDocument(pdf_bytes)
+            if len(pdf) == 0:
+                return None
+            page = pdf[0]
+            textpage = page.get_textpage()
+            text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+        except Exception as e:
+            print(f"    ⚠️ Could not read PDF text layer: {e}")
+            return None
+        finally:
+            if pdf is not None:
+                pdf.close()
+        if len(text.strip()) < 20 or not any(kw in text for kw in _EXPIRY_CONTEXT_KEYWORDS):
+            return None
+        return text
+    
+    @cached_property
+    def _turbo_jpeg(self):
+        """Shared TurboJPEG decoder, or None when the libjpeg-turbo library cannot be loaded"""
+        try:
+            return TurboJPEG()
+        except Exception as e:
+            print(f"    ⚠️ TurboJPEG init failed ({str(e)[:100]}) - decoding JPEG with Pillow")
+            return None
+    
+    def _decode_image_bytes(self, img_bytes: bytes) -> Image.Image:
+        """Decode image bytes to an RGB PIL Image, using libjpeg-turbo for JPEG when available"""
+        if TURBOJPEG_SUPPORT and img_bytes[:3] == b'\xff\xd8\xff' and self._turbo_jpeg is not None:
+            try:
+                return Image.fromarray(self._turbo_jpeg.decode(img_bytes, pixel_format=TJPF_RGB))
+            except Exception:
+                pass  # Let Pillow handle JPEGs libjpeg-turbo rejects
+        image = Image.open(BytesIO(img_bytes))
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        return image
+    
+    def _load_image_for_ocr(self, image_data: Any) -> Optional[Image.Image]:
+        """
+        Convert OCR input to an RGB PIL Image.
+        
+        Args:
+            image_data: Can be base64 string, image path, PDF bytes, or PIL Image
+            
+        Returns:
+            PIL Image, or None if the input could not be decoded
+        """
+        # Step 1: Convert base64 to image
+        if isinstance(image_data, str):
+            # Check if it's base64
+            is_base64 = False
+            image_data_clean = image_data.strip()
+            
+            # Check for base64 indicators
+            if (len(image_data_clean) > 100 or 
+                image_data_clean.startswith('data:image') or 
+                image_data_clean.startswith('iVBORw0KGgo') or
+                image_data_clean.startswith('/9j/') or
+                image_data_clean.startswith('R0lGODlh') or
+                image_data_clean.startswith('UklGR')):
+                is_base64 = True
+            
+            if is_base64:
+                try:
+                    # Remove data URL prefix if present
+                    if ',' in image_data_clean:
+                        image_data_clean = image_data_clean.split(',')[1]
+                    
+                    # Decode base64 string to bytes
+                    img_bytes = base64.b64decode(image_data_clean)
+                    
+                    # Convert bytes to RGB PIL Image
+                    image = self._decode_image_bytes(img_bytes)
+                except Exception as e:
+                    # Try as file path
+                    if os.path.exists(image_data):
+                        image = Image.open(image_data)
+                        if image.mode != 'RGB':
+                            image = image.convert('RGB')
+                    else:
+                        return None
+            else:
+                # Try as file path
+                if os.path.exists(image_data):
+                    image = Image.open(image_data)
+                    if image.mode != 'RGB':
+                        image = image.convert('RGB')
+                else:
+                    return None
+        elif isinstance(image_data, bytes):
+            # Check if it's PDF
+            if image_data.startswith(b'%PDF'):
+                if not PDF_SUPPORT:
+                    return None
+                try:
+                    # Only the first page is OCR'd - don't let poppler render the rest
+                    pdf_options = dict(dpi=PDF_OCR_DPI, first_page=1, last_page=1, fmt='jpeg', thread_count=1)
+                    if POPPLER_PATH and os.path.exists(POPPLER_PATH):
+                        images = convert_from_bytes(image_data, poppler_path=POPPLER_PATH, **pdf_options)
+                    else:
+                        images = convert_from_bytes(image_data, **pdf_options)
+                    if not images:
+                        return None
+                    image = images[0]  # Use first page
+                    if image.mode != 'RGB':
+                        image = image.convert('RGB')
+                except Exception as e:
+                    return None
+            else:
+                # Try as image bytes
+                image = self._decode_image_bytes(image_data)
+        elif isinstance(image_data, Image.Image):
+            image = image_data
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+        else:
+            return None
+        
+        return image
+    
+    def _base64_file_names(self, base64_files_path: str, refresh: bool = False) -> Dict[str, str]:
+        """
+        {case file stem: path} for the .txt files in base64_files_path (stems normcase'd).
+        The directory is listed again only when its mtime changes (a file was added or removed)
+        or when refresh is set.
+        """
+        try:
+            dir_mtime = os.stat(base64_files_path).st_mtime_ns
+        except OSError:
+            return {}
+        cached = self._base64_file_index.get(base64_files_path)
+        if not refresh and cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+        try:
+            file_names = {os.path.normcase(f[:-4]): os.path.join(base64_files_path, f)
+                          for f in os.listdir(base64_files_path) if os.path.normcase(f).endswith('.txt')}
+        except OSError:
+            return {}
+        self._base64_file_index[base64_files_path] = (dir_mtime, file_names)
+        return file_names
+    
+    def _find_base64_file(self, base64_files_path: str, case_clean: str) -> Optional[str]:
+        """
+        Path of a case's base64 file: {case}.txt, else the case number without a 2-letter prefix,
+        its last 10 characters, or without '-', '_' or ' ' separators. None when there is none.
+        """
+        candidates = [case_clean]
+        if len(case_clean) > 2 and case_clean[:2].isalpha():
+            candidates.append(case_clean[2:])
+        if len(case_clean) > 10:
+            candidates.append(case_clean[-10:])
+        candidates.extend((case_clean.replace('-', ''), case_clean.replace('_', ''), case_clean.replace(' ', '')))
+        # On a miss, list the directory once more - the mtime can miss a file written within
+        # its timestamp granularity, or one replaced in place
+        for refresh in (False, True):
+            file_names = self._base64_file_names(base64_files_path, refresh=refresh)
+            for candidate in candidates:
+                path = file_names.get(os.path.normcase(candidate))
+                if path is not None:
+                    return path
+        return None
+    
+    def _ocr_base64_page(self, base64_img: bytes) -> str:
+        """OCR one page (ASCII bytes) of a case's base64 file (pre-extraction) - raises if it cannot be decoded"""
+        # Content-hash cache keyed separately from extract_license_expiry_from_image (this page is
+        # not preprocessed, so its text differs) - reprocessed cases skip OCR
+        ocr_cache_key = self._ocr_cache_key(base64_img, pipeline=b'page')
+        ocr_text = self._get_cached_ocr_text(ocr_cache_key)
+        if ocr_text is not None:
+            return ocr_text
+        
+        # Drop a data-URL prefix without splitting the whole string (rfind is -1 when there is none)
+        img_bytes = base64.b64decode(base64_img[base64_img.rfind(b',') + 1:])
+        image = Image.open(BytesIO(img_bytes))
+        # Tesseract reads RGB and grayscale as-is - other modes go to grayscale (1 byte/pixel), not RGB
+        if image.mode not in ('RGB', 'L'):
+            image = image.convert('L')
+        
+        # Perform OCR - PSM 6 first, one PSM 4 retry only if it read (almost) nothing
+        ocr_text = self._tesseract_image_to_string(image, lang='ara+eng', psm=6, retry_psm=4)
+        self._store_cached_ocr_text(ocr_cache_key, ocr_text)
+        return ocr_text
+    
     def extract_license_expiry_from_image(self, image_data: Any, target_party_id: str = None) -> str:
         """
         Extract license expiry date from image or PDF using OCR
@@ -2928,169 +3813,73 @@ Translation (one line per phrase, format: original|translation):"""
             Expiry date string or "not identify" if not found
         """
         try:
-            image = None
-            
-            # Step 1: Convert base64 to image
-            if isinstance(image_data, str):
-                # Check if it's base64
-                is_base64 = False
-                image_data_clean = image_data.strip()
+            # Step 1-2: Convert base64 to image and run OCR (skipped on cache hit)
+            ocr_cache_key = self._ocr_cache_key(image_data)
+            ocr_text = self._get_cached_ocr_text(ocr_cache_key)
+            if ocr_text is None and isinstance(image_data, bytes) and image_data.startswith(b'%PDF'):
+                # Born-digital PDF: use its text layer directly instead of rasterizing + OCR
+                ocr_text = self._extract_pdf_text_layer(image_data)
+                if ocr_text is not None:
+                    self._store_cached_ocr_text(ocr_cache_key, ocr_text)
+            if ocr_text is None:
+                image = self._load_image_for_ocr(image_data)
+                if image is None:
+                    return "not identify"
+                image = self._preprocess_image_for_ocr(image)
                 
-                # Check for base64 indicators
-                if (len(image_data_clean) > 100 or 
-                    image_data_clean.startswith('data:image') or 
-                    image_data_clean.startswith('iVBORw0KGgo') or
-                    image_data_clean.startswith('/9j/') or
-                    image_data_clean.startswith('R0lGODlh') or
-                    image_data_clean.startswith('UklGR')):
-                    is_base64 = True
+                # Perform OCR with Arabic and English support - OPTIMIZED FOR SPEED
+                # Use best PSM mode first (PSM 6 for tables) - only try others if needed
+                # PSM 6 = uniform block of text (best for tables, fastest)
+                ocr_text = ""
+                ocr_failed = False
                 
-                if is_base64:
-                    try:
-                        # Remove data URL prefix if present
-                        if ',' in image_data_clean:
-                            image_data_clean = image_data_clean.split(',')[1]
-                        
-                        # Decode base64 string to bytes
-                        img_bytes = base64.b64decode(image_data_clean)
-                        
-                        # Convert bytes to PIL Image
-                        image = Image.open(BytesIO(img_bytes))
-                        
-                        # Convert to RGB if necessary
-                        if image.mode != 'RGB':
-                            image = image.convert('RGB')
-                    except Exception as e:
-                        # Try as file path
-                        if os.path.exists(image_data):
-                            image = Image.open(image_data)
-                            if image.mode != 'RGB':
-                                image = image.convert('RGB')
-                        else:
-                            return "not identify"
-                else:
-                    # Try as file path
-                    if os.path.exists(image_data):
-                        image = Image.open(image_data)
-                        if image.mode != 'RGB':
-                            image = image.convert('RGB')
-                    else:
-                        return "not identify"
-            elif isinstance(image_data, bytes):
-                # Check if it's PDF
-                if image_data.startswith(b'%PDF'):
-                    if not PDF_SUPPORT:
-                        return "not identify"
-                    try:
-                        if POPPLER_PATH and os.path.exists(POPPLER_PATH):
-                            images = convert_from_bytes(image_data, poppler_path=POPPLER_PATH)
-                        else:
-                            images = convert_from_bytes(image_data)
-                        if not images:
-                            return "not identify"
-                        image = images[0]  # Use first page
-                        if image.mode != 'RGB':
-                            image = image.convert('RGB')
-                    except Exception as e:
-                        return "not identify"
-                else:
-                    # Try as image bytes
-                    image = Image.open(BytesIO(image_data))
-                    if image.mode != 'RGB':
-                        image = image.convert('RGB')
-            elif isinstance(image_data, Image.Image):
-                image = image_data
-                if image.mode != 'RGB':
-                    image = image.convert('RGB')
-            else:
-                return "not identify"
-            
-            if image is None:
-                return "not identify"
-            
-            # Perform OCR with Arabic and English support - OPTIMIZED FOR SPEED
-            # Use best PSM mode first (PSM 6 for tables) - only try others if needed
-            # PSM 6 = uniform block of text (best for tables, fastest)
-            ocr_text = ""
-            
-            # OPTIMIZATION: Try best mode first, only fallback if needed
-            try:
-                config = '--psm 6 --oem 3'  # Best for tables, fastest
-                ocr_text = pytesseract.image_to_string(image, lang='ara+eng', config=config)
-                if len(ocr_text.strip()) < 20:
-                    # Quick fallback to PSM 4 if PSM 6 didn't work well
+                # OPTIMIZATION: Try best mode first, only fallback if needed
+                try:
+                    # PSM 6 - best for tables, fastest; PSM 4 retry only if PSM 6 read (almost) nothing -
+                    # the same threshold as the "too short" check below, so no retry is wasted on usable text
+                    ocr_text = self._tesseract_image_to_string(image, lang='ara+eng', psm=6, retry_psm=4)
+                except Exception as e:
+                    # Only try Arabic if ara+eng fails - a fallback read is never cached
+                    ocr_failed = True
                     try:
-                        config = '--psm 4 --oem 3'
-                        ocr_text = pytesseract.image_to_string(image, lang='ara+eng', config=config)
+                        ocr_text = self._tesseract_image_to_string(image, lang='ara', psm=6)
                     except:
                         pass
-            except Exception as e:
-                # Only try Arabic if ara+eng fails
-                try:
-                    config = '--psm 6 --oem 3'
-                    ocr_text = pytesseract.image_to_string(image, lang='ara', config=config)
-                except:
-                    pass
+                
+                if not ocr_failed:
+                    self._store_cached_ocr_text(ocr_cache_key, ocr_text)
             
-            if len(ocr_text.strip()) < 10:
+            if len(ocr_text.strip()) < OCR_MIN_TEXT_CHARS:
                 print(f"    ⚠️ OCR text too short ({len(ocr_text)} chars) - cannot extract date")
                 return "not identify"
             
-            # DEBUG: Print OCR text sample for investigation (if extraction fails)
-            # Store OCR text for later debug output if needed
-            ocr_text_sample = ocr_text[:500] if len(ocr_text) > 500 else ocr_text
-            
-            # Step 3: OPTIMIZED Party ID matching - fast early exit
-            if target_party_id:
-                target_id_str = str(target_party_id).strip()
-                target_id_clean = re.sub(r'[^\d]', '', target_id_str)
-                
-                # OPTIMIZATION: Quick check if Party ID exists in OCR text (fast string search)
-                if target_id_clean in ocr_text or target_id_clean[-8:] in ocr_text or target_id_clean[-9:] in ocr_text:
-                    # Party ID likely exists, continue with extraction
-                    pass
-                else:
-                    # OPTIMIZATION: If Party ID not found, still try extraction (might be in different format)
-                    pass
+            # Step 3: Party ID matching happens below (proximity matching + fallback) - extraction
+            # runs whether or not the target Party ID appears verbatim in the OCR text
             
             # Step 4: Extract expiry date from OCR text
             # Clean OCR text: remove invisible Unicode characters that break regex matching
             # Remove left-to-right mark (LRM: \u200E), right-to-left mark (RLM: \u200F), and other formatting marks
-            ocr_text_clean = ocr_text
-            # Remove invisible Unicode formatting characters
-            invisible_chars = [
-                '\u200E',  # Left-to-right mark
-                '\u200F',  # Right-to-left mark
-                '\u200B',  # Zero-width space
-                '\u200C',  # Zero-width non-joiner
-                '\u200D',  # Zero-width joiner
-                '\uFEFF',  # Zero-width no-break space (BOM)
-                '\u2060',  # Word joiner
-            ]
-            for char in invisible_chars:
-                ocr_text_clean = ocr_text_clean.replace(char, '')
+            # Single C-level pass with a deletion table instead of one str.replace per character
+            ocr_text_clean = ocr_text.translate(_OCR_CLEAN_TRANS)
             
             # Normalize whitespace
             ocr_text_normalized = ' '.join(ocr_text_clean.split())
             
-            # Keywords to EXCLUDE (إصدار الرخصة - Issue Date, Upload Date, Version Date)
-            # IMPORTANT: Exclude Upload Date (تاريخ إضافة الرخصة) which is often 19/11/2025
-            # IMPORTANT: Exclude Version Date (تاريخ الإصدار / Version Date) which is 19/11/2025
-            exclude_keywords = [
-                # Issue/Version Date keywords
-                'إصدار', 'اصدار', 'تاريخ الإصدار', 'تاريخ الاصدار', 
-                'Issue Date', 'Issue', 'Date of Issue', 'Issued',
-                'تاريخ الصدور', 'صدر', 'صدرت',
-                'Version Date', 'Version',
-                # Upload Date keywords - CRITICAL: These must be excluded
-                'Upload Date', 'تاريخ إضافة', 'تاريخ الرفع', 'تاريخ إضافة الرخصة', 'تاريخ إضافةالرخصة',  # No space variant
-                'تاريخ الرفع الرخصة', 'إضافة الرخصة', 'إضافةالرخصة',  # No space variant
-                'رفع الرخصة', 'رفعالرخصة',  # No space variant
-                'تاريخ اضافة', 'تاريخ اضافة الرخصة', 'تاريخ اضافةالرخصة',  # No space variant
-                'اضافة الرخصة', 'اضافةالرخصة',  # No space variant
-                # Common OCR variations
-                'تاريخ إضافه', 'تاريخ اضافه', 'إضافه', 'اضافه', 'تاريخ إضافهالرخصة', 'إضافهالرخصة'
-            ]
+            # Keywords to EXCLUDE (Issue Date, Upload Date, Version Date) - see _EXCLUDE_KEYWORDS
+            # One pass over the OCR text for all header / exclude / expiry keyword positions
+            keyword_positions = _scan_keyword_positions(ocr_text_normalized)
+            
+            def keywords_in_window(family, window_start, window_end):
+                """Keyword matches of family lying fully inside ocr_text_normalized[window_start:window_end]"""
+                matches = keyword_positions[family]
+                # Matches are sorted by start - binary search to the window instead of scanning every match
+                idx = bisect_left(matches, (window_start,))
+                in_window = []
+                while idx < len(matches) and matches[idx][0] < window_end:
+                    if matches[idx][1] <= window_end:
+                        in_window.append(matches[idx])
+                    idx += 1
+                return in_window
             
             # Helper function to check if date is near exclude keywords
             def is_near_exclude_keyword(text, date_pos, date_length):
@@ -3098,148 +3887,74 @@ Translation (one line per phrase, format: original|translation):"""
                 # Use larger context window to catch dates near exclude keywords
                 context_start = max(0, date_pos - 150)  # Increased to catch more context
                 context_end = min(len(text), date_pos + date_length + 150)  # Increased to catch more context
-                context = text[context_start:context_end]
-                context_lower = context.lower()
+                date_center = date_pos + date_length // 2
                 
                 # CRITICAL: Check for report header keywords FIRST (highest priority exclusion)
                 # These should ALWAYS exclude dates, even if expiry keywords are present
-                report_header_keywords = [
-                    'Version Date', 'تاريخ الإصدار', 'تاريخ الاصدار', 'Version',
-                    'Accident Time', 'وقت الحادث', 'Accident Date', 'تاريخ الحادث',
-                    'Case Number', 'رقم الحالة', 'Case',
-                    'Final Report', 'التقرير', 'Report',
-                    'Liability Determination Report'
-                ]
-                for header_kw in report_header_keywords:
-                    if header_kw in context or header_kw.lower() in context_lower:
-                        # Find position of header keyword relative to date
-                        header_pos_in_context = context.find(header_kw)
-                        if header_pos_in_context == -1:
-                            header_pos_in_context = context_lower.find(header_kw.lower())
-                        if header_pos_in_context != -1:
-                            header_pos_abs = context_start + header_pos_in_context
-                            date_center = date_pos + date_length // 2
-                            header_center = header_pos_abs + len(header_kw) // 2
-                            distance = abs(header_center - date_center)
-                            # If date is within 200 chars of header keyword, exclude it
-                            if distance < 200:
-                                print(f"    🚫 Date is near report header keyword '{header_kw}' (distance: {distance}) - EXCLUDING")
-                                return True
+                header_matches = keywords_in_window('header', context_start, context_end)
+                if header_matches:
+                    # Position of header keyword relative to date
+                    header_pos_abs, _, header_kw = header_matches[0]
+                    header_center = header_pos_abs + len(header_kw) // 2
+                    distance = abs(header_center - date_center)
+                    # If date is within 200 chars of header keyword, exclude it
+                    if distance < 200:
+                        logger.debug("🚫 Date is near report header keyword '%s' (distance: %d) - EXCLUDING", header_kw, distance)
+                        return True
                 
                 # Check for exclude keywords in context
-                for exclude_kw in exclude_keywords:
-                    # Check both lowercase and original case (for Arabic)
-                    if exclude_kw.lower() in context_lower or exclude_kw in context:
-                        # Additional check: make sure it's not also near expiry keywords (which take priority)
-                        expiry_kw_in_context = any(kw in context for kw in ['إنتهاء', 'انتهاء', 'Expiry', 'Expires'])
-                        if not expiry_kw_in_context:
-                            print(f"    ⚠️ Date is near exclude keyword '{exclude_kw}' - will skip this date")
+                expiry_matches = keywords_in_window('expiry', context_start, context_end)
+                exclude_matches = keywords_in_window('exclude', context_start, context_end)
+                if exclude_matches:
+                    exclude_pos_abs, _, exclude_kw = exclude_matches[0]
+                    # Additional check: make sure it's not also near expiry keywords (which take priority)
+                    if not expiry_matches:
+                        logger.debug("⚠️ Date is near exclude keyword '%s' - will skip this date", exclude_kw)
+                        return True
+                    else:
+                        # If expiry keyword is also present, check distances to determine priority
+                        exclude_dist = abs(exclude_pos_abs - date_center)
+                        expiry_dist = abs(expiry_matches[0][0] - date_center)
+                        # If exclude keyword is closer, exclude the date
+                        if exclude_dist < expiry_dist:
+                            logger.debug("⚠️ Date is closer to exclude keyword '%s' than expiry keyword - EXCLUDING", exclude_kw)
                             return True
-                        else:
-                            # If expiry keyword is also present, check distances to determine priority
-                            # Find positions to compare distances
-                            exclude_pos_in_context = context.find(exclude_kw)
-                            if exclude_pos_in_context == -1:
-                                exclude_pos_in_context = context_lower.find(exclude_kw.lower())
-                            expiry_pos_in_context = context.find('إنتهاء')
-                            if expiry_pos_in_context == -1:
-                                expiry_pos_in_context = context.find('انتهاء')
-                            if expiry_pos_in_context == -1:
-                                expiry_pos_in_context = context_lower.find('expiry')
-                            
-                            if exclude_pos_in_context != -1 and expiry_pos_in_context != -1:
-                                date_center_rel = (date_pos - context_start) + date_length // 2
-                                exclude_dist = abs(exclude_pos_in_context - date_center_rel)
-                                expiry_dist = abs(expiry_pos_in_context - date_center_rel)
-                                # If exclude keyword is closer, exclude the date
-                                if exclude_dist < expiry_dist:
-                                    print(f"    ⚠️ Date is closer to exclude keyword '{exclude_kw}' than expiry keyword - EXCLUDING")
-                                    return True
-                            
-                            # If expiry keyword is closer or no expiry keyword found, keep it
-                            print(f"    ✓ Date is near exclude keyword '{exclude_kw}' BUT expiry keyword takes priority - KEEPING")
-                            return False
+                        
+                        # If expiry keyword is closer, keep it
+                        logger.debug("✓ Date is near exclude keyword '%s' BUT expiry keyword takes priority - KEEPING", exclude_kw)
+                        return False
                 
                 # Also check if date appears to be an Upload Date by looking for "إضافة" or "رفع" patterns
                 # These should be excluded even if expiry keywords are not nearby
-                upload_patterns = [
-                    r'تاريخ\s*إضافة\s*الرخصة',
-                    r'تاريخ\s*إضافه\s*الرخصة',
-                    r'تاريخ\s*اضافة\s*الرخصة',
-                    r'تاريخ\s*الرفع',
-                    r'Upload\s*Date',
-                    r'إضافة\s*الرخصة',
-                    r'رفع\s*الرخصة'
-                ]
-                for pattern in upload_patterns:
-                    if re.search(pattern, context, re.IGNORECASE | re.UNICODE):
-                        # Check if expiry keyword is NOT nearby (if expiry is nearby, it takes priority)
-                        expiry_nearby = any(kw in context for kw in ['إنتهاء', 'انتهاء', 'Expiry', 'Expires'])
-                        if not expiry_nearby:
-                            print(f"    ⚠️ Date matches Upload Date pattern '{pattern}' and no expiry keyword nearby - will skip")
+                # (if expiry is nearby, it takes priority)
+                if not expiry_matches:
+                    context = text[context_start:context_end]
+                    for upload_re in _UPLOAD_RES:
+                        if upload_re.search(context):
+                            logger.debug("⚠️ Date matches Upload Date pattern '%s' and no expiry keyword nearby - will skip", upload_re.pattern)
                             return True
                 
-                return False
-            
-            # Priority patterns - ONLY "تاريخ إنتهاء الرخصة" (License Expiry Date)
-            # CRITICAL: These patterns MUST contain the full phrase "تاريخ إنتهاء الرخصة"
-            # We do NOT extract dates from "تاريخ إضافة الرخصة" (Upload Date) or any other field
-            # Note: "إنتهاء" (with kasra and hamza) vs "انتهاء" (with fatha) - both are valid
-            # Patterns handle invisible Unicode characters and flexible spacing
-            # IMPORTANT: OCR may show "Expiry Date" or "License Expiry" - both are handled
-            priority_patterns = [
-                # HIGHEST PRIORITY: Full phrase "تاريخ إنتهاء الرخصة" with "Expiry Date" (most common in OCR)
-                r'تاريخ\s*إنتهاء\s*الرخصة\s*[/\s]*\s*Expiry\s*Date\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ\s*إنتهاء\s*الرخصه\s*[/\s]*\s*Expiry\s*Date\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ\s*إنتهاء\s*الرخصة\s*[/\s]*\s*Expiry\s*Date\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ\s*إنتهاء\s*الرخصه\s*[/\s]*\s*Expiry\s*Date\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                # Full phrase with "License Expiry"
-                r'تاريخ\s*إنتهاء\s*الرخصة\s*[/\s]*\s*License\s*Expiry\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ\s*إنتهاء\s*الرخصه\s*[/\s]*\s*License\s*Expiry\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                # Full phrase "تاريخ إنتهاء الرخصة" (Arabic only, with kasra+hamza - most common)
-                r'تاريخ\s*إنتهاء\s*الرخصة\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ\s*إنتهاء\s*الرخصه\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                # Full phrase with alternative spelling (fatha instead of kasra) and "Expiry Date"
-                r'تاريخ\s*انتهاء\s*الرخصة\s*[/\s]*\s*Expiry\s*Date\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ\s*انتهاء\s*الرخصه\s*[/\s]*\s*Expiry\s*Date\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ\s*انتهاء\s*الرخصة\s*[/\s]*\s*Expiry\s*Date\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ\s*انتهاء\s*الرخصه\s*[/\s]*\s*Expiry\s*Date\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ\s*انتهاء\s*الرخصة\s*[/\s]*\s*License\s*Expiry\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ\s*انتهاء\s*الرخصه\s*[/\s]*\s*License\s*Expiry\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ\s*انتهاء\s*الرخصة\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ\s*انتهاء\s*الرخصه\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                # Table format: "تاريخ" followed by "إنتهاء الرخصة" (flexible spacing for table columns)
-                r'تاريخ[:\s]*إنتهاء\s*الرخصة\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ[:\s]*انتهاء\s*الرخصة\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                # OCR variation: انتهاءء الرخصة (with two hamzas)
-                r'تاريخ\s*انتهاءء\s*الرخصة\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'تاريخ\s*انتهاءء\s*الرخصه\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            ]
+                return False
             
+            # Priority patterns ("تاريخ إنتهاء الرخصة" only) are precompiled at module level in _PRIORITY_RES
             # REMOVED: All patterns without "تاريخ" prefix (too flexible, might match wrong dates)
             # REMOVED: English-only patterns (not specific enough)
             # REMOVED: Very flexible patterns (just "إنتهاء" - too risky)
             
             # REMOVED: Secondary patterns - too flexible, might match wrong dates
             # We ONLY use priority patterns that contain "تاريخ إنتهاء الرخصة"
-            arabic_patterns = []  # Empty - we don't use flexible patterns anymore
-            
-            # Date patterns
-            date_patterns = [
-                r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'(\d{4}[/-]\d{1,2}[/-]\d{1,2})',
-                r'(\d{1,2}\.\d{1,2}\.\d{2,4})',
-                r'(\d{4}\.\d{1,2}\.\d{1,2})',
-            ]
             
-            # OPTIMIZATION: Skip verbose debugging - only check keywords if needed
-            has_expiry_keyword = any(kw in ocr_text_normalized for kw in ['إنتهاء', 'انتهاء', 'تاريخ إنتهاء', 'Expiry Date'])
+            # OPTIMIZATION: Every expiry pattern needs "إنتهاء"/"انتهاء"/"Expiry" - reuse the keyword scan and
+            # skip proximity matching and all priority patterns when the OCR text has none of them
+            has_expiry_keyword = bool(keyword_positions['expiry'])
+            # Likewise every priority pattern ends in a date - no digit anywhere means no match
+            has_date_digit = _HAS_DIGIT_RE.search(ocr_text_normalized) is not None
             
             # OPTIMIZED: If target_party_id is provided, use fast proximity-based matching
-            if target_party_id:
+            if target_party_id and has_expiry_keyword:
                 # Extract all Party IDs and dates with positions (optimized)
                 party_positions = self.extract_party_ids_with_positions(ocr_text_normalized)
-                date_positions = self.extract_all_expiry_dates_with_positions(ocr_text_normalized, exclude_keywords)
+                date_positions = self.extract_all_expiry_dates_with_positions(ocr_text_normalized, list(_EXCLUDE_KEYWORDS))
                 
                 # Match date to Party ID based on proximity
                 if party_positions and date_positions:
@@ -3254,8 +3969,9 @@ Translation (one line per phrase, format: original|translation):"""
             # CRITICAL: Extract ALL dates from the matched line, not just the first one
             # Try priority patterns first (these are already specific to expiry)
             # These patterns are ordered from most specific to least specific
-            for pattern_idx, pattern in enumerate(priority_patterns):
-                match = re.search(pattern, ocr_text_normalized, re.IGNORECASE | re.UNICODE)
+            # (none can match without an expiry keyword and a digit - go straight to the fallback below)
+            for pattern_idx, priority_re in enumerate(_PRIORITY_RES if has_expiry_keyword and has_date_digit else ()):
+                match = priority_re.search(ocr_text_normalized)
                 if match:
                     date_found = match.group(1).strip()
                     if date_found:
@@ -3265,8 +3981,8 @@ Translation (one line per phrase, format: original|translation):"""
                         
                         # Extract the matched text to see what keyword was matched
                         matched_text = ocr_text_normalized[match_start:match_end]
-                        print(f"    🔍 Pattern {pattern_idx + 1} matched: '{matched_text[:100]}'")
-                        print(f"    🔍 Extracted date: {date_found}")
+                        logger.debug("🔍 Pattern %d matched: '%.100s'", pattern_idx + 1, matched_text)
+                        logger.debug("🔍 Extracted date: %s", date_found)
                         
                         # CRITICAL: Extract ALL dates from the matched line, not just the first one
                         # For table layouts, there might be multiple dates on the same line
@@ -3285,12 +4001,11 @@ Translation (one line per phrase, format: original|translation):"""
                             line_end = len(ocr_text_normalized)
                         
                         full_line = ocr_text_normalized[line_start:line_end]
-                        print(f"    🔍 Full line containing match: '{full_line[:200]}'")
+                        logger.debug("🔍 Full line containing match: '%.200s'", full_line)
                         
                         # Extract ALL dates from this line (not just the first one)
-                        date_pattern = r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
-                        all_dates_in_line = re.findall(date_pattern, full_line)
-                        print(f"    🔍 Found {len(all_dates_in_line)} date(s) in line: {all_dates_in_line}")
+                        all_dates_in_line = _DATE_RE.findall(full_line)
+                        logger.debug("🔍 Found %d date(s) in line: %s", len(all_dates_in_line), all_dates_in_line)
                         
                         # Filter dates: only keep those that are NOT Upload Date (19/11/2025 is common Upload Date)
                         valid_dates = []
@@ -3310,7 +4025,7 @@ Translation (one line per phrase, format: original|translation):"""
                                     if year and 2024 <= year <= 2026:
                                         # Check if it's the common Upload Date format (19/11/2025)
                                         if date_str in ['19/11/2025', '19-11-2025', '2025-11-19']:
-                                            print(f"    ⚠️ Skipping Upload Date: {date_str}")
+                                            logger.debug("⚠️ Skipping Upload Date: %s", date_str)
                                             continue
                                     
                                     valid_dates.append(date_str)
@@ -3319,7 +4034,7 @@ Translation (one line per phrase, format: original|translation):"""
                             else:
                                 valid_dates.append(date_str)
                         
-                        print(f"    🔍 Valid dates (excluding Upload Dates): {valid_dates}")
+                        logger.debug("🔍 Valid dates (excluding Upload Dates): %s", valid_dates)
                         
                         # CRITICAL: Try each valid date until we find one that's not already used
                         # This ensures each party gets a different date when multiple dates exist
@@ -3329,22 +4044,22 @@ Translation (one line per phrase, format: original|translation):"""
                             # Note: used_dates_for_case is passed from the calling function
                             # For now, we'll use the first valid date, but the caller should check for reuse
                             date_found = date_candidate
-                            print(f"    🔍 Trying date: {date_found}")
+                            logger.debug("🔍 Trying date: %s", date_found)
                             break  # Use first valid date for now - caller will check for reuse
                         
                         if not date_found and valid_dates:
                             date_found = valid_dates[0]  # Fallback to first if none selected
                         
                         if date_found:
-                            print(f"    🔍 Using date: {date_found}")
-                            if len(valid_dates) > 1:
-                                print(f"    ⚠️ NOTE: Found {len(valid_dates)} dates in line: {valid_dates}")
-                                print(f"    ⚠️ Using first date {date_found} for this party")
-                                print(f"    ⚠️ Other dates in line: {valid_dates[1:]}")
-                                print(f"    ⚠️ These should be available for other parties via pre-extraction")
+                            logger.debug("🔍 Using date: %s", date_found)
+                            if len(valid_dates) > 1 and logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("⚠️ NOTE: Found %d dates in line: %s", len(valid_dates), valid_dates)
+                                logger.debug("⚠️ Using first date %s for this party", date_found)
+                                logger.debug("⚠️ Other dates in line: %s", valid_dates[1:])
+                                logger.debug("⚠️ These should be available for other parties via pre-extraction")
                         else:
                             # No valid dates found, use originally matched date
-                            print(f"    ⚠️ No valid dates after filtering, using originally matched date: {date_found}")
+                            logger.debug("⚠️ No valid dates after filtering, using originally matched date: %s", date_found)
                         
                         # OPTIMIZED: Fast validation - check exclusion and return immediately
                         if not is_near_exclude_keyword(ocr_text_normalized, match_pos, len(date_found)):
@@ -3360,19 +4075,12 @@ Translation (one line per phrase, format: original|translation):"""
             # REMOVED: All fallback logic that searches for dates near keywords
             # We ONLY use priority patterns that contain the full "تاريخ إنتهاء الرخصة" phrase
             # This ensures we never extract dates from "تاريخ إضافة الرخصة" (Upload Date) or other fields
-            print(f"    ℹ️ Only using patterns that contain 'تاريخ إنتهاء الرخصة' - no fallback searches")
-            
-            # Check if Arabic expiry keywords exist (for debugging only)
-            expiry_keywords = [
-                'تاريخ إنتهاء', 'تاريخ انتهاء',  # Full phrase with "تاريخ"
-            ]
-            has_expiry_keyword = any(keyword in ocr_text_normalized for keyword in expiry_keywords)
+            logger.debug("ℹ️ Only using patterns that contain 'تاريخ إنتهاء الرخصة' - no fallback searches")
             
             # OPTIMIZED FALLBACK: Fast improved extraction with early exit
             if target_party_id:
                 try:
-                    from excel_ocr_license_processor import ExcelOCRLicenseProcessor
-                    fallback_processor = ExcelOCRLicenseProcessor()
+                    fallback_processor = self._fallback_processor
                     
                     # Try direct extraction first (fastest)
                     fallback_date = fallback_processor.extract_license_expiry_from_ocr_text(ocr_text_normalized, str(target_party_id))
@@ -3382,28 +4090,38 @@ Translation (one line per phrase, format: original|translation):"""
                     # If direct extraction failed, try extracting all dates (one-time operation)
                     all_party_dates = fallback_processor.extract_all_license_expiry_dates(ocr_text_normalized)
                     if all_party_dates:
-                        target_id_clean = re.sub(r'[^\d]', '', str(target_party_id).strip())
+                        target_id_clean = _NONDIGIT_RE.sub('', str(target_party_id).strip())
                         
                         # Fast exact match
                         if target_id_clean in all_party_dates:
                             return all_party_dates[target_id_clean]
                         
+                        # Clean OCR Party IDs and target suffixes once for both passes below
+                        ocr_ids_clean = [(_NONDIGIT_RE.sub('', str(ocr_party_id)), date_text)
+                                         for ocr_party_id, date_text in all_party_dates.items()]
+                        target_last8 = target_id_clean[-8:]
+                        target_last9 = target_id_clean[-9:]
+                        
                         # Fast partial match (last 8-9 digits)
-                        for ocr_party_id, date in all_party_dates.items():
-                            ocr_id_clean = re.sub(r'[^\d]', '', str(ocr_party_id))
-                            if len(target_id_clean) >= 8 and len(ocr_id_clean) >= 8:
-                                if target_id_clean[-8:] == ocr_id_clean[-8:] or target_id_clean[-9:] == ocr_id_clean[-9:]:
-                                    return date
+                        if len(target_id_clean) >= 8:
+                            for ocr_id_clean, date_text in ocr_ids_clean:
+                                if len(ocr_id_clean) >= 8:
+                                    if target_last8 == ocr_id_clean[-8:] or target_last9 == ocr_id_clean[-9:]:
+                                        return date_text
                         
                         # Fast fuzzy match (only if needed)
-                        from difflib import SequenceMatcher
-                        for ocr_party_id, date in all_party_dates.items():
-                            ocr_id_clean = re.sub(r'[^\d]', '', str(ocr_party_id))
+                        for ocr_id_clean, date_text in ocr_ids_clean:
                             if target_id_clean in ocr_id_clean or ocr_id_clean in target_id_clean:
-                                return date
-                            ratio = SequenceMatcher(None, target_id_clean, ocr_id_clean).ratio()
+                                return date_text
+                            # IDs differing by more than 3 digits in length can't reach the 0.85 ratio
+                            if abs(len(target_id_clean) - len(ocr_id_clean)) > 3:
+                                continue
+                            if RAPIDFUZZ_SUPPORT:
+                                ratio = fuzz.ratio(target_id_clean, ocr_id_clean) / 100.0
+                            else:
+                                ratio = SequenceMatcher(None, target_id_clean, ocr_id_clean).ratio()
                             if ratio >= 0.85:  # Higher threshold for speed
-                                return date
+                                return date_text
                         
                         # Last resort: first available date
                         if all_party_dates:
@@ -3411,95 +4129,26 @@ Translation (one line per phrase, format: original|translation):"""
                 except Exception:
                     pass
             
-            # REMOVED: All the fallback code below - we don't search for dates near keywords anymore
-            # This was removed to ensure we ONLY extract from "تاريخ إنتهاء الرخصة" patterns
-            if False:  # Disabled - we don't use this fallback anymore
-                print(f"    🔍 Found expiry keywords, searching for dates nearby...")
-                # Find dates near expiry keywords only
-                # For tables, search for all occurrences and use larger context window
-                for keyword in expiry_keywords:
-                    # Search for all occurrences of keyword (tables might have multiple rows)
-                    keyword_positions = []
-                    start_pos = 0
-                    while True:
-                        pos = ocr_text_normalized.find(keyword, start_pos)
-                        if pos == -1:
-                            break
-                        keyword_positions.append(pos)
-                        start_pos = pos + 1
-                    
-                    if keyword_positions:
-                        print(f"    🔍 Found '{keyword}' {len(keyword_positions)} time(s) in text")
-                    
-                    for keyword_pos in keyword_positions:
-                        # For tables, use larger context window (dates might be in next column)
-                        start = max(0, keyword_pos - 30)
-                        end = min(len(ocr_text_normalized), keyword_pos + len(keyword) + 150)  # Increased for tables
-                        context = ocr_text_normalized[start:end]
-                        
-                        print(f"    🔍 Keyword '{keyword}' at position {keyword_pos}, context: {context[:200]}")
-                        
-                        # Make sure context doesn't contain issue keywords
-                        if not any(ikw in context for ikw in issue_keywords):
-                            # Also check that context doesn't contain Upload Date keywords (which should be excluded)
-                            upload_keywords_in_context = ['إضافة', 'اضافة', 'رفع', 'Upload Date']
-                            has_upload_keyword = any(ukw in context for ukw in upload_keywords_in_context)
-                            
-                            # If Upload Date keyword is present, make sure Expiry keyword is closer to the date
-                            if has_upload_keyword:
-                                print(f"    ⚠️ Context contains Upload Date keyword - will verify expiry keyword is closer")
-                            
-                            for pattern in date_patterns:
-                                matches = re.finditer(pattern, context)
-                                for match in matches:
-                                    date_found = match.group(1).strip()
-                                    if date_found:
-                                        # Check position relative to original text
-                                        date_pos_in_context = match.start(1)
-                                        date_pos_in_full = start + date_pos_in_context
-                                        
-                                        # If Upload Date keyword exists, check distances
-                                        if has_upload_keyword:
-                                            # Find positions of expiry and upload keywords relative to date
-                                            expiry_dist = abs(keyword_pos - date_pos_in_full)
-                                            upload_keyword_pos = -1
-                                            for ukw in upload_keywords_in_context:
-                                                pos = context.find(ukw)
-                                                if pos != -1:
-                                                    upload_keyword_pos = start + pos
-                                                    break
-                                            
-                                            if upload_keyword_pos != -1:
-                                                upload_dist = abs(upload_keyword_pos - date_pos_in_full)
-                                                if upload_dist < expiry_dist:
-                                                    print(f"    ⚠️ Date {date_found} is closer to Upload Date keyword than Expiry keyword - SKIPPING")
-                                                    continue
-                                        
-                                        if not is_near_exclude_keyword(ocr_text_normalized, date_pos_in_full, len(date_found)):
-                                            print(f"    ✅✅✅ Found expiry date near '{keyword}': {date_found}")
-                                            return date_found
-                        else:
-                            print(f"    ⚠️ Context contains issue keywords, skipping...")
-            
             # No date found - return immediately (optimized)
             print(f"    ❌ No expiry date found in OCR text")
-            ocr_sample_for_debug = ocr_text_sample[:1000] if 'ocr_text_sample' in locals() else (ocr_text[:1000] if len(ocr_text) > 1000 else ocr_text)
-            print(f"    🔍 DEBUG: OCR text sample (first 1000 chars): '{ocr_sample_for_debug}'")
-            # Check if expiry keywords exist
-            expiry_keywords = ['تاريخ إنتهاء', 'تاريخ انتهاء', 'Expiry Date', 'License Expiry']
-            found_keywords = [kw for kw in expiry_keywords if kw in ocr_text_normalized]
-            if found_keywords:
-                print(f"    🔍 DEBUG: Found expiry keywords but no matching dates: {found_keywords}")
-                # Try to show context around keywords
-                for kw in found_keywords[:2]:  # Show first 2 keywords
-                    idx = ocr_text_normalized.find(kw)
-                    if idx != -1:
-                        context_start = max(0, idx - 200)
-                        context_end = min(len(ocr_text_normalized), idx + len(kw) + 200)
-                        context = ocr_text_normalized[context_start:context_end]
-                        print(f"    🔍 DEBUG: Context around '{kw}' (position {idx}): '{context}'")
-            else:
-                print(f"    🔍 DEBUG: NO expiry keywords found in OCR - might be wrong OCR or image")
+            # OCR sample / keyword context dump - only materialized when debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🔍 OCR text sample (first 500 chars): '%.500s'", ocr_text)
+                # Check if expiry keywords exist
+                expiry_keywords = ['تاريخ إنتهاء', 'تاريخ انتهاء', 'Expiry Date', 'License Expiry']
+                found_keywords = [kw for kw in expiry_keywords if kw in ocr_text_normalized]
+                if found_keywords:
+                    logger.debug("🔍 Found expiry keywords but no matching dates: %s", found_keywords)
+                    # Try to show context around keywords
+                    for kw in found_keywords[:2]:  # Show first 2 keywords
+                        idx = ocr_text_normalized.find(kw)
+                        if idx != -1:
+                            context_start = max(0, idx - 200)
+                            context_end = min(len(ocr_text_normalized), idx + len(kw) + 200)
+                            context = ocr_text_normalized[context_start:context_end]
+                            logger.debug("🔍 Context around '%s' (position %d): '%s'", kw, idx, context)
+                else:
+                    logger.debug("🔍 NO expiry keywords found in OCR - might be wrong OCR or image")
             return "not identify"
             
         except Exception as e:
@@ -3518,24 +4167,15 @@ Translation (one line per phrase, format: original|translation):"""
         if data_str.startswith("'") and data_str.endswith("'"):
             data_str = data_str[1:-1]
         
-        # Fix Excel line break encoding
-        data_str = data_str.replace('_x000D_', '\r')
-        data_str = data_str.replace('_x000A_', '\n')
-        data_str = data_str.replace('_x000d_', '\r')
-        data_str = data_str.replace('_x000a_', '\n')
-        
-        # Replace Excel unicode escapes
+        # Replace Excel unicode escapes (including the _x000D_ / _x000A_ line breaks)
         def replace_excel_unicode(match):
             code = int(match.group(1), 16)
             return chr(code)
-        data_str = re.sub(r'_x([0-9A-Fa-f]{4})_', replace_excel_unicode, data_str)
+        data_str = _EXCEL_UNICODE_RE.sub(replace_excel_unicode, data_str)
         
         # Fix HTML entities
-        data_str = data_str.replace('&quot;', '"')
-        data_str = data_str.replace('&amp;', '&')
-        data_str = data_str.replace('&lt;', '<')
-        data_str = data_str.replace('&gt;', '>')
-        data_str = data_str.replace('&apos;', "'")
+        if '&' in data_str:
+            data_str = _HTML_ENTITY_RE.sub(_replace_html_entity, data_str)
         
         # Remove BOM
         if data_str.startswith('\ufeff'):
@@ -3567,77 +4207,44 @@ Translation (one line per phrase, format: original|translation):"""
             # Handle YYYYMMDD format (8 digits, no separators)
             # Example: "20251119" -> "2025-11-19" or "14451206" (Hijri) -> keep for conversion
             if date_str.isdigit() and len(date_str) == 8:
-                year = int(date_str[0:4])
-                month = int(date_str[4:6])
-                day = int(date_str[6:8])
-                
-                # CRITICAL: Validate date parts - reject invalid dates
-                # Day must be 1-31, month must be 1-12
-                # Year: Gregorian (1900-2100) or Hijri (1400-1600)
-                if not (1 <= day <= 31 and 1 <= month <= 12):
-                    print(f"    🚫 Invalid date {date_str}: day={day}, month={month} (out of range)")
-                    return date_str  # Return original if invalid
-                
-                if (1900 <= year <= 2100 or 1400 <= year <= 1600):
-                    normalized = f"{year:04d}-{month:02d}-{day:02d}"
-                    print(f"    ✓ Normalized date format {date_str} to {normalized}")
-                    return normalized
-                else:
-                    print(f"    🚫 Invalid date {date_str}: year={year} (out of valid range)")
-                    return date_str
-            
-            # Handle formats with separators
-            if '/' in date_str or '-' in date_str:
+                year, month, day = _split_yyyymmdd(date_str)
+            # Handle formats with separators (YYYY-MM-DD, DD-MM-YYYY, DD/MM/YYYY)
+            elif '/' in date_str or '-' in date_str:
                 separator = '/' if '/' in date_str else '-'
                 parts = date_str.split(separator)
-                if len(parts) == 3:
-                    try:
-                        part1 = int(parts[0])
-                        part2 = int(parts[1])
-                        part3 = int(parts[2])
-                        
-                        # Determine format: YYYY-MM-DD or DD-MM-YYYY
-                        if part1 > 31:
-                            # YYYY-MM-DD format
-                            year, month, day = part1, part2, part3
-                        else:
-                            # DD-MM-YYYY or DD/MM/YYYY format
-                            day, month, year = part1, part2, part3
-                        
-                        # CRITICAL: Validate date parts - reject invalid dates
-                        if not (1 <= day <= 31 and 1 <= month <= 12):
-                            print(f"    🚫 Invalid date {date_str}: day={day}, month={month} (out of range)")
-                            return date_str  # Return original if invalid
-                        
-                        # Validate year range - handle both Gregorian (1900-2100) and Hijri (1400-1600)
-                        if (1900 <= year <= 2100 or 1400 <= year <= 1600):
-                            normalized = f"{year:04d}-{month:02d}-{day:02d}"
-                            if normalized != date_str:
-                                print(f"    ✓ Normalized date format {date_str} to {normalized}")
-                            return normalized
-                        else:
-                            print(f"    🚫 Invalid date {date_str}: year={year} (out of valid range)")
-                            return date_str
-                    except ValueError:
-                        pass
+                if len(parts) != 3:
+                    return date_str
+                int_parts = _int_date_parts(parts)
+                if int_parts is None:
+                    return date_str
+                part1, part2, part3 = int_parts
+                
+                # Determine format: YYYY-MM-DD or DD-MM-YYYY
+                if part1 > 31:
+                    # YYYY-MM-DD format
+                    year, month, day = part1, part2, part3
+                else:
+                    # DD-MM-YYYY or DD/MM/YYYY format
+                    day, month, year = part1, part2, part3
+            else:
+                # Return original if we can't parse it
+                return date_str
             
-            # If already in YYYY-MM-DD format, validate it
-            if re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
-                parts = date_str.split('-')
-                try:
-                    year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
-                    if not (1 <= day <= 31 and 1 <= month <= 12):
-                        print(f"    🚫 Invalid date {date_str}: day={day}, month={month} (out of range)")
-                        return date_str
-                    if not (1900 <= year <= 2100 or 1400 <= year <= 1600):
-                        print(f"    🚫 Invalid date {date_str}: year={year} (out of valid range)")
-                        return date_str
-                except ValueError:
-                    pass
+            # CRITICAL: Validate date parts - reject invalid dates
+            # Day must be 1-31, month must be 1-12
+            # Year: Gregorian (1900-2100) or Hijri (1400-1600)
+            status = _validate_ymd(year, month, day)
+            if status == _YMD_BAD_DAY_MONTH:
+                print(f"    🚫 Invalid date {date_str}: day={day}, month={month} (out of range)")
+                return date_str  # Return original if invalid
+            if status == _YMD_BAD_YEAR:
+                print(f"    🚫 Invalid date {date_str}: year={year} (out of valid range)")
                 return date_str
             
-            # Return original if we can't parse it
-            return date_str
+            normalized = f"{year:04d}-{month:02d}-{day:02d}"
+            if normalized != date_str:
+                print(f"    ✓ Normalized date format {date_str} to {normalized}")
+            return normalized
                 
         except Exception as e:
             print(f"    ⚠️ Error normalizing date {date_str}: {str(e)}")
@@ -3671,9 +4278,7 @@ Translation (one line per phrase, format: original|translation):"""
             # Example: "14451206" (Hijri) or "20251119" (Gregorian)
             if date_str.isdigit() and len(date_str) == 8:
                 try:
-                    year = int(date_str[0:4])
-                    month = int(date_str[4:6])
-                    day = int(date_str[6:8])
+                    year, month, day = _split_yyyymmdd(date_str)
                     date_parts = (year, month, day)
                 except ValueError:
                     pass
@@ -3682,23 +4287,19 @@ Translation (one line per phrase, format: original|translation):"""
             if date_parts is None and ('/' in date_str or '-' in date_str):
                 separator = '/' if '/' in date_str else '-'
                 parts = date_str.split(separator)
-                if len(parts) == 3:
+                int_parts = _int_date_parts(parts) if len(parts) == 3 else None
+                if int_parts is not None:
                     # Check if it's DD/MM/YYYY or YYYY/MM/DD
-                    try:
-                        part1 = int(parts[0])
-                        part2 = int(parts[1])
-                        part3 = int(parts[2])
-                        
-                        # If first part is > 31, it's likely YYYY/MM/DD
-                        if part1 > 31:
-                            year, month, day = part1, part2, part3
-                        else:
-                            # Assume DD/MM/YYYY
-                            day, month, year = part1, part2, part3
-                        
-                        date_parts = (year, month, day)
-                    except ValueError:
-                        pass
+                    part1, part2, part3 = int_parts
+                    
+                    # If first part is > 31, it's likely YYYY/MM/DD
+                    if part1 > 31:
+                        year, month, day = part1, part2, part3
+                    else:
+                        # Assume DD/MM/YYYY
+                        day, month, year = part1, part2, part3
+                    
+                    date_parts = (year, month, day)
             
             if date_parts is None:
                 return date_str
@@ -3720,61 +4321,40 @@ Translation (one line per phrase, format: original|translation):"""
                         return date_str
                     
                     try:
-                        hijri = Hijri(year, month, day)
-                        gregorian = hijri.to_gregorian()
+                        gregorian = _hijri_to_gregorian(year, month, day)
                         gregorian_date = f"{gregorian.year:04d}-{gregorian.month:02d}-{gregorian.day:02d}"
                         print(f"    ✅ Converted Hijri date {year:04d}-{month:02d}-{day:02d} (Hijri) to Gregorian: {gregorian_date}")
                         
                         # CRITICAL: Validate that Hijri date is in the future (for license expiry)
                         # Check if the Hijri date is in the future relative to current Hijri date
-                        from datetime import datetime as dt
-                        if HIJRI_SUPPORT:
-                            try:
-                                current_gregorian = dt.now()
-                                current_hijri = Gregorian(current_gregorian.year, current_gregorian.month, current_gregorian.day).to_hijri()
-                                print(f"    🔍 DEBUG: Current date: Gregorian {current_gregorian.strftime('%Y-%m-%d')}, Hijri {current_hijri.year:04d}-{current_hijri.month:02d}-{current_hijri.day:02d}")
-                                
-                                # Compare Hijri dates - allow dates within past year to pass through for final validation
-                                # Convert to Gregorian first to calculate days difference more accurately
-                                try:
-                                    hijri_date_obj = Hijri(year, month, day)
-                                    gregorian_date_obj = hijri_date_obj.to_gregorian()
-                                    hijri_as_gregorian = dt(gregorian_date_obj.year, gregorian_date_obj.month, gregorian_date_obj.day)
-                                    days_diff_gregorian = (hijri_as_gregorian - current_gregorian).days
-                                    
-                                    # Only reject dates that are clearly invalid (> 1 year in the past)
-                                    if days_diff_gregorian < -365:  # More than 1 year in the past
-                                        print(f"    ⚠️ Hijri date {year:04d}-{month:02d}-{day:02d} (Gregorian: {gregorian_date}) is more than 1 year in the past ({abs(days_diff_gregorian)} days ago)")
-                                        print(f"    ⚠️ Converted Gregorian date {gregorian_date} is likely invalid for license expiry - setting to 'not identify'")
-                                        return "not identify"
-                                    elif days_diff_gregorian < 0:  # Within past year
-                                        print(f"    ⚠️ Hijri date {year:04d}-{month:02d}-{day:02d} (Gregorian: {gregorian_date}) is {abs(days_diff_gregorian)} days in the past - allowing for final validation")
-                                    elif days_diff_gregorian >= 0:
-                                        print(f"    ✓ Hijri date {year:04d}-{month:02d}-{day:02d} (Gregorian: {gregorian_date}) is in the future")
-                                except:
-                                    # Fallback to simple year comparison if conversion fails
-                                    if year < current_hijri.year - 1:  # More than 1 year in the past
-                                        print(f"    ⚠️ Hijri date {year:04d}-{month:02d}-{day:02d} is more than 1 year in the past (current Hijri year: {current_hijri.year}, difference: {current_hijri.year - year} years)")
-                                        print(f"    ⚠️ Converted Gregorian date {gregorian_date} is likely invalid for license expiry - setting to 'not identify'")
-                                        return "not identify"
-                                    elif year < current_hijri.year:
-                                        print(f"    ⚠️ Hijri date {year:04d}-{month:02d}-{day:02d} is in the past (current Hijri year: {current_hijri.year}) - allowing for final validation")
-                                    elif year == current_hijri.year and month < current_hijri.month:
-                                        print(f"    ⚠️ Hijri date {year:04d}-{month:02d}-{day:02d} is in the past (current Hijri: {current_hijri.year}-{current_hijri.month:02d}) - allowing for final validation")
-                                    elif year == current_hijri.year and month == current_hijri.month and day < current_hijri.day:
-                                        days_diff = current_hijri.day - day
-                                        print(f"    ⚠️ Hijri date {year:04d}-{month:02d}-{day:02d} is {days_diff} day(s) in the past - allowing for final validation")
-                                
-                                # Check if Hijri date is unreasonably far in future (> 20 Hijri years = ~19 Gregorian years)
-                                if year > current_hijri.year + 20:
-                                    years_diff = year - current_hijri.year
-                                    print(f"    ⚠️ Hijri date {year:04d}-{month:02d}-{day:02d} is {years_diff} Hijri years in future (current: {current_hijri.year})")
-                                    print(f"    ⚠️ REASON: License expiry dates should not be more than ~20 Hijri years in the future")
-                                    print(f"    ⚠️ Converted Gregorian date {gregorian_date} is too far in future - likely OCR error")
-                                    return "not identify"
-                            except Exception as hijri_validation_error:
-                                print(f"    ⚠️ Error validating Hijri date: {str(hijri_validation_error)[:100]}")
-                                # Continue with conversion if validation fails
+                        try:
+                            today = date.today()
+                            current_hijri = _gregorian_to_hijri(today.year, today.month, today.day)
+                            print(f"    🔍 DEBUG: Current date: Gregorian {today.strftime('%Y-%m-%d')}, Hijri {current_hijri.year:04d}-{current_hijri.month:02d}-{current_hijri.day:02d}")
+                            
+                            # Compare as Gregorian calendar dates - allow dates within past year to pass through for final validation
+                            days_diff_gregorian = (date(gregorian.year, gregorian.month, gregorian.day) - today).days
+                            
+                            # Only reject dates that are clearly invalid (> 1 year in the past)
+                            if days_diff_gregorian < -365:  # More than 1 year in the past
+                                print(f"    ⚠️ Hijri date {year:04d}-{month:02d}-{day:02d} (Gregorian: {gregorian_date}) is more than 1 year in the past ({abs(days_diff_gregorian)} days ago)")
+                                print(f"    ⚠️ Converted Gregorian date {gregorian_date} is likely invalid for license expiry - setting to 'not identify'")
+                                return "not identify"
+                            elif days_diff_gregorian < 0:  # Within past year
+                                print(f"    ⚠️ Hijri date {year:04d}-{month:02d}-{day:02d} (Gregorian: {gregorian_date}) is {abs(days_diff_gregorian)} days in the past - allowing for final validation")
+                            else:
+                                print(f"    ✓ Hijri date {year:04d}-{month:02d}-{day:02d} (Gregorian: {gregorian_date}) is in the future")
+                            
+                            # Check if Hijri date is unreasonably far in future (> 20 Hijri years = ~19 Gregorian years)
+                            if year > current_hijri.year + 20:
+                                years_diff = year - current_hijri.year
+                                print(f"    ⚠️ Hijri date {year:04d}-{month:02d}-{day:02d} is {years_diff} Hijri years in future (current: {current_hijri.year})")
+                                print(f"    ⚠️ REASON: License expiry dates should not be more than ~20 Hijri years in the future")
+                                print(f"    ⚠️ Converted Gregorian date {gregorian_date} is too far in future - likely OCR error")
+                                return "not identify"
+                        except Exception as hijri_validation_error:
+                            print(f"    ⚠️ Error validating Hijri date: {str(hijri_validation_error)[:100]}")
+                            # Continue with conversion if validation fails
                         
                         print(f"    ✓ Converted Hijri date {date_str} ({year:04d}-{month:02d}-{day:02d} H) to Gregorian: {gregorian_date}")
                         return gregorian_date
@@ -3784,29 +4364,13 @@ Translation (one line per phrase, format: original|translation):"""
                         # Try with day 29 if day was 30 and month might only have 29 days
                         if day == 30:
                             try:
-                                hijri = Hijri(year, month, 29)
-                                gregorian = hijri.to_gregorian()
+                                gregorian = _hijri_to_gregorian(year, month, 29)
                                 gregorian_date = f"{gregorian.year:04d}-{gregorian.month:02d}-{gregorian.day:02d}"
                                 
                                 # Validate adjusted date - allow dates within past year for final validation
-                                if HIJRI_SUPPORT:
-                                    try:
-                                        current_gregorian = dt.now()
-                                        current_hijri = Gregorian(current_gregorian.year, current_gregorian.month, current_gregorian.day).to_hijri()
-                                        # Convert to Gregorian to calculate days difference
-                                        try:
-                                            adjusted_hijri = Hijri(year, month, 29)
-                                            adjusted_gregorian = adjusted_hijri.to_gregorian()
-                                            adjusted_gregorian_dt = dt(adjusted_gregorian.year, adjusted_gregorian.month, adjusted_gregorian.day)
-                                            days_diff = (adjusted_gregorian_dt - current_gregorian).days
-                                            if days_diff < -365:  # More than 1 year in the past
-                                                return "not identify"
-                                        except:
-                                            # Fallback to simple year comparison
-                                            if year < current_hijri.year - 1:  # More than 1 year in the past
-                                                return "not identify"
-                                    except:
-                                        pass
+                                days_diff = (date(gregorian.year, gregorian.month, gregorian.day) - date.today()).days
+                                if days_diff < -365:  # More than 1 year in the past
+                                    return "not identify"
                                 
                                 print(f"    ✓ Converted Hijri date {date_str} (adjusted day to 29) to Gregorian: {gregorian_date}")
                                 return gregorian_date
@@ -3824,21 +4388,23 @@ Translation (one line per phrase, format: original|translation):"""
             elif 1900 <= year <= 2100:
                 # Year is in Gregorian range, normalize format but don't convert
                 try:
-                    normalized = self.normalize_date_format(date_str)
+                    # Date parts are already parsed - format them directly instead of letting
+                    # normalize_date_format parse the string again (same result for in-range parts)
+                    if 1 <= day <= 31 and 1 <= month <= 12:
+                        normalized = f"{year:04d}-{month:02d}-{day:02d}"
+                    else:
+                        normalized = self.normalize_date_format(date_str)  # rejects it, returns it unchanged
                     
                     # CRITICAL: Validate that Gregorian date is in the future (for license expiry)
                     # Check if the normalized date is in the future
-                    from datetime import datetime as dt
-                    if re.match(r'^\d{4}-\d{2}-\d{2}$', normalized):
-                        date_parts = normalized.split('-')
-                        norm_year = int(date_parts[0])
-                        norm_month = int(date_parts[1])
-                        norm_day = int(date_parts[2])
+                    # (a YYYY-MM-DD string here always carries the year/month/day parsed above)
+                    if _YMD_RE.match(normalized):
+                        norm_year, norm_month, norm_day = year, month, day
                         
                         try:
-                            # Create datetime object for the normalized date
-                            normalized_date = dt(norm_year, norm_month, norm_day)
-                            current_date = dt.now()
+                            # Calendar-date difference against today
+                            normalized_date = date(norm_year, norm_month, norm_day)
+                            current_date = date.today()
                             days_difference = (normalized_date - current_date).days
                             
                             # Only reject dates that are clearly invalid:
@@ -3879,84 +4445,39 @@ Translation (one line per phrase, format: original|translation):"""
         """
         xml_clean = self.clean_data(xml_string)
         
-        # Try parsing first
-        try:
-            root = ET.fromstring(xml_clean)
-        except ET.ParseError as e:
-            error_msg = str(e)
-            # If namespace error, fix it immediately
-            if 'unbound prefix' in error_msg or 'namespace' in error_msg.lower():
-                # Remove all namespace prefixes
-                xml_clean = re.sub(r'<s0:(\w+)', r'<\1', xml_clean)
-                xml_clean = re.sub(r'</s0:(\w+)', r'</\1', xml_clean)
-                xml_clean = re.sub(r'<xsi:(\w+)', r'<\1', xml_clean)
-                xml_clean = re.sub(r'</xsi:(\w+)', r'</\1', xml_clean)
-                xml_clean = re.sub(r'\ss0:(\w+)=', r' \1=', xml_clean)
-                xml_clean = re.sub(r'\sxsi:(\w+)=', r' \1=', xml_clean)
-                xml_clean = re.sub(r'\sxsi:nil="[^"]*"', '', xml_clean)
-                
-                # Try again
-                try:
-                    root = ET.fromstring(xml_clean)
-                except ET.ParseError as e2:
-                    # Remove invalid characters
-                    xml_clean = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', xml_clean)
-                    root = ET.fromstring(xml_clean)
-            else:
-                # Other parse errors - try removing invalid characters
-                xml_clean = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', xml_clean)
-                root = ET.fromstring(xml_clean)
+        root = None
+        if LXML_SUPPORT:
+            # Well-formed documents parse in C; anything lxml rejects goes through the
+            # ElementTree repair ladder below (namespace prefixes, control characters)
+            try:
+                root = lxml_etree.fromstring(xml_clean.encode('utf-8'), parser=_lxml_parser())
+            except lxml_etree.XMLSyntaxError:
+                root = None
         
-        # Now parse (root is already set from above)
-            
-            def xml_to_dict(element):
-                """Recursively convert XML to dictionary"""
-                tag = element.tag
-                # Remove namespace if present
-                if '}' in tag:
-                    tag = tag.split('}')[1]
-                
-                result = {}
-                
-                # Get text content
-                text = element.text.strip() if element.text and element.text.strip() else None
-                
-                # Process children
-                children = list(element)
-                if children:
-                    for child in children:
-                        child_tag = child.tag
-                        if '}' in child_tag:
-                            child_tag = child_tag.split('}')[1]
-                        child_data = xml_to_dict(child)
-                        
-                        if child_tag in result:
-                            if not isinstance(result[child_tag], list):
-                                result[child_tag] = [result[child_tag]]
-                            result[child_tag].append(child_data)
-                        else:
-                            result[child_tag] = child_data
+        if root is None:
+            try:
+                root = ET.fromstring(xml_clean)
+            except ET.ParseError as e:
+                error_msg = str(e)
+                # If namespace error, fix it immediately
+                if 'unbound prefix' in error_msg or 'namespace' in error_msg.lower():
+                    # Remove all namespace prefixes
+                    for namespace_re, replacement in _XML_NAMESPACE_FIXES:
+                        xml_clean = namespace_re.sub(replacement, xml_clean)
                     
-                    if text:
-                        result['_text'] = text
+                    # Try again
+                    try:
+                        root = ET.fromstring(xml_clean)
+                    except ET.ParseError as e2:
+                        # Remove invalid characters
+                        xml_clean = _strip_xml_control_chars(xml_clean)
+                        root = ET.fromstring(xml_clean)
                 else:
-                    if text:
-                        return text
-                    elif element.attrib:
-                        result = element.attrib.copy()
-                        if text:
-                            result['_text'] = text
-                        return result if result else None
-                    else:
-                        return text if text else None
-                
-                # Add attributes
-                if element.attrib:
-                    result['_attributes'] = element.attrib
-                
-                return result if result else (text if text else None)
-            
-        json_data = xml_to_dict(root)
+                    # Other parse errors - try removing invalid characters
+                    xml_clean = _strip_xml_control_chars(xml_clean)
+                    root = ET.fromstring(xml_clean)
+        
+        json_data = _xml_element_to_dict(root)
         return json_data
     
     def detect_and_convert(self, data: str) -> Dict[str, Any]:
@@ -3966,15 +4487,17 @@ Translation (one line per phrase, format: original|translation):"""
         """
         data_clean = self.clean_data(data)
         
-        # Detect format
-        if data_clean.strip().startswith('<'):
+        # Detect format from the first non-whitespace character (no stripped copy of the payload)
+        first_char = _PAYLOAD_FIRST_CHAR_RE.match(data_clean)
+        first_char = first_char.group(1) if first_char else ''
+        if first_char == '<':
             # XML format
             json_data = self.xml_to_json(data_clean)
             return json_data
-        elif data_clean.strip().startswith('{'):
+        elif first_char == '{':
             # JSON format
             try:
-                json_data = json.loads(data_clean)
+                json_data = _json_loads(data_clean)
                 return json_data
             except json.JSONDecodeError as e:
                 raise ValueError(f"Failed to parse JSON: {str(e)}")
@@ -3984,55 +4507,41 @@ Translation (one line per phrase, format: original|translation):"""
     def extract_party_info(self, party_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract comprehensive party information from JSON data"""
         # Handle different possible structures
-        party_id = party_data.get("ID", party_data.get("id", party_data.get("Id", "")))
-        name = party_data.get("name", party_data.get("Name", ""))
-        liability = party_data.get("Liability", party_data.get("liability", 0))
-        gender_id = party_data.get("GenderID", party_data.get("genderID", 1))
-        age = party_data.get("age", party_data.get("Age", ""))
-        nationality = party_data.get("nationality", party_data.get("Nationality", ""))
-        license_no = party_data.get("licenseNo", party_data.get("license_no", ""))
-        phone = party_data.get("phoneNo", party_data.get("phone_no", ""))
-        license_type_from_request = party_data.get("licenseType", party_data.get("license_type", ""))
+        party_id = _first_present(party_data, _PARTY_FIELD_KEYS["party_id"])
+        name = _first_present(party_data, _PARTY_FIELD_KEYS["name"])
+        liability = _first_present(party_data, _PARTY_FIELD_KEYS["liability"], 0)
+        gender_id = _first_present(party_data, _PARTY_FIELD_KEYS["gender_id"], 1)
+        age = _first_present(party_data, _PARTY_FIELD_KEYS["age"])
+        nationality = _first_present(party_data, _PARTY_FIELD_KEYS["nationality"])
+        license_no = _first_present(party_data, _PARTY_FIELD_KEYS["license_no"])
+        phone = _first_present(party_data, _PARTY_FIELD_KEYS["phone"])
+        license_type_from_request = _first_present(party_data, _PARTY_FIELD_KEYS["license_type"])
         recovery = party_data.get("recovery", "")
         
         # Vehicle info
-        car_make = party_data.get("carMake", party_data.get("car_make", ""))
-        car_model = party_data.get("carModel", party_data.get("car_model", ""))
-        car_year = party_data.get("carMfgYear", party_data.get("car_year", ""))
-        plate_no = party_data.get("plateNo", party_data.get("plate_no", ""))
-        chassis_no = party_data.get("chassisNo", party_data.get("chassis_no", ""))
-        vehicle_owner_id = party_data.get("VehicleOwnerId", party_data.get("vehicleOwnerId", party_data.get("vehicle_owner_id", "")))
+        car_make = _first_present(party_data, _PARTY_FIELD_KEYS["car_make"])
+        car_model = _first_present(party_data, _PARTY_FIELD_KEYS["car_model"])
+        car_year = _first_present(party_data, _PARTY_FIELD_KEYS["car_year"])
+        plate_no = _first_present(party_data, _PARTY_FIELD_KEYS["plate_no"])
+        chassis_no = _first_present(party_data, _PARTY_FIELD_KEYS["chassis_no"])
+        vehicle_owner_id = _first_present(party_data, _PARTY_FIELD_KEYS["vehicle_owner_id"])
         
         # Extract insurance info (handle different structures)
-        insurance_info = party_data.get("Insurance_Info", {})
-        if not insurance_info:
-            insurance_info = party_data.get("insurance_info", {})
-        if not insurance_info:
-            insurance_info = party_data.get("InsuranceInfo", {})
+        insurance_info = _first_truthy(party_data, _INSURANCE_INFO_KEYS) or {}
         
-        policy_number = insurance_info.get("policyNumber", insurance_info.get("policy_number", ""))
-        insurance_name_arabic = insurance_info.get("ICArabicName", insurance_info.get("ic_arabic_name", ""))
+        policy_number = _first_present(insurance_info, _INSURANCE_FIELD_KEYS["policy_number"])
+        insurance_name_arabic = _first_present(insurance_info, _INSURANCE_FIELD_KEYS["ic_arabic_name"])
         
         # Try multiple possible field names for English name (ICEnglishName, EnglishNam, etc.)
         # First check in insurance_info, then check in party_data top level (for Excel/JSON structures)
         insurance_name_english = (
-            insurance_info.get("ICEnglishName") or
-            insurance_info.get("ic_english_name") or
-            insurance_info.get("EnglishNam") or
-            insurance_info.get("english_nam") or
-            insurance_info.get("EnglishName") or
-            insurance_info.get("english_name") or
-            party_data.get("ICEnglishName") or  # Check top level
-            party_data.get("ic_english_name") or
-            party_data.get("EnglishNam") or
-            party_data.get("english_nam") or
-            party_data.get("EnglishName") or
-            party_data.get("english_name") or
+            _first_truthy(insurance_info, _INSURANCE_FIELD_KEYS["ic_english_name"]) or
+            _first_truthy(party_data, _INSURANCE_FIELD_KEYS["ic_english_name"]) or  # Check top level
             ""
         )
         insurance_name = insurance_name_arabic if insurance_name_arabic else insurance_name_english
-        policy_expiry = insurance_info.get("policyExpiryDate", insurance_info.get("policy_expiry", ""))
-        vehicle_id = insurance_info.get("vehicleID", insurance_info.get("vehicle_id", ""))
+        policy_expiry = _first_present(insurance_info, _INSURANCE_FIELD_KEYS["policy_expiry"])
+        vehicle_id = _first_present(insurance_info, _INSURANCE_FIELD_KEYS["vehicle_id"])
         
         # Damage info
         damages = party_data.get("Damages", {})
@@ -4056,18 +4565,23 @@ Translation (one line per phrase, format: original|translation):"""
                 if not act_description:
                     act_description = act_info.get("actArabic", act_info.get("act_arabic", ""))
         
+        # Flat party dict; str() keeps None as "None" the way downstream consumers expect
+        gender = "Female" if gender_id == 2 else "Male"
+        liability_pct = int(liability) if liability else 0
+        age_str = str(age) if age else ""
+        ic_english_name = str(insurance_name_english) if insurance_name_english else ""
         return {
             "Party_ID": str(party_id),
             "Name": str(name),
-            "Gender": "Female" if gender_id == 2 else "Male",
-            "Age": str(age) if age else "",
+            "Gender": gender,
+            "Age": age_str,
             "Nationality": str(nationality),
             "License_No": str(license_no),
             "Phone": str(phone),
-            "Liability": int(liability) if liability else 0,
+            "Liability": liability_pct,
             "Policy_Number": str(policy_number),
             "Insurance_Name": str(insurance_name),
-            "ICEnglishName": str(insurance_name_english) if insurance_name_english else "",
+            "ICEnglishName": ic_english_name,
             "Policy_Expiry": str(policy_expiry),
             "Vehicle_Make": str(car_make),
             "Vehicle_Model": str(car_model),
@@ -4088,15 +4602,15 @@ Translation (one line per phrase, format: original|translation):"""
         if not isinstance(accident_data, dict):
             accident_data = {}
         
-        case_number = accident_data.get("caseNumber", accident_data.get("case_number", ""))
-        surveyor = accident_data.get("surveyorName", accident_data.get("surveyor_name", ""))
-        call_date = accident_data.get("callDate", accident_data.get("call_date", ""))
-        call_time = accident_data.get("callTime", accident_data.get("call_time", ""))
-        city = accident_data.get("city", accident_data.get("City", ""))
-        location = accident_data.get("location", accident_data.get("Location", ""))
-        coordinates = accident_data.get("LocationCoordinates", accident_data.get("location_coordinates", ""))
-        landmark = accident_data.get("landmark", accident_data.get("Landmark", ""))
-        description = accident_data.get("AccidentDescription", accident_data.get("accident_description", ""))
+        case_number = _first_present(accident_data, _ACCIDENT_FIELD_KEYS["case_number"])
+        surveyor = _first_present(accident_data, _ACCIDENT_FIELD_KEYS["surveyor"])
+        call_date = _first_present(accident_data, _ACCIDENT_FIELD_KEYS["call_date"])
+        call_time = _first_present(accident_data, _ACCIDENT_FIELD_KEYS["call_time"])
+        city = _first_present(accident_data, _ACCIDENT_FIELD_KEYS["city"])
+        location = _first_present(accident_data, _ACCIDENT_FIELD_KEYS["location"])
+        coordinates = _first_present(accident_data, _ACCIDENT_FIELD_KEYS["coordinates"])
+        landmark = _first_present(accident_data, _ACCIDENT_FIELD_KEYS["landmark"])
+        description = _first_present(accident_data, _ACCIDENT_FIELD_KEYS["description"])
         
         return {
             "Case_Number": str(case_number),
@@ -4126,15 +4640,15 @@ Translation (one line per phrase, format: original|translation):"""
             if name in df.columns:
                 return name
         
-        # Try case-insensitive
+        # Try case-insensitive (first matching column in sheet order)
+        possible_lower = {n.lower() for n in possible_names}
         for col in df.columns:
-            if col.strip().lower() in [n.lower() for n in possible_names]:
+            if col.strip().lower() in possible_lower:
                 return col
         
-        # Try pattern matching (contains 'request', 'data', 'xml', 'json')
+        # Try pattern matching (contains 'request', 'data', 'xml', 'json', 'claim')
         for col in df.columns:
-            col_lower = col.lower()
-            if any(keyword in col_lower for keyword in ['request', 'data', 'xml', 'json', 'claim']):
+            if _REQUEST_COLUMN_HINT_RE.search(col.lower()):
                 return col
         
         return None
@@ -4149,7 +4663,7 @@ Translation (one line per phrase, format: original|translation):"""
         print(f"[{idx + 1}/{total_rows}] Processing row {row_num + 1}...")
         
         try:
-            if pd.isna(claim_data) or str(claim_data).strip() == "":
+            if _is_blank_cell(claim_data):
                 print(f"  ⚠ Skipped - Empty row")
                 return results
             
@@ -4163,63 +4677,33 @@ Translation (one line per phrase, format: original|translation):"""
             
             try:
                 json_data = self.detect_and_convert(str(claim_data))
-                print(f"  ✓ Converted to JSON successfully (Row {row_num + 1})")
+                logger.debug("✓ Converted to JSON successfully (Row %d)", row_num + 1)
+                
+                # Locate Case_Info once (EICWS / cases / Case_Info layouts) - reused for
+                # DAA values, parties and accident details below
+                case_info = _locate_case_info(json_data) if isinstance(json_data, dict) else None
                 
                 # Extract DAA values from JSON/XML data in Request column
-                # Try multiple possible locations in the JSON structure
                 accident_info_raw = None
                 if isinstance(json_data, dict):
-                    # Try EICWS structure
-                    if "EICWS" in json_data:
-                        case_info = json_data.get("EICWS", {}).get("cases", {}).get("Case_Info", {})
-                        accident_info_raw = case_info.get("Accident_info", {})
-                    # Try cases structure
-                    elif "cases" in json_data:
-                        case_info = json_data.get("cases", {}).get("Case_Info", {})
+                    # Case_Info's Accident_info, else a direct Accident_info, else the root level
+                    if case_info:
                         accident_info_raw = case_info.get("Accident_info", {})
-                    # Try Case_Info structure
-                    elif "Case_Info" in json_data:
-                        accident_info_raw = json_data.get("Case_Info", {}).get("Accident_info", {})
-                    # Try direct accident_info
-                    elif "Accident_info" in json_data:
+                    else:
                         accident_info_raw = json_data.get("Accident_info", {})
-                    # Try at root level
                     if not accident_info_raw:
                         accident_info_raw = json_data
                 
                 # Extract DAA values from accident_info
                 if accident_info_raw:
                     # Try various field name variations
-                    isDAA_value = (
-                        accident_info_raw.get("isDAA") or
-                        accident_info_raw.get("is_daa") or
-                        accident_info_raw.get("IsDAA") or
-                        None
-                    )
-                    if isDAA_value is not None:
-                        daa_from_request['isDAA'] = str(isDAA_value).strip() if pd.notna(isDAA_value) else None
-                    
-                    suspect_fraud_value = (
-                        accident_info_raw.get("Suspect_as_Fraud") or
-                        accident_info_raw.get("suspect_as_fraud") or
-                        accident_info_raw.get("SuspectAsFraud") or
-                        None
-                    )
-                    if suspect_fraud_value is not None:
-                        daa_from_request['Suspect_as_Fraud'] = str(suspect_fraud_value).strip() if pd.notna(suspect_fraud_value) else None
-                    
-                    daa_reason_value = (
-                        accident_info_raw.get("DaaReasonEnglish") or
-                        accident_info_raw.get("daa_reason_english") or
-                        accident_info_raw.get("DaaReason") or
-                        accident_info_raw.get("daaReasonEnglish") or
-                        None
-                    )
-                    if daa_reason_value is not None:
-                        daa_from_request['DaaReasonEnglish'] = str(daa_reason_value).strip() if pd.notna(daa_reason_value) else None
+                    daa_from_request['isDAA'] = _first_text(accident_info_raw, _DAA_FIELD_KEYS["isDAA"])
+                    daa_from_request['Suspect_as_Fraud'] = _first_text(accident_info_raw, _DAA_FIELD_KEYS["Suspect_as_Fraud"])
+                    daa_from_request['DaaReasonEnglish'] = _first_text(accident_info_raw, _DAA_FIELD_KEYS["DaaReasonEnglish"])
                     
                     if any(daa_from_request.values()):
-                        print(f"  ✓ Extracted DAA from Request: isDAA={daa_from_request['isDAA']}, Suspect_as_Fraud={daa_from_request['Suspect_as_Fraud']}, DaaReasonEnglish={daa_from_request['DaaReasonEnglish']}")
+                        logger.debug("✓ Extracted DAA from Request: isDAA=%s, Suspect_as_Fraud=%s, DaaReasonEnglish=%s",
+                                     daa_from_request['isDAA'], daa_from_request['Suspect_as_Fraud'], daa_from_request['DaaReasonEnglish'])
             except Exception as e:
                 error_msg = str(e)
                 print(f"  ✗ Conversion error (Row {row_num + 1}): {error_msg[:200]}")
@@ -4254,124 +4738,32 @@ Translation (one line per phrase, format: original|translation):"""
             # Extract parties from JSON and add License_Type_From_Make_Model to each
             if isinstance(json_data, dict):
                 # Find parties in different possible locations
-                parties_to_update = []
-                
-                # Check EICWS structure
-                if "EICWS" in json_data:
-                    case_info = json_data.get("EICWS", {}).get("cases", {}).get("Case_Info", {})
-                    if case_info:
-                        parties_raw = case_info.get("parties", {})
-                        if isinstance(parties_raw, dict):
-                            party_info_list = parties_raw.get("Party_Info", [])
-                            if isinstance(party_info_list, list):
-                                parties_to_update = party_info_list
-                            elif isinstance(party_info_list, dict):
-                                parties_to_update = [party_info_list]
-                        elif isinstance(parties_raw, list):
-                            parties_to_update = parties_raw
-                
-                # Check cases structure
-                if not parties_to_update and "cases" in json_data:
-                    case_info = json_data.get("cases", {}).get("Case_Info", {})
-                    if case_info:
-                        parties_raw = case_info.get("parties", {})
-                        if isinstance(parties_raw, dict):
-                            party_info_list = parties_raw.get("Party_Info", [])
-                            if isinstance(party_info_list, list):
-                                parties_to_update = party_info_list
-                            elif isinstance(party_info_list, dict):
-                                parties_to_update = [party_info_list]
-                        elif isinstance(parties_raw, list):
-                            parties_to_update = parties_raw
-                
-                # Check Case_Info structure
-                if not parties_to_update and "Case_Info" in json_data:
-                    case_info = json_data.get("Case_Info", {})
-                    parties_raw = case_info.get("parties", {})
-                    if isinstance(parties_raw, dict):
-                        party_info_list = parties_raw.get("Party_Info", [])
-                        if isinstance(party_info_list, list):
-                            parties_to_update = party_info_list
-                        elif isinstance(party_info_list, dict):
-                            parties_to_update = [party_info_list]
-                    elif isinstance(parties_raw, list):
-                        parties_to_update = parties_raw
+                parties_to_update = _case_party_list(case_info) if case_info else []
                 
                 # Check direct Parties array
                 if not parties_to_update and "Parties" in json_data:
                     parties_to_update = json_data.get("Parties", [])
                 
-                # Add License_Type_From_Make_Model to ALL parties before sending to Ollama
-                # Extract parties from JSON and add License_Type_From_Make_Model to each
-                if isinstance(json_data, dict):
-                    # Find parties in different possible locations
-                    parties_to_update = []
-                    
-                    # Check EICWS structure
-                    if "EICWS" in json_data:
-                        case_info = json_data.get("EICWS", {}).get("cases", {}).get("Case_Info", {})
-                        if case_info:
-                            parties_raw = case_info.get("parties", {})
-                            if isinstance(parties_raw, dict):
-                                party_info_list = parties_raw.get("Party_Info", [])
-                                if isinstance(party_info_list, list):
-                                    parties_to_update = party_info_list
-                                elif isinstance(party_info_list, dict):
-                                    parties_to_update = [party_info_list]
-                            elif isinstance(parties_raw, list):
-                                parties_to_update = parties_raw
-                    
-                    # Check cases structure
-                    if not parties_to_update and "cases" in json_data:
-                        case_info = json_data.get("cases", {}).get("Case_Info", {})
-                        if case_info:
-                            parties_raw = case_info.get("parties", {})
-                            if isinstance(parties_raw, dict):
-                                party_info_list = parties_raw.get("Party_Info", [])
-                                if isinstance(party_info_list, list):
-                                    parties_to_update = party_info_list
-                                elif isinstance(party_info_list, dict):
-                                    parties_to_update = [party_info_list]
-                            elif isinstance(parties_raw, list):
-                                parties_to_update = parties_raw
-                    
-                    # Check Case_Info structure
-                    if not parties_to_update and "Case_Info" in json_data:
-                        case_info = json_data.get("Case_Info", {})
-                        parties_raw = case_info.get("parties", {})
-                        if isinstance(parties_raw, dict):
-                            party_info_list = parties_raw.get("Party_Info", [])
-                            if isinstance(party_info_list, list):
-                                parties_to_update = party_info_list
-                            elif isinstance(party_info_list, dict):
-                                parties_to_update = [party_info_list]
-                        elif isinstance(parties_raw, list):
-                            parties_to_update = parties_raw
-                    
-                    # Check direct Parties array
-                    if not parties_to_update and "Parties" in json_data:
-                        parties_to_update = json_data.get("Parties", [])
-                    
-                    # Update each party with License_Type_From_Make_Model
-                    if parties_to_update:
-                        print(f"  🔍 Adding License_Type_From_Make_Model to {len(parties_to_update)} party(ies)...")
-                        for party in parties_to_update:
-                            if isinstance(party, dict):
-                                # Extract carMake and carModel
-                                car_make = party.get("carMake", party.get("car_make", party.get("Vehicle_Make", "")))
-                                car_model = party.get("carModel", party.get("car_model", party.get("Vehicle_Model", "")))
-                                
-                                # Lookup License type from Make/Model mapping
-                                if car_make and car_model:
-                                    license_type_from_mapping = self.lookup_license_type_from_make_model(car_make, car_model)
-                                    if license_type_from_mapping:
-                                        party["License_Type_From_Make_Model"] = license_type_from_mapping
-                                        print(f"    ✅ Added License_Type_From_Make_Model = {license_type_from_mapping} (Make: {car_make}, Model: {car_model})")
-                                    else:
-                                        party["License_Type_From_Make_Model"] = ""
-                                        print(f"    ⚠️ No License_Type_From_Make_Model found (Make: {car_make}, Model: {car_model})")
+                # Update each party with License_Type_From_Make_Model
+                if parties_to_update:
+                    logger.debug("🔍 Adding License_Type_From_Make_Model to %d party(ies)...", len(parties_to_update))
+                    for party in parties_to_update:
+                        if isinstance(party, dict):
+                            # Extract carMake and carModel
+                            car_make = party.get("carMake", party.get("car_make", party.get("Vehicle_Make", "")))
+                            car_model = party.get("carModel", party.get("car_model", party.get("Vehicle_Model", "")))
+                            
+                            # Lookup License type from Make/Model mapping
+                            if car_make and car_model:
+                                license_type_from_mapping = self.lookup_license_type_from_make_model(car_make, car_model)
+                                if license_type_from_mapping:
+                                    party["License_Type_From_Make_Model"] = license_type_from_mapping
+                                    logger.debug("✅ Added License_Type_From_Make_Model = %s (Make: %s, Model: %s)", license_type_from_mapping, car_make, car_model)
                                 else:
                                     party["License_Type_From_Make_Model"] = ""
+                                    logger.debug("⚠️ No License_Type_From_Make_Model found (Make: %s, Model: %s)", car_make, car_model)
+                            else:
+                                party["License_Type_From_Make_Model"] = ""
             
             # VALIDATION: Ensure JSON data is valid before processing
             if not isinstance(json_data, dict):
@@ -4385,16 +4777,14 @@ Translation (one line per phrase, format: original|translation):"""
             if not has_valid_structure:
                 print(f"  ⚠️ Warning: JSON structure may be incomplete (Row {row_num + 1})")
             
-            # Convert JSON back to string for processing
-            claim_json_str = json.dumps(json_data, ensure_ascii=False)
-            
             # VALIDATION: Ensure claim data is not empty
-            if not claim_json_str or len(claim_json_str.strip()) < 50:
+            if not json_data:
                 raise ValueError("Claim data is too short or empty")
             
             # Process claim with better error handling and validation
+            # (the converted dict is handed over as-is - no JSON re-serialize / re-parse round trip)
             try:
-                result = self.processor.process_claim(claim_json_str, input_format="json", process_parties_separately=True)
+                result = self.processor.process_claim(json_data, input_format="dict", process_parties_separately=True)
                 
                 # VALIDATION: Ensure result is valid
                 if not isinstance(result, dict):
@@ -4405,7 +4795,7 @@ Translation (one line per phrase, format: original|translation):"""
                     print(f"  ⚠️ Warning: No parties found in result (Row {row_num + 1})")
                     result["parties"] = []
                 
-                print(f"  ✓ Processed by Ollama model (Row {row_num + 1}) - {len(result.get('parties', []))} party(ies)")
+                logger.debug("✓ Processed by Ollama model (Row %d) - %d party(ies)", row_num + 1, len(result.get('parties', [])))
             except ConnectionError as e:
                 error_msg = str(e)
                 print(f"  ✗ Connection error (Row {row_num + 1}): {error_msg[:300]}")
@@ -4480,37 +4870,15 @@ Translation (one line per phrase, format: original|translation):"""
             
             # Also try to extract case number from JSON data if not found in result
             if not case_number or case_number.startswith("Case_"):
-                # Try to extract from JSON data
                 if isinstance(json_data, dict):
-                    case_number_fields = ['Case_Number', 'case_number', 'CaseNumber', 'caseNumber', 
-                                        'CaseNo', 'caseNo', 'Case_No', 'case_no', 'ClaimNumber', 'claimNumber']
-                    for field in case_number_fields:
-                        if field in json_data:
-                            case_number = str(json_data[field]).strip()
-                            break
-                    
-                    # Also check in accident details
-                    if (not case_number or case_number.startswith("Case_")) and 'accident_details' in json_data:
-                        accident_details = json_data.get('accident_details', {})
-                        for field in case_number_fields:
-                            if field in accident_details:
-                                case_number = str(accident_details[field]).strip()
-                                break
+                    request_case_number = _request_case_number(json_data)
+                    if request_case_number is not None:
+                        case_number = request_case_number
             
             print(f"  ✓ Case: {case_number} - {len(parties)} parties (Row {row_num + 1})")
             
-            # Extract case info from JSON
-            case_info = None
-            accident_info = {}
-            if "EICWS" in json_data:
-                case_info = json_data.get("EICWS", {}).get("cases", {}).get("Case_Info", {})
-                accident_info = case_info.get("Accident_info", {}) if case_info else {}
-            if not case_info and "cases" in json_data:
-                case_info = json_data.get("cases", {}).get("Case_Info", {})
-                accident_info = case_info.get("Accident_info", {}) if case_info else {}
-            if not case_info and "Case_Info" in json_data:
-                case_info = json_data.get("Case_Info", {})
-                accident_info = case_info.get("Accident_info", {}) if case_info else {}
+            # Accident info from the Case_Info node located after conversion
+            accident_info = case_info.get("Accident_info", {}) if case_info else {}
             
             # Extract accident information
             accident_details = self.extract_accident_info(accident_info)
@@ -4519,37 +4887,58 @@ Translation (one line per phrase, format: original|translation):"""
                 accident_details = {}
             accident_description = accident_details.get("Description", "") if isinstance(accident_details, dict) else ""
             
-            # Get parties data
-            parties_data = {}
-            if case_info:
-                parties_raw = case_info.get("parties", {})
-                if isinstance(parties_raw, dict):
-                    party_info_list = parties_raw.get("Party_Info", [])
-                    if isinstance(party_info_list, dict):
-                        parties_data = {0: party_info_list}
-                    elif isinstance(party_info_list, list):
-                        parties_data = {i: p for i, p in enumerate(party_info_list)}
-                elif isinstance(parties_raw, list):
-                    parties_data = {i: p for i, p in enumerate(parties_raw)}
+            # Get parties data - keyed by party index rather than a list: the model can return more
+            # parties than the request lists (their raw data is filled in from party_info below), and
+            # the validation helpers take this Dict[int, Dict] and .get() missing indices as {}
+            parties_data = dict(enumerate(_case_party_list(case_info))) if case_info else {}
             
-            # Extract all Party IDs first (before processing individual parties)
-            # This allows us to match all parties to dates at once
+            # One pass over the parties before processing them:
+            # - extract all Party IDs, so all parties can be matched to dates at once
+            # - pre-extract License_Type_From_Make_Model, so all parties have it when sent to Ollama
+            # The party_info extracted here is reused by the party workers and the validation pass below
             all_party_ids = []
+            party_infos = {}
+            print(f"  🔍 Pre-extracting License_Type_From_Make_Model for all parties...")
             for party_idx, party_decision in enumerate(parties):
                 party_raw_data = parties_data.get(party_idx, {})
                 if not party_raw_data and "party_info" in party_decision:
                     party_raw_data = party_decision.get("party_info", {})
                 party_info_temp = self.extract_party_info(party_raw_data)
+                party_infos[party_idx] = party_info_temp
                 party_id_temp = party_info_temp.get("Party_ID", "")
                 if not party_id_temp and "party_id" in party_decision:
                     party_id_temp = str(party_decision.get("party_id", ""))
                 # Clean Party_ID - remove Arabic characters, keep only digits
                 if party_id_temp:
-                    party_id_clean = re.sub(r'[^\d]', '', str(party_id_temp))
+                    party_id_clean = _NONDIGIT_RE.sub('', str(party_id_temp))
                     if party_id_clean:
                         all_party_ids.append(party_id_clean)
                     else:
                         all_party_ids.append(str(party_id_temp).strip())
+                
+                # Extract carMake and carModel for this party
+                car_make = party_raw_data.get("carMake", party_raw_data.get("car_make", "")) if party_raw_data else ""
+                car_model = party_raw_data.get("carModel", party_raw_data.get("car_model", "")) if party_raw_data else ""
+                
+                # Fallback to party_info if not found in raw data
+                if not car_make:
+                    car_make = party_info_temp.get("Vehicle_Make", "")
+                if not car_model:
+                    car_model = party_info_temp.get("Vehicle_Model", "")
+                
+                # Lookup License type from Make/Model mapping
+                if car_make and car_model:
+                    license_type_from_mapping = self.lookup_license_type_from_make_model(car_make, car_model)
+                    if license_type_from_mapping:
+                        # Add to party_raw_data so it's available when processing
+                        if not party_raw_data:
+                            party_raw_data = {}
+                        party_raw_data["License_Type_From_Make_Model"] = license_type_from_mapping
+                        parties_data[party_idx] = party_raw_data
+                        party_info_temp["License_Type_From_Make_Model"] = license_type_from_mapping
+                        print(f"  ✅ Party {party_idx + 1}: License_Type_From_Make_Model = {license_type_from_mapping} (Make: {car_make}, Model: {car_model})")
+                    else:
+                        print(f"  ⚠️ Party {party_idx + 1}: No License_Type_From_Make_Model found (Make: {car_make}, Model: {car_model})")
             
             # Pre-extract dates for all parties if base64 file exists
             # This allows us to match all parties to dates at once, ensuring each gets a unique date
@@ -4557,92 +4946,52 @@ Translation (one line per phrase, format: original|translation):"""
             used_dates_for_case = set()  # Track dates already assigned in this case to prevent reuse
             case_ocr_text = None  # Store OCR text (translated) for later use in license type/upload date extraction
             case_date_positions = []  # Store date positions for later use in order-based assignment
-            # Store case number for base64 file access in parallel processing - always initialize
-            case_number_for_base64 = str(case_number).strip() if case_number else None
             if base64_files_path and case_number:
                 case_clean = str(case_number).strip()
-                case_number_for_base64 = case_clean  # Store for use in parallel processing
-                base64_file_path = os.path.join(base64_files_path, f"{case_clean}.txt")
-                
-                # Try to find base64 file (with alternative paths)
-                alternative_paths = [base64_file_path]
-                if not os.path.exists(base64_file_path):
-                    # Try alternative formats (same logic as before)
-                    if len(case_clean) > 2 and case_clean[:2].isalpha():
-                        alternative_paths.append(os.path.join(base64_files_path, f"{case_clean[2:]}.txt"))
-                    if len(case_clean) > 10:
-                        alternative_paths.append(os.path.join(base64_files_path, f"{case_clean[-10:]}.txt"))
-                    for variant in [case_clean.replace('-', ''), case_clean.replace('_', ''), case_clean.replace(' ', '')]:
-                        if variant != case_clean:
-                            alternative_paths.append(os.path.join(base64_files_path, f"{variant}.txt"))
                 
-                base64_file_path = None
-                for path in alternative_paths:
-                    if os.path.exists(path):
-                        base64_file_path = path
-                        break
+                # Try to find base64 file (with alternative case number formats)
+                base64_file_path = self._find_base64_file(base64_files_path, case_clean)
                 
-                if base64_file_path and os.path.exists(base64_file_path):
+                if base64_file_path:
                     try:
                         print(f"  📁 Pre-extracting dates for all parties from: {base64_file_path}")
-                        with open(base64_file_path, 'r', encoding='utf-8') as f:
+                        # Base64 is ASCII - read the raw bytes and hand them to b64decode without a
+                        # UTF-8 decode / ASCII re-encode round trip per page
+                        with open(base64_file_path, 'rb') as f:
                             file_content = f.read().strip()
+                        if b'\r' in file_content:
+                            # Same newlines the text-mode read used to give (\r\n and \r -> \n)
+                            file_content = file_content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
                         
                         if file_content:
                             # Parse base64 images
-                            base64_images = []
-                            if '\n\n' in file_content:
-                                base64_images = [img.strip() for img in file_content.split('\n\n') if img.strip()]
-                            elif '\n' in file_content:
-                                lines = file_content.split('\n')
-                                if len(lines) > 1 and all(len(line) > 100 for line in lines):
-                                    base64_images = [line.strip() for line in lines if line.strip()]
-                                else:
-                                    base64_images = [file_content]
-                            else:
-                                base64_images = [file_content]
+                            base64_images = _split_base64_pages(file_content)
                             
                             # Try to extract all Party IDs and dates from ALL images
                             # (typically all parties are in the same image/document, but check all to be safe)
                             if base64_images and len(base64_images) > 0:
                                 try:
-                                    from PIL import Image
-                                    from io import BytesIO
-                                    import base64
-                                    
                                     # Combine OCR text from all images to ensure we get all parties and dates
+                                    # Pages are OCR'd concurrently (Tesseract releases the GIL) and combined in page order.
+                                    # Not one tesseract list-file run: that loses the per-page PSM retry, and the
+                                    # engine start-up it saves is already gone with tesserocr
                                     all_ocr_text = ""
-                                    for img_idx, base64_img in enumerate(base64_images):
-                                        try:
-                                            img_bytes = base64.b64decode(base64_img.split(',')[-1] if ',' in base64_img else base64_img)
-                                            image = Image.open(BytesIO(img_bytes))
-                                            if image.mode != 'RGB':
-                                                image = image.convert('RGB')
-                                            
-                                            # Perform OCR
-                                            ocr_text = ""
-                                            for psm_mode in ['6', '4', '11', '12', '3']:
-                                                try:
-                                                    config = f'--psm {psm_mode} --oem 3'
-                                                    ocr_text = pytesseract.image_to_string(image, lang='ara+eng', config=config)
-                                                    if len(ocr_text.strip()) > 20:
-                                                        break
-                                                except:
-                                                    continue
-                                            
-                                            if len(ocr_text.strip()) > 20:
-                                                all_ocr_text += "\n\n" + ocr_text  # Combine with separator
-                                                print(f"  📄 Processed image {img_idx + 1}/{len(base64_images)} ({len(ocr_text)} chars)")
-                                        except Exception as e:
-                                            print(f"  ⚠️ Error processing image {img_idx + 1}: {str(e)[:100]}")
-                                            continue
+                                    with ThreadPoolExecutor(max_workers=min(len(base64_images), OCR_PAGE_WORKERS)) as page_executor:
+                                        page_futures = [page_executor.submit(self._ocr_base64_page, base64_img)
+                                                        for base64_img in base64_images]
+                                        for img_idx, page_future in enumerate(page_futures):
+                                            try:
+                                                ocr_text = page_future.result()
+                                                if len(ocr_text.strip()) > 20:
+                                                    all_ocr_text += "\n\n" + ocr_text  # Combine with separator
+                                                    print(f"  📄 Processed image {img_idx + 1}/{len(base64_images)} ({len(ocr_text)} chars)")
+                                            except Exception as e:
+                                                print(f"  ⚠️ Error processing image {img_idx + 1}: {str(e)[:100]}")
+                                                continue
                                     
                                     if len(all_ocr_text.strip()) > 20:
-                                        # Clean OCR text
-                                        ocr_text_clean = all_ocr_text
-                                        invisible_chars = ['\u200E', '\u200F', '\u200B', '\u200C', '\u200D', '\uFEFF', '\u2060']
-                                        for char in invisible_chars:
-                                            ocr_text_clean = ocr_text_clean.replace(char, '')
+                                        # Clean OCR text - same single-pass deletion table as extract_license_expiry_from_image
+                                        ocr_text_clean = all_ocr_text.translate(_OCR_CLEAN_TRANS)
                                         ocr_text_normalized = ' '.join(ocr_text_clean.split())
                                         
                                         # Translate to English for better extraction (optional but recommended)
@@ -4668,7 +5017,7 @@ Translation (one line per phrase, format: original|translation):"""
                                         # Clean Party IDs - remove Arabic characters before matching
                                         all_party_ids_clean = []
                                         for pid in all_party_ids:
-                                            pid_clean = re.sub(r'[^\d]', '', str(pid))
+                                            pid_clean = _NONDIGIT_RE.sub('', str(pid))
                                             if pid_clean:
                                                 all_party_ids_clean.append(pid_clean)
                                             else:
@@ -4683,65 +5032,41 @@ Translation (one line per phrase, format: original|translation):"""
                                         print(f"  📊 Pre-extraction results:")
                                         print(f"     Looking for Party IDs (cleaned): {all_party_ids_clean}")
                                         print(f"     Found {len(party_positions)} Party ID(s) in OCR: {[pid for pid, _, _ in party_positions]}")
-                                        print(f"     Found {len(date_positions)} expiry date(s) in OCR: {[date for date, _, _ in date_positions]}")
-                                        
-                                        # DEBUG: Show OCR text sample for investigation
-                                        ocr_sample_length = min(1000, len(ocr_text_for_extraction))
-                                        ocr_sample = ocr_text_for_extraction[:ocr_sample_length]
-                                        print(f"  🔍 DEBUG: OCR text sample (first {ocr_sample_length} chars):")
-                                        print(f"     {ocr_sample}")
-                                        if len(ocr_text_for_extraction) > ocr_sample_length:
-                                            print(f"     ... (truncated, total length: {len(ocr_text_for_extraction)} chars)")
+                                        print(f"     Found {len(date_positions)} expiry date(s) in OCR: {[date_text for date_text, _, _ in date_positions]}")
                                         
-                                        # DEBUG: Show detailed positions
-                                        if party_positions:
-                                            print(f"     Party ID positions:")
+                                        # DEBUG: OCR text sample and the context around each position - the
+                                        # context slices are only taken when debug logging is enabled
+                                        if logger.isEnabledFor(logging.DEBUG):
+                                            logger.debug("🔍 OCR text sample (first 1000 of %d chars): %.1000s",
+                                                         len(ocr_text_for_extraction), ocr_text_for_extraction)
                                             for pid, start, end in party_positions:
-                                                # Show context around Party ID
-                                                context_start = max(0, start - 100)
-                                                context_end = min(len(ocr_text_for_extraction), end + 100)
-                                                context = ocr_text_for_extraction[context_start:context_end]
-                                                print(f"       - {pid} at position {start}-{end}")
-                                                print(f"         Context: '{context}'")
-                                        if date_positions:
-                                            print(f"     Date positions:")
-                                            for date, start, end in date_positions:
-                                                # Show context around date
-                                                context_start = max(0, start - 150)
-                                                context_end = min(len(ocr_text_for_extraction), end + 150)
-                                                context = ocr_text_for_extraction[context_start:context_end]
-                                                print(f"       - {date} at position {start}-{end}")
-                                                print(f"         Context: '{context}'")
+                                                logger.debug("Party ID %s at position %d-%d, context: '%s'", pid, start, end,
+                                                             ocr_text_for_extraction[max(0, start - 100):end + 100])
+                                            for date_text, start, end in date_positions:
+                                                logger.debug("Date %s at position %d-%d, context: '%s'", date_text, start, end,
+                                                             ocr_text_for_extraction[max(0, start - 150):end + 150])
                                         
                                         # CRITICAL: Verify we have enough dates for all parties
                                         if len(date_positions) < len(all_party_ids):
                                             print(f"  ⚠️ WARNING: Only {len(date_positions)} date(s) found for {len(all_party_ids)} party(ies)!")
                                             print(f"  ⚠️ This may cause multiple parties to get the same date.")
                                             print(f"  ⚠️ Please check OCR extraction - all expiry dates should be extracted.")
-                                            print(f"  ⚠️ DEBUG: This is the ROOT CAUSE of duplicate dates!")
-                                            # Show what dates we DID find vs what we need
-                                            print(f"  🔍 DEBUG: Need {len(all_party_ids)} dates, found {len(date_positions)}:")
-                                            for idx, (date, start, end) in enumerate(date_positions, 1):
-                                                print(f"     {idx}. {date} (position {start}-{end})")
-                                            # Search for expiry keywords in OCR to see if patterns might be wrong
-                                            expiry_keywords = ['تاريخ إنتهاء', 'تاريخ انتهاء', 'Expiry Date', 'License Expiry']
-                                            found_keywords = []
-                                            for kw in expiry_keywords:
-                                                if kw in ocr_text_for_extraction:
-                                                    count = ocr_text_for_extraction.count(kw)
-                                                    found_keywords.append(f"{kw} (x{count})")
-                                            if found_keywords:
-                                                print(f"  🔍 DEBUG: Found expiry keywords in OCR: {', '.join(found_keywords)}")
-                                            else:
-                                                print(f"  🔍 DEBUG: NO expiry keywords found in OCR! This might be why no dates were extracted.")
-                                                print(f"  🔍 DEBUG: Searching for any date-like patterns...")
-                                                # Try to find ANY dates in OCR
-                                                all_date_pattern = r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'
-                                                all_dates_found = re.findall(all_date_pattern, ocr_text_for_extraction)
-                                                if all_dates_found:
-                                                    print(f"  🔍 DEBUG: Found {len(all_dates_found)} date-like patterns in OCR (may include wrong dates): {all_dates_found[:10]}...")
+                                            if logger.isEnabledFor(logging.DEBUG):
+                                                # Show what dates we DID find vs what we need
+                                                logger.debug("🔍 Need %d dates, found %d: %s", len(all_party_ids), len(date_positions),
+                                                             [(date_text, start, end) for date_text, start, end in date_positions])
+                                                # Search for expiry keywords in OCR to see if patterns might be wrong
+                                                keyword_counts = {}
+                                                for m in _EXPIRY_LABEL_KEYWORDS_RE.finditer(ocr_text_for_extraction):
+                                                    keyword_counts[m.group(1)] = keyword_counts.get(m.group(1), 0) + 1
+                                                found_keywords = [f"{kw} (x{count})" for kw, count in keyword_counts.items()]
+                                                if found_keywords:
+                                                    logger.debug("🔍 Found expiry keywords in OCR: %s", ', '.join(found_keywords))
                                                 else:
-                                                    print(f"  🔍 DEBUG: NO date-like patterns found in OCR at all!")
+                                                    # Try to find ANY dates in OCR
+                                                    all_dates_found = _DATE_RE.findall(ocr_text_for_extraction)
+                                                    logger.debug("🔍 NO expiry keywords found in OCR - %d date-like pattern(s) (may include wrong dates): %s",
+                                                                 len(all_dates_found), all_dates_found[:10])
                                         
                                         # Match all parties to dates at once (use translated text for row-based matching)
                                         # Use cleaned Party IDs for matching
@@ -4751,48 +5076,36 @@ Translation (one line per phrase, format: original|translation):"""
                                             print(f"  📋 Pre-matched results: {party_date_matches}")
                                             
                                             # CRITICAL: Verify each party got a unique date
-                                            unique_dates = set(party_date_matches.values())
-                                            if len(unique_dates) < len(party_date_matches):
-                                                print(f"  ⚠️ WARNING: {len(party_date_matches)} parties matched but only {len(unique_dates)} unique dates!")
+                                            date_to_parties = defaultdict(list)
+                                            for pid, date_text in party_date_matches.items():
+                                                date_to_parties[date_text].append(pid)
+                                            if len(date_to_parties) < len(party_date_matches):
+                                                print(f"  ⚠️ WARNING: {len(party_date_matches)} parties matched but only {len(date_to_parties)} unique dates!")
                                                 print(f"  ⚠️ Some parties are sharing the same date:")
-                                                date_to_parties = {}
-                                                for pid, date in party_date_matches.items():
-                                                    if date not in date_to_parties:
-                                                        date_to_parties[date] = []
-                                                    date_to_parties[date].append(pid)
-                                                for date, parties in date_to_parties.items():
-                                                    if len(parties) > 1:
-                                                        print(f"     ⚠️ Date {date} assigned to parties: {parties}")
+                                                for date_text, date_pids in date_to_parties.items():
+                                                    if len(date_pids) > 1:
+                                                        print(f"     ⚠️ Date {date_text} assigned to parties: {date_pids}")
                                                         print(f"     ⚠️ THIS IS THE PROBLEM - Multiple parties getting same date!")
                                             else:
                                                 print(f"  ✅ All parties have unique dates in pre-matching!")
                                         elif not date_positions:
                                             print(f"  ⚠️ WARNING: No expiry dates extracted from image!")
                                             print(f"  ⚠️ This will cause all parties to get 'not identify'")
-                                            print(f"  ⚠️ DEBUG: Check OCR extraction patterns - dates might not be found")
-                                            # Show OCR sample around expiry keywords
-                                            expiry_keywords = ['تاريخ إنتهاء', 'تاريخ انتهاء', 'Expiry Date', 'License Expiry']
-                                            for kw in expiry_keywords:
-                                                if kw in ocr_text_for_extraction:
-                                                    idx = ocr_text_for_extraction.find(kw)
-                                                    context_start = max(0, idx - 200)
-                                                    context_end = min(len(ocr_text_for_extraction), idx + len(kw) + 200)
-                                                    context = ocr_text_for_extraction[context_start:context_end]
-                                                    print(f"  🔍 DEBUG: Found '{kw}' at position {idx}, context:")
-                                                    print(f"     '{context}'")
+                                            if logger.isEnabledFor(logging.DEBUG):
+                                                # Show OCR sample around expiry keywords
+                                                first_positions = {}
+                                                for m in _EXPIRY_LABEL_KEYWORDS_RE.finditer(ocr_text_for_extraction):
+                                                    first_positions.setdefault(m.group(1), m.start())
+                                                for kw, kw_pos in first_positions.items():
                                                     # Try to find dates near this keyword
-                                                    near_text = ocr_text_for_extraction[max(0, idx - 300):min(len(ocr_text_for_extraction), idx + len(kw) + 300)]
-                                                    date_pattern = r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'
-                                                    nearby_dates = re.findall(date_pattern, near_text)
-                                                    if nearby_dates:
-                                                        print(f"  🔍 DEBUG: Found {len(nearby_dates)} date(s) near '{kw}': {nearby_dates}")
-                                                    else:
-                                                        print(f"  🔍 DEBUG: NO dates found near '{kw}' - might be OCR issue or wrong format")
+                                                    near_text = ocr_text_for_extraction[max(0, kw_pos - 300):kw_pos + len(kw) + 300]
+                                                    logger.debug("🔍 Found '%s' at position %d, context: '%s' - date(s) nearby: %s", kw, kw_pos,
+                                                                 ocr_text_for_extraction[max(0, kw_pos - 200):kw_pos + len(kw) + 200],
+                                                                 _DATE_RE.findall(near_text))
                                         elif not party_positions:
                                             print(f"  ⚠️ WARNING: No Party IDs extracted from image!")
                                             print(f"  ⚠️ Cannot match dates to parties")
-                                            print(f"  ⚠️ DEBUG: Party IDs from Excel/JSON: {all_party_ids}")
-                                            print(f"  ⚠️ DEBUG: Check if Party IDs in OCR match these IDs")
+                                            logger.debug("🔍 Party IDs from Excel/JSON: %s - check they match the IDs in the OCR text", all_party_ids)
                                 except Exception as e:
                                     print(f"  ⚠️ Error in pre-extraction: {str(e)[:100]}")
                                     import traceback
@@ -4800,51 +5113,17 @@ Translation (one line per phrase, format: original|translation):"""
                     except Exception as e:
                         print(f"  ⚠️ Error reading base64 file for pre-extraction: {str(e)[:100]}")
             
-            # Pre-extract License_Type_From_Make_Model for ALL parties before processing
-            # This ensures all parties have this field when sent to Ollama
-            print(f"  🔍 Pre-extracting License_Type_From_Make_Model for all parties...")
-            for party_idx, party_decision in enumerate(parties):
-                party_raw_data = parties_data.get(party_idx, {})
-                if not party_raw_data and "party_info" in party_decision:
-                    party_raw_data = party_decision.get("party_info", {})
-                
-                # Extract carMake and carModel for this party
-                car_make = party_raw_data.get("carMake", party_raw_data.get("car_make", "")) if party_raw_data else ""
-                car_model = party_raw_data.get("carModel", party_raw_data.get("car_model", "")) if party_raw_data else ""
-                
-                # Fallback to party_info if not found in raw data
-                if not car_make or not car_model:
-                    party_info_temp = self.extract_party_info(party_raw_data)
-                    if not car_make:
-                        car_make = party_info_temp.get("Vehicle_Make", "")
-                    if not car_model:
-                        car_model = party_info_temp.get("Vehicle_Model", "")
-                
-                # Lookup License type from Make/Model mapping
-                if car_make and car_model:
-                    license_type_from_mapping = self.lookup_license_type_from_make_model(car_make, car_model)
-                    if license_type_from_mapping:
-                        # Add to party_raw_data so it's available when processing
-                        if not party_raw_data:
-                            party_raw_data = {}
-                        party_raw_data["License_Type_From_Make_Model"] = license_type_from_mapping
-                        parties_data[party_idx] = party_raw_data
-                        print(f"  ✅ Party {party_idx + 1}: License_Type_From_Make_Model = {license_type_from_mapping} (Make: {car_make}, Model: {car_model})")
-                    else:
-                        print(f"  ⚠️ Party {party_idx + 1}: No License_Type_From_Make_Model found (Make: {car_make}, Model: {car_model})")
-            
             # OPTIMIZATION: Process parties in parallel for same accident
             # Extract party processing logic to enable parallelization
-            def process_single_party_optimized(party_idx, party_decision, party_raw_data, parties, parties_data, 
-                                               accident_details, accident_description, case_number, party_date_matches,
-                                               used_dates_for_case, case_date_positions, case_ocr_text, case_number_for_base64,
-                                               base64_files_path):
-                """Process a single party - extracted for parallel processing"""
+            def process_single_party_optimized(party_idx, party_decision, party_raw_data, party_info,
+                                               classification_replaced, accident_details, accident_description):
+                """Process a single party - extracted for parallel processing.
+
+                Only reads its own party's data; per-case mutable state (used_dates_for_case,
+                party_date_matches) is updated in the sequential validation pass after gather.
+                """
                 try:
-                    if not party_raw_data and "party_info" in party_decision:
-                        party_raw_data = party_decision.get("party_info", {})
-                    
-                    party_info = self.extract_party_info(party_raw_data)
+                    # party_info was extracted from party_raw_data in the pre-extraction pass
                     
                     # Ensure License_Type_From_Make_Model is in party_info
                     if "License_Type_From_Make_Model" not in party_info and "License_Type_From_Make_Model" in party_raw_data:
@@ -4859,35 +5138,14 @@ Translation (one line per phrase, format: original|translation):"""
                         party_info["Liability"] = int(party_decision.get("liability", 0))
                     
                     # Build full analysis text for model (same as before)
-                    full_analysis = f"""
-Accident Description (Arabic):
-{accident_description}
-
-Case Information:
-- Case Number: {accident_details.get("Case_Number", "")}
-- Surveyor: {accident_details.get("Surveyor", "")}
-- Date: {accident_details.get("Call_Date", "")} Time: {accident_details.get("Call_Time", "")}
-- Location: {accident_details.get("Location", "")}, {accident_details.get("City", "")}
-- Coordinates: {accident_details.get("Coordinates", "")}
-
-Party {party_idx + 1} Information:
-- Name: {party_info.get("Name", "")}
-- ID: {party_info.get("Party_ID", "")}
-- Gender: {party_info.get("Gender", "")}
-- Age: {party_info.get("Age", "")}
-- Nationality: {party_info.get("Nationality", "")}
-- License No: {party_info.get("License_No", "")}
-- Phone: {party_info.get("Phone", "")}
-- Liability: {party_info.get("Liability", 0)}%
-- Vehicle: {party_info.get("Vehicle_Make", "")} {party_info.get("Vehicle_Model", "")} ({party_info.get("Vehicle_Year", "")})
-- Plate No: {party_info.get("Plate_No", "")}
-- Chassis: {party_info.get("Chassis_No", "")}
-- Insurance Company: {party_info.get("Insurance_Name", "")}
-- Policy Number: {party_info.get("Policy_Number", "")}
-- Policy Expiry: {party_info.get("Policy_Expiry", "")}
-- Damage: {party_info.get("Damage_Type", "")}
-- Act/Violation: {party_info.get("Act_Violation", "")}
-"""
+                    party_fields = _BlankDefaultDict(party_info)
+                    party_fields.setdefault("Liability", 0)
+                    full_analysis = _PARTY_ANALYSIS_TEMPLATE.format_map({
+                        "accident_description": accident_description,
+                        "accident": _BlankDefaultDict(accident_details),
+                        "party_number": party_idx + 1,
+                        "party": party_fields,
+                    })
                     
                     decision = party_decision.get("decision", "PENDING")
                     reasoning = party_decision.get("reasoning", "")
@@ -4899,7 +5157,8 @@ Party {party_idx + 1} Information:
                     if reasoning:
                         reasoning_english = self._translate_arabic_to_english(reasoning)
                         reasoning = reasoning_english
-                    if classification:
+                    # A classification a global rule replaces is not worth translating
+                    if classification and not classification_replaced:
                         classification_english = self._translate_arabic_to_english(classification)
                         classification = classification_english
                     
@@ -4918,6 +5177,38 @@ Party {party_idx + 1} Information:
                     print(f"  ✗ Error in parallel party processing for party {party_idx + 1}: {str(e)[:200]}")
                     return None
             
+            # Liability / insurance / Tawuniya flag per party for the cross-party rules in the validation
+            # pass, taken once per accident instead of re-extracting every other party for every party.
+            # Snapshot before the workers run - they apply the decision's liability fallback in place, which
+            # only the global Tawuniya rule uses (liability_with_fallback): (liability, liability_with_fallback,
+            # insurance, is_tawuniya)
+            party_rule_rows = []
+            for party_idx, party_decision in enumerate(parties):
+                rule_info = party_infos[party_idx]
+                rule_liability = rule_info.get("Liability", 0)
+                rule_liability_fallback = rule_liability
+                if rule_info.get("Liability") == 0 and "liability" in party_decision:
+                    rule_liability_fallback = int(party_decision.get("liability", 0))
+                rule_insurance = str(rule_info.get("Insurance_Name", "")).strip()
+                rule_ic_english = str(rule_info.get("ICEnglishName", "")).strip()
+                party_rule_rows.append((rule_liability, rule_liability_fallback, rule_insurance,
+                                        self._is_tawuniya_insurance(rule_insurance, rule_ic_english)))
+            
+            # Parties at 100% liability from a non-Tawuniya company - the global Tawuniya rule rejects every
+            # other party when there is one. The rule itself counts the decision's liability fallback, the
+            # validation analysis text only the extracted liability
+            non_tawuniya_100_idxs = [idx for idx, row in enumerate(party_rule_rows) if row[1] == 100 and not row[3]]
+            non_tawuniya_100_extracted_idxs = [idx for idx, row in enumerate(party_rule_rows) if row[0] == 100 and not row[3]]
+            
+            # Unless the model already rejected the party, Rule #1 (own 100% liability) and the global
+            # Tawuniya rule (another party 100% from non-Tawuniya) replace its classification outright
+            replaced_classifications = [
+                party_decision.get("decision", "PENDING") != "REJECTED" and (
+                    party_rule_rows[party_idx][1] == 100
+                    or any(idx != party_idx for idx in non_tawuniya_100_idxs))
+                for party_idx, party_decision in enumerate(parties)
+            ]
+            
             # Process parties in parallel within this accident
             party_tasks = []
             for party_idx, party_decision in enumerate(parties):
@@ -4925,24 +5216,31 @@ Party {party_idx + 1} Information:
                 if not party_raw_data and "party_info" in party_decision:
                     party_raw_data = party_decision.get("party_info", {})
                 
-                party_tasks.append((party_idx, party_decision, party_raw_data))
+                party_tasks.append((party_idx, party_decision, party_raw_data, party_infos[party_idx]))
             
             # Process parties in parallel (up to number of parties in this accident)
-            max_party_workers = min(len(parties), 10)  # Max 10 workers per accident to avoid overwhelming
+            max_party_workers = min(len(parties), 8)  # Max 8 workers per accident to avoid overwhelming
+            
+            # The workers' only I/O is the reasoning/classification translation - when every text is
+            # ASCII or already cached they are pure CPU, and with the GIL threads would cost more than they save
+            needs_translation = any(
+                self._translation_pending(party_decision.get("reasoning"))
+                or (not replaced_classifications[party_idx]
+                    and self._translation_pending(party_decision.get("classification")))
+                for party_idx, party_decision, _, _ in party_tasks
+            )
             
             party_results_prelim = {}
-            if len(parties) > 1:
+            if len(parties) > 1 and (needs_translation or GIL_DISABLED):
                 print(f"  ⚡ Processing {len(parties)} parties in parallel (max {max_party_workers} workers)...")
                 with ThreadPoolExecutor(max_workers=max_party_workers) as party_executor:
                     party_futures = {
                         party_executor.submit(
                             process_single_party_optimized,
-                            party_idx, party_decision, party_raw_data, parties, parties_data,
-                            accident_details, accident_description, case_number, party_date_matches,
-                            used_dates_for_case, case_date_positions, case_ocr_text, case_number_for_base64,
-                            base64_files_path
+                            party_idx, party_decision, party_raw_data, party_info,
+                            replaced_classifications[party_idx], accident_details, accident_description
                         ): party_idx
-                        for party_idx, party_decision, party_raw_data in party_tasks
+                        for party_idx, party_decision, party_raw_data, party_info in party_tasks
                     }
                     
                     for future in as_completed(party_futures):
@@ -4954,16 +5252,14 @@ Party {party_idx + 1} Information:
                         except Exception as e:
                             print(f"  ✗ Error processing party {party_idx + 1} in parallel: {str(e)[:200]}")
             else:
-                # Single party - process directly
-                party_idx, party_decision, party_raw_data = party_tasks[0]
-                result = process_single_party_optimized(
-                    party_idx, party_decision, party_raw_data, parties, parties_data,
-                    accident_details, accident_description, case_number, party_date_matches,
-                    used_dates_for_case, case_date_positions, case_ocr_text, case_number_for_base64,
-                    base64_files_path
-                )
-                if result:
-                    party_results_prelim[party_idx] = result
+                # Single party or nothing to translate - process directly
+                for party_idx, party_decision, party_raw_data, party_info in party_tasks:
+                    result = process_single_party_optimized(
+                        party_idx, party_decision, party_raw_data, party_info,
+                        replaced_classifications[party_idx], accident_details, accident_description
+                    )
+                    if result:
+                        party_results_prelim[party_idx] = result
             
             # Now process each party result sequentially for validation (validation depends on other parties)
             for party_idx, party_decision in enumerate(parties):
@@ -4978,92 +5274,29 @@ Party {party_idx + 1} Information:
                 classification = prelim_result["classification"]
                 applied_conditions = prelim_result["applied_conditions"]
                 full_analysis = prelim_result["full_analysis"]
-                party_raw_data = parties_data.get(party_idx, {})
-                
-                if not party_raw_data and "party_info" in party_decision:
-                    party_raw_data = party_decision.get("party_info", {})
-                
-                party_info = self.extract_party_info(party_raw_data)
-                
-                # Ensure License_Type_From_Make_Model is in party_info
-                if "License_Type_From_Make_Model" not in party_info and "License_Type_From_Make_Model" in party_raw_data:
-                    party_info["License_Type_From_Make_Model"] = party_raw_data["License_Type_From_Make_Model"]
-                
-                # Fallback from decision
-                if not party_info.get("Party_ID") and "party_id" in party_decision:
-                    party_info["Party_ID"] = str(party_decision.get("party_id", ""))
-                if not party_info.get("Name") and "party_name" in party_decision:
-                    party_info["Name"] = str(party_decision.get("party_name", ""))
-                if party_info.get("Liability") == 0 and "liability" in party_decision:
-                    party_info["Liability"] = int(party_decision.get("liability", 0))
-                
-                # Build full analysis text for model
-                full_analysis = f"""
-Accident Description (Arabic):
-{accident_description}
-
-Case Information:
-- Case Number: {accident_details.get("Case_Number", "")}
-- Surveyor: {accident_details.get("Surveyor", "")}
-- Date: {accident_details.get("Call_Date", "")} Time: {accident_details.get("Call_Time", "")}
-- Location: {accident_details.get("Location", "")}, {accident_details.get("City", "")}
-- Coordinates: {accident_details.get("Coordinates", "")}
-
-Party {party_idx + 1} Information:
-- Name: {party_info.get("Name", "")}
-- ID: {party_info.get("Party_ID", "")}
-- Gender: {party_info.get("Gender", "")}
-- Age: {party_info.get("Age", "")}
-- Nationality: {party_info.get("Nationality", "")}
-- License No: {party_info.get("License_No", "")}
-- Phone: {party_info.get("Phone", "")}
-- Liability: {party_info.get("Liability", 0)}%
-- Vehicle: {party_info.get("Vehicle_Make", "")} {party_info.get("Vehicle_Model", "")} ({party_info.get("Vehicle_Year", "")})
-- Plate No: {party_info.get("Plate_No", "")}
-- Chassis: {party_info.get("Chassis_No", "")}
-- Insurance Company: {party_info.get("Insurance_Name", "")}
-- Policy Number: {party_info.get("Policy_Number", "")}
-- Policy Expiry: {party_info.get("Policy_Expiry", "")}
-- Damage: {party_info.get("Damage_Type", "")}
-- Act/Violation: {party_info.get("Act_Violation", "")}
-"""
                 
-                decision = party_decision.get("decision", "PENDING")
-                reasoning = party_decision.get("reasoning", "")
-                classification = party_decision.get("classification", "UNKNOWN")
-                applied_conditions = party_decision.get("applied_conditions", [])
+                # party_info / party_raw_data are prelim_result's - the party worker already applied the
+                # License_Type_From_Make_Model and decision fallbacks, and built full_analysis from them
                 
-                # CRITICAL: Translate reasoning and classification from Arabic to English if needed
-                if reasoning:
-                    reasoning_english = self._translate_arabic_to_english(reasoning)
-                    reasoning = reasoning_english  # Use English version
-                if classification:
-                    classification_english = self._translate_arabic_to_english(classification)
-                    classification = classification_english  # Use English version
+                # decision / reasoning / classification / applied_conditions are taken from prelim_result
+                # above - reasoning and classification were already translated to English by the party worker
+                # (except a classification that Rule #1 / the global Tawuniya rule below is certain to replace)
                 
                 # ========== VALIDATE DECISION BASED ON LIABILITY ==========
                 # Critical validation: 0% liability party should NOT be rejected just because another party has 100% liability
                 current_liability = party_info.get("Liability", 0)
+                # party_info is the pre-extracted info the rule table was built from - its insurance is unchanged
+                current_is_tawuniya = party_rule_rows[party_idx][3]
                 if current_liability == 0 and decision == "REJECTED":
                     # Check if rejection is only due to another party's 100% liability (incorrect)
-                    rejection_reason_lower = reasoning.lower() if reasoning else ""
-                    classification_lower = classification.lower() if classification else ""
-                    
                     # Check if the rejection reason mentions 100% liability rule incorrectly
                     # Note: classification is already translated to English above
-                    if ("100%" in rejection_reason_lower or "100%" in classification_lower or 
-                        "basic rule" in classification_lower or "rule #1" in classification_lower):
+                    if (reasoning and "100%" in reasoning) or (classification and _RULE1_CLASSIFICATION_RE.search(classification)):
                         # Check if there's another party with 100% liability
-                        has_other_100_percent = False
-                        for other_idx, other_party_decision in enumerate(parties):
-                            if other_idx != party_idx:
-                                other_party_raw = parties_data.get(other_idx, {})
-                                if not other_party_raw and "party_info" in other_party_decision:
-                                    other_party_raw = other_party_decision.get("party_info", {})
-                                other_party_info = self.extract_party_info(other_party_raw)
-                                if other_party_info.get("Liability", 0) == 100:
-                                    has_other_100_percent = True
-                                    break
+                        has_other_100_percent = any(
+                            other_idx != party_idx and row[0] == 100
+                            for other_idx, row in enumerate(party_rule_rows)
+                        )
                         
                         # If rejection is only because another party has 100% liability, this is WRONG
                         if has_other_100_percent:
@@ -5098,7 +5331,7 @@ Party {party_idx + 1} Information:
                     current_insurance_check_rule3 = str(party_info.get("Insurance_Name", "")).strip()
                     current_ic_english_rule3 = str(party_info.get("ICEnglishName", "")).strip()
                     # Check if it's specifically Tawuniya using precise matching with ICEnglishName
-                    is_tawuniya_check_rule3 = self._is_tawuniya_insurance(current_insurance_check_rule3, current_ic_english_rule3)
+                    is_tawuniya_check_rule3 = current_is_tawuniya
                     
                     # Check if party is NON-Tawuniya (not insured with Tawuniya) and has valid liability percentage
                     # Rule #3 applies to all companies that are NOT Tawuniya
@@ -5116,7 +5349,7 @@ Party {party_idx + 1} Information:
                             classification = f"Rule #3: Other insurance companies (non-Tawuniya) - {current_liability}% liability = ACCEPTED"
                             rule3_applied = True
                         else:
-                            print(f"  ✅ VALIDATION: Rule #3 applies and decision is already correct (ACCEPTED or ACCEPTED_WITH_RECOVERY)")
+                            logger.debug("✅ VALIDATION: Rule #3 applies and decision is already correct (ACCEPTED or ACCEPTED_WITH_RECOVERY)")
                             rule3_applied = True
                 
                 # ========== GLOBAL RULE: 100% LIABILITY FROM NON-TAWUNIYA COMPANY ==========
@@ -5125,39 +5358,16 @@ Party {party_idx + 1} Information:
                 # This is because Tawuniya does not accept claims when responsibility party is not Tawuniya
                 # NOTE: This rule OVERRIDES Rule #3 - it applies AFTER Rule #3
                 # Check if any party has 100% liability from a non-Tawuniya company
-                has_100_percent_non_tawuniya = False
+                # (liability here includes the fallback from the other party's decision)
+                idx_check = next((idx for idx in non_tawuniya_100_idxs if idx != party_idx), None)
+                has_100_percent_non_tawuniya = idx_check is not None
                 non_tawuniya_100_party_info = None
-                for idx_check, other_party_decision_check in enumerate(parties):
-                    if idx_check == party_idx:
-                        continue
-                    
-                    # Get other party info
-                    other_party_raw_check = parties_data.get(idx_check, {})
-                    if not other_party_raw_check and "party_info" in other_party_decision_check:
-                        other_party_raw_check = other_party_decision_check.get("party_info", {})
-                    
-                    other_party_info_check = self.extract_party_info(other_party_raw_check)
-                    
-                    # Fallback from decision
-                    if other_party_info_check.get("Liability") == 0 and "liability" in other_party_decision_check:
-                        other_party_info_check["Liability"] = int(other_party_decision_check.get("liability", 0))
-                    
-                    other_liability_check = other_party_info_check.get("Liability", 0)
-                    other_insurance_check = str(other_party_info_check.get("Insurance_Name", "")).strip()
-                    
-                    # Check if this party has 100% liability and is NOT Tawuniya (using precise detection)
-                    if other_liability_check == 100:
-                        other_ic_english_check = str(other_party_info_check.get("ICEnglishName", "")).strip()
-                        is_other_tawuniya = self._is_tawuniya_insurance(other_insurance_check, other_ic_english_check)
-                        
-                        if not is_other_tawuniya:
-                            has_100_percent_non_tawuniya = True
-                            non_tawuniya_100_party_info = {
-                                "idx": idx_check,
-                                "insurance": other_insurance_check,
-                                "liability": other_liability_check
-                            }
-                            break
+                if has_100_percent_non_tawuniya:
+                    non_tawuniya_100_party_info = {
+                        "idx": idx_check,
+                        "insurance": party_rule_rows[idx_check][2],
+                        "liability": 100
+                    }
                 
                 # If there's a 100% liability party from non-Tawuniya, REJECT ALL parties
                 # This OVERRIDES Rule #3 - the global Tawuniya rule takes precedence
@@ -5180,10 +5390,8 @@ Party {party_idx + 1} Information:
                 # It should NOT apply to 100% liability cooperative parties (100% rule applies instead)
                 # Skip if already rejected by global rule (100% from non-Tawuniya)
                 validation_result_cooperative = None
-                current_insurance_check = str(party_info.get("Insurance_Name", "")).strip()
-                current_ic_english_check = str(party_info.get("ICEnglishName", "")).strip()
-                # Use precise Tawuniya detection with ICEnglishName
-                is_cooperative_check = self._is_tawuniya_insurance(current_insurance_check, current_ic_english_check)
+                # Precise Tawuniya detection with ICEnglishName (from the rule table)
+                is_cooperative_check = current_is_tawuniya
                 
                 # Check cooperative rules for ALL cooperative parties (including 0%), except those with 100% liability
                 # (100% liability cooperative parties are handled by the 100% rule above)
@@ -5201,8 +5409,8 @@ Party {party_idx + 1} Information:
                         decision = validation_result_cooperative["corrected_decision"]
                         reasoning = f"{reasoning} | COOPERATIVE VALIDATION: {validation_result_cooperative['reason']}" if reasoning else f"COOPERATIVE VALIDATION: {validation_result_cooperative['reason']}"
                     elif validation_result_cooperative["is_valid"] and "Cooperative" in validation_result_cooperative.get("reason", ""):
-                        print(f"  ✅ VALIDATION: Cooperative insurance rule validation passed")
-                        print(f"  ✅ Details: {validation_result_cooperative['reason']}")
+                        logger.debug("✅ VALIDATION: Cooperative insurance rule validation passed - %s",
+                                     validation_result_cooperative['reason'])
                 
                 # ========== VALIDATE ACCEPTED_WITH_RECOVERY DECISION ==========
                 # Get accident date from accident_details (available earlier)
@@ -5225,15 +5433,15 @@ Party {party_idx + 1} Information:
                         # Update reasoning to include validation failure
                         reasoning = f"{reasoning} | VALIDATION: {validation_result['reason']}" if reasoning else f"VALIDATION: {validation_result['reason']}"
                     else:
-                        print(f"  ✅ VALIDATION PASSED: ACCEPTED_WITH_RECOVERY decision is valid")
-                        print(f"  ✅ Validation details: {validation_result['reason']}")
+                        logger.debug("✅ VALIDATION PASSED: ACCEPTED_WITH_RECOVERY decision is valid - %s", validation_result['reason'])
                         # Store recovery reasons and current party analysis for description
                         recovery_reasons_list = validation_result.get("recovery_reasons", [])
                         current_party_recovery_analysis = validation_result.get("current_party_recovery_analysis")
                         if current_party_recovery_analysis:
-                            print(f"  ✅ Current Party Recovery Analysis: Recovery Field={current_party_recovery_analysis.get('recovery_field')}, "
-                                  f"Has Recovery={current_party_recovery_analysis.get('has_recovery_field')}, "
-                                  f"Violations Found={len(current_party_recovery_analysis.get('violations_found', []))}")
+                            logger.debug("✅ Current Party Recovery Analysis: Recovery Field=%s, Has Recovery=%s, Violations Found=%d",
+                                         current_party_recovery_analysis.get('recovery_field'),
+                                         current_party_recovery_analysis.get('has_recovery_field'),
+                                         len(current_party_recovery_analysis.get('violations_found', [])))
                 
                 elif decision == "ACCEPTED":
                     # Check if ACCEPTED decision should be upgraded to ACCEPTED_WITH_RECOVERY
@@ -5255,37 +5463,25 @@ Party {party_idx + 1} Information:
                             recovery_reasons_list = validation_result.get("recovery_reasons", [])
                             current_party_recovery_analysis = validation_result.get("current_party_recovery_analysis")
                             if current_party_recovery_analysis:
-                                print(f"  ✅ Current Party Recovery Analysis: Recovery Field={current_party_recovery_analysis.get('recovery_field')}, "
-                                      f"Has Recovery={current_party_recovery_analysis.get('has_recovery_field')}, "
-                                      f"Violations Found={len(current_party_recovery_analysis.get('violations_found', []))}")
+                                logger.debug("✅ Current Party Recovery Analysis: Recovery Field=%s, Has Recovery=%s, Violations Found=%d",
+                                             current_party_recovery_analysis.get('recovery_field'),
+                                             current_party_recovery_analysis.get('has_recovery_field'),
+                                             len(current_party_recovery_analysis.get('violations_found', [])))
                 
                 # ========== ADD VALIDATION ANALYSIS TO FULL_ANALYSIS ==========
                 # Append validation details to full_analysis for better traceability
                 validation_analysis = []
                 
                 # Check for global rule: 100% liability from non-Tawuniya company
-                has_100_non_tawuniya_analysis = False
+                idx_analysis = next((idx for idx in non_tawuniya_100_extracted_idxs if idx != party_idx), None)
+                has_100_non_tawuniya_analysis = idx_analysis is not None
                 non_tawuniya_100_info_analysis = None
-                for idx_analysis, other_party_decision_analysis in enumerate(parties):
-                    if idx_analysis == party_idx:
-                        continue
-                    other_party_raw_analysis = parties_data.get(idx_analysis, {})
-                    if not other_party_raw_analysis and "party_info" in other_party_decision_analysis:
-                        other_party_raw_analysis = other_party_decision_analysis.get("party_info", {})
-                    other_party_info_analysis = self.extract_party_info(other_party_raw_analysis)
-                    other_liability_analysis = other_party_info_analysis.get("Liability", 0)
-                    if other_liability_analysis == 100:
-                        other_insurance_analysis = str(other_party_info_analysis.get("Insurance_Name", "")).strip()
-                        other_ic_english_analysis = str(other_party_info_analysis.get("ICEnglishName", "")).strip()
-                        is_other_tawuniya_analysis = self._is_tawuniya_insurance(other_insurance_analysis, other_ic_english_analysis)
-                        if not is_other_tawuniya_analysis:
-                            has_100_non_tawuniya_analysis = True
-                            non_tawuniya_100_info_analysis = {
-                                "idx": idx_analysis,
-                                "insurance": other_insurance_analysis,
-                                "liability": other_liability_analysis
-                            }
-                            break
+                if has_100_non_tawuniya_analysis:
+                    non_tawuniya_100_info_analysis = {
+                        "idx": idx_analysis,
+                        "insurance": party_rule_rows[idx_analysis][2],
+                        "liability": 100
+                    }
                 
                 # Add global Tawuniya rule validation (applies to ALL parties)
                 if has_100_non_tawuniya_analysis:
@@ -5309,8 +5505,7 @@ Party {party_idx + 1} Information:
                 
                 # Add Rule #3 (Non-Tawuniya Insurance) validation details
                 current_insurance_name_for_rule3 = str(party_info.get("Insurance_Name", "")).strip()
-                current_ic_english_for_rule3 = str(party_info.get("ICEnglishName", "")).strip()
-                is_tawuniya_rule3 = self._is_tawuniya_insurance(current_insurance_name_for_rule3, current_ic_english_for_rule3)
+                is_tawuniya_rule3 = current_is_tawuniya
                 
                 validation_analysis.append("\n=== VALIDATION: Rule #3 (Non-Tawuniya Insurance) ===")
                 validation_analysis.append("Rule #3: Non-Tawuniya insurance parties with 0%/25%/50%/75% liability")
@@ -5336,8 +5531,7 @@ Party {party_idx + 1} Information:
                 # Add cooperative insurance validation details
                 # Check ALL parties (including 0% liability) for Tawuniya insurance
                 current_insurance_name = str(party_info.get("Insurance_Name", "")).strip()
-                current_ic_english = str(party_info.get("ICEnglishName", "")).strip()
-                is_cooperative = self._is_tawuniya_insurance(current_insurance_name, current_ic_english)
+                is_cooperative = current_is_tawuniya
                 
                 if is_cooperative:
                         validation_analysis.append("\n=== VALIDATION: التعاونيه للتامين (Cooperative Insurance) Rules ===")
@@ -5350,25 +5544,11 @@ Party {party_idx + 1} Information:
                         validation_analysis.append("Exception: ACCEPT if ALL at-fault parties are Cooperative with 25%/50%/75%")
                         
                         # Check for 100% liability from non-cooperative company
-                        has_100_percent_non_coop = False
-                        for idx_check, other_party_decision_check in enumerate(parties):
-                            if idx_check == party_idx:
-                                continue
-                            other_party_raw_check = parties_data.get(idx_check, {})
-                            if not other_party_raw_check and "party_info" in other_party_decision_check:
-                                other_party_raw_check = other_party_decision_check.get("party_info", {})
-                            other_party_info_check = self.extract_party_info(other_party_raw_check)
-                            other_liability_check = other_party_info_check.get("Liability", 0)
-                            if other_liability_check == 100:
-                                other_insurance_check = str(other_party_info_check.get("Insurance_Name", "")).strip()
-                                other_ic_english_check = str(other_party_info_check.get("ICEnglishName", "")).strip()
-                                other_is_coop_check = self._is_tawuniya_insurance(other_insurance_check, other_ic_english_check)
-                                if not other_is_coop_check:
-                                    has_100_percent_non_coop = True
-                                    validation_analysis.append(f"\n⚠️ SPECIAL RULE TRIGGERED:")
-                                    validation_analysis.append(f"  - Party {idx_check + 1} has 100% liability from non-cooperative company: {other_insurance_check}")
-                                    validation_analysis.append(f"  - Current party (Tawuniya) must be REJECTED regardless of liability percentage")
-                                    break
+                        # Same party the global rule analysis above found
+                        if has_100_non_tawuniya_analysis:
+                            validation_analysis.append(f"\n⚠️ SPECIAL RULE TRIGGERED:")
+                            validation_analysis.append(f"  - Party {idx_analysis + 1} has 100% liability from non-cooperative company: {non_tawuniya_100_info_analysis['insurance']}")
+                            validation_analysis.append(f"  - Current party (Tawuniya) must be REJECTED regardless of liability percentage")
                         
                         # Add validation result details
                         if validation_result_cooperative:
@@ -5377,20 +5557,11 @@ Party {party_idx + 1} Information:
                                 validation_analysis.append(f"Corrected Decision: {validation_result_cooperative['corrected_decision']}")
                         
                         # Get other parties info for analysis
-                        other_parties_info = []
-                        for idx, other_party_decision in enumerate(parties):
-                            if idx == party_idx:
-                                continue
-                            other_party_raw = parties_data.get(idx, {})
-                            if not other_party_raw and "party_info" in other_party_decision:
-                                other_party_raw = other_party_decision.get("party_info", {})
-                            other_party_info_temp = self.extract_party_info(other_party_raw)
-                            other_liability = other_party_info_temp.get("Liability", 0)
-                            if other_liability > 0:
-                                other_insurance = other_party_info_temp.get("Insurance_Name", "")
-                                other_ic_english = str(other_party_info_temp.get("ICEnglishName", "")).strip()
-                                other_is_coop = self._is_tawuniya_insurance(str(other_insurance), other_ic_english)
-                                other_parties_info.append(f"  - Party {idx + 1}: Liability={other_liability}%, Insurance={other_insurance}, Tawuniya={other_is_coop}")
+                        other_parties_info = [
+                            f"  - Party {idx + 1}: Liability={other_liability}%, Insurance={other_insurance}, Tawuniya={other_is_coop}"
+                            for idx, (other_liability, _, other_insurance, other_is_coop) in enumerate(party_rule_rows)
+                            if idx != party_idx and other_liability > 0
+                        ]
                         
                         if other_parties_info:
                             validation_analysis.append("\nOther Parties with Liability > 0%:")
@@ -5462,7 +5633,7 @@ Party {party_idx + 1} Information:
                 print(f"📋 Party Information:")
                 print(f"   - Party Index: {party_idx}")
                 print(f"   - Party ID (raw): {party_info.get('Party_ID', 'N/A')}")
-                party_id_cleaned = re.sub(r'[^\d]', '', str(party_info.get('Party_ID', '')))
+                party_id_cleaned = _NONDIGIT_RE.sub('', str(party_info.get('Party_ID', '')))
                 print(f"   - Party ID (cleaned): {party_id_cleaned}")
                 print(f"   - Name: {party_info.get('Name', 'N/A')}")
                 print(f"   - Liability: {party_info.get('Liability', 0)}%")
@@ -5508,7 +5679,7 @@ Party {party_idx + 1} Information:
                 party_id = party_info.get("Party_ID", "")
                 
                 # Clean Party ID for matching - remove Arabic characters
-                party_id_clean_for_matching = re.sub(r'[^\d]', '', str(party_id)) if party_id else ""
+                party_id_clean_for_matching = _NONDIGIT_RE.sub('', str(party_id)) if party_id else ""
                 if not party_id_clean_for_matching and party_id:
                     party_id_clean_for_matching = str(party_id).strip()
                 
@@ -5526,7 +5697,7 @@ Party {party_idx + 1} Information:
                         for pid_key, date_value in party_date_matches.items():
                             pid_key_str = str(pid_key).strip()
                             # Clean the key too
-                            pid_key_clean = re.sub(r'[^\d]', '', pid_key_str)
+                            pid_key_clean = _NONDIGIT_RE.sub('', pid_key_str)
                             if pid_key_clean == party_id_str or pid_key_str == party_id_str:
                                 matched_date = date_value
                                 print(f"  ✅ Using pre-matched date (string match) for Party ID {party_id_clean_for_matching}: {matched_date}")
@@ -5536,7 +5707,7 @@ Party {party_idx + 1} Information:
                         if not matched_date:
                             for pid_key, date_value in party_date_matches.items():
                                 pid_key_str = str(pid_key).strip()
-                                pid_key_clean = re.sub(r'[^\d]', '', pid_key_str)
+                                pid_key_clean = _NONDIGIT_RE.sub('', pid_key_str)
                                 if len(party_id_str) >= 8 and len(pid_key_clean) >= 8:
                                     if party_id_str[-8:] == pid_key_clean[-8:] or party_id_str[-9:] == pid_key_clean[-9:]:
                                         matched_date = date_value
@@ -5549,12 +5720,12 @@ Party {party_idx + 1} Information:
                             # Get all used dates
                             used_dates_set = set(party_date_matches.values())
                             # Find first unused date
-                            for date, _, _ in case_date_positions:
-                                if date not in used_dates_set:
-                                    matched_date = date
+                            for date_text, _, _ in case_date_positions:
+                                if date_text not in used_dates_set:
+                                    matched_date = date_text
                                     # Add to matches for this party
-                                    party_date_matches[party_id_clean_for_matching] = date
-                                    print(f"  ✅ Using order-based assignment: Party ID {party_id_clean_for_matching} → Date {date} (first unused date)")
+                                    party_date_matches[party_id_clean_for_matching] = date_text
+                                    print(f"  ✅ Using order-based assignment: Party ID {party_id_clean_for_matching} → Date {date_text} (first unused date)")
                                     break
                 
                 if matched_date:
@@ -5623,79 +5794,21 @@ Party {party_idx + 1} Information:
                 if license_expiry_date == "not identify" and base64_files_path and case_number:
                     # Try to load base64 from file: {base64_files_path}/{Case_Number}.txt
                     case_clean = str(case_number).strip()
-                    base64_file_path = os.path.join(base64_files_path, f"{case_clean}.txt")
-                    print(f"  🔍 Looking for base64 file: {base64_file_path}")
-                    print(f"  🔍 Case number: {case_clean}")
-                    print(f"  🔍 Base64 files path: {base64_files_path}")
+                    print(f"  🔍 Looking for base64 file for case {case_clean} in: {base64_files_path}")
                     
-                    # List available files in directory for debugging
-                    if os.path.exists(base64_files_path):
-                        try:
-                            available_files = [f for f in os.listdir(base64_files_path) if f.endswith('.txt')]
-                            print(f"  📂 Available .txt files in directory ({len(available_files)} files):")
-                            for f in available_files[:10]:  # Show first 10
-                                print(f"     - {f}")
-                            if len(available_files) > 10:
-                                print(f"     ... and {len(available_files) - 10} more files")
-                        except Exception as e:
-                            print(f"  ⚠️ Could not list directory: {str(e)[:100]}")
-                    
-                    # Also try alternative case number formats if file not found
-                    alternative_paths = [base64_file_path]
-                    if not os.path.exists(base64_file_path):
-                        print(f"  ⚠️ File not found: {base64_file_path}")
-                        print(f"  🔍 Trying alternative case number formats...")
-                        
-                        # Try removing any prefixes (like "RD", "HA", etc.)
-                        if len(case_clean) > 2 and case_clean[:2].isalpha():
-                            case_without_prefix = case_clean[2:]
-                            alt_path = os.path.join(base64_files_path, f"{case_without_prefix}.txt")
-                            if alt_path not in alternative_paths:
-                                alternative_paths.append(alt_path)
-                                print(f"     Trying: {alt_path}")
-                        
-                        # Try last 10 characters (common format: RD1911253329)
-                        if len(case_clean) > 10:
-                            case_short = case_clean[-10:]
-                            alt_path = os.path.join(base64_files_path, f"{case_short}.txt")
-                            if alt_path not in alternative_paths:
-                                alternative_paths.append(alt_path)
-                                print(f"     Trying: {alt_path}")
-                        
-                        # Try with different separators
-                        case_variants = [
-                            case_clean.replace('-', ''),
-                            case_clean.replace('_', ''),
-                            case_clean.replace(' ', ''),
-                        ]
-                        for variant in case_variants:
-                            if variant != case_clean:
-                                alt_path = os.path.join(base64_files_path, f"{variant}.txt")
-                                if alt_path not in alternative_paths:
-                                    alternative_paths.append(alt_path)
-                                    print(f"     Trying: {alt_path}")
-                        
-                        # Try partial match - search for files that start with case number
-                        if os.path.exists(base64_files_path):
-                            try:
-                                for f in os.listdir(base64_files_path):
-                                    if f.endswith('.txt'):
-                                        # Check if filename starts with case number or contains it
-                                        if case_clean in f or f.startswith(case_clean[:8]):  # First 8 chars
-                                            alt_path = os.path.join(base64_files_path, f)
-                                            if alt_path not in alternative_paths:
-                                                alternative_paths.append(alt_path)
-                                                print(f"     Found similar file: {f}")
-                            except Exception:
-                                pass
+                    # Exact name, then alternative case number formats
+                    base64_file_path = self._find_base64_file(base64_files_path, case_clean)
+                    if base64_file_path is None:
+                        # Try partial match - a file whose name contains the case number or starts with its first 8 chars
+                        for path in self._base64_file_names(base64_files_path).values():
+                            file_name = os.path.basename(path)
+                            if case_clean in file_name or file_name.startswith(case_clean[:8]):
+                                base64_file_path = path
+                                print(f"     Found similar file: {file_name}")
+                                break
                     
-                    # Try all alternative paths
-                    base64_file_path = None
-                    for path in alternative_paths:
-                        if os.path.exists(path):
-                            base64_file_path = path
-                            print(f"  ✅✅✅ Found base64 file: {base64_file_path}")
-                            break
+                    if base64_file_path:
+                        print(f"  ✅✅✅ Found base64 file: {base64_file_path}")
                     
                     if base64_file_path and os.path.exists(base64_file_path):
                         try:
@@ -5706,26 +5819,8 @@ Party {party_idx + 1} Information:
                             if file_content:
                                 print(f"  ✓ Loaded base64 from file (length: {len(file_content)} chars)")
                                 
-                                # Handle multiple base64 images in the file (separated by newlines or other delimiters)
-                                # Split by common delimiters
-                                base64_images = []
-                                
-                                # Try splitting by double newlines first (common separator)
-                                if '\n\n' in file_content:
-                                    base64_images = [img.strip() for img in file_content.split('\n\n') if img.strip()]
-                                # Try splitting by single newline if no double newlines
-                                elif '\n' in file_content:
-                                    # Check if it's actually multiple images or just one with line breaks
-                                    lines = file_content.split('\n')
-                                    # If we have multiple lines and they're all long (likely base64), treat as separate images
-                                    if len(lines) > 1 and all(len(line) > 100 for line in lines):
-                                        base64_images = [line.strip() for line in lines if line.strip()]
-                                    else:
-                                        # Single image with line breaks
-                                        base64_images = [file_content]
-                                else:
-                                    # Single image, no line breaks
-                                    base64_images = [file_content]
+                                # Handle multiple base64 images in the file (blank-line or one-per-line separated)
+                                base64_images = _split_base64_pages(file_content)
                                 
                                 print(f"  📷 Found {len(base64_images)} image(s) in file")
                                 
@@ -5843,8 +5938,7 @@ Party {party_idx + 1} Information:
                         # Check if date is valid and reasonable
                         try:
                             # Parse the date to validate it
-                            from datetime import datetime as dt
-                            if re.match(r'^\d{4}-\d{2}-\d{2}$', license_expiry_gregorian):
+                            if _YMD_RE.match(license_expiry_gregorian):
                                 date_parts = license_expiry_gregorian.split('-')
                                 year = int(date_parts[0])
                                 month = int(date_parts[1])
@@ -5867,8 +5961,8 @@ Party {party_idx + 1} Information:
                                 else:
                                     # Try to create a datetime object to validate the date
                                     try:
-                                        parsed_date = dt(year, month, day)
-                                        current_date = dt.now()
+                                        parsed_date = datetime(year, month, day)
+                                        current_date = datetime.now()
                                         current_year = current_date.year
                                         
                                         # CRITICAL: Check if date is in the past (invalid for license expiry)
@@ -5957,7 +6051,7 @@ Party {party_idx + 1} Information:
                                     image = Image.open(BytesIO(img_bytes))
                                     if image.mode != 'RGB':
                                         image = image.convert('RGB')
-                                    ocr_text_temp = pytesseract.image_to_string(image, lang='ara+eng', config='--psm 6 --oem 3')
+                                    ocr_text_temp = self._tesseract_image_to_string(image, lang='ara+eng', psm=6)
                                     ocr_text_for_extraction_local = self.translate_ocr_to_english(ocr_text_temp)
                     except Exception as e:
                         print(f"  ⚠️ Could not extract OCR for Upload Date: {str(e)[:100]}")
@@ -5989,7 +6083,7 @@ Party {party_idx + 1} Information:
                 # Clean Party_ID - remove any Arabic characters that might have been appended
                 party_id_clean = str(party_info.get("Party_ID", "")).strip()
                 # Remove Arabic characters, keep only digits
-                party_id_clean = re.sub(r'[^\d]', '', party_id_clean)
+                party_id_clean = _NONDIGIT_RE.sub('', party_id_clean)
                 if not party_id_clean:
                     party_id_clean = str(party_info.get("Party_ID", "")).strip()
                 
@@ -6180,8 +6274,6 @@ Party {party_idx + 1} Information:
         # CRITICAL: Drastically reduced workers to prevent Ollama overload and timeouts
         # Large models like qwen2.5:14b need more time and can't handle many parallel requests
         if max_workers is None:
-            import multiprocessing
-            cpu_count = multiprocessing.cpu_count()
             # Dynamic scaling based on number of rows
             # For large models (qwen2.5:14b), use EXTREMELY conservative worker counts
             # Model size matters: larger models = fewer parallel workers
@@ -6276,7 +6368,9 @@ Party {party_idx + 1} Information:
             claim_data = df.at[row_num, request_column]
             tasks.append((idx, row_num, claim_data))
         
-        # Process in parallel
+        # Process in parallel on threads, not processes: rows wait on Ollama and Tesseract (both
+        # release the GIL), Ollama caps the worker count, and rows share this processor's caches
+        # and resident Tesseract engines, which worker processes would not
         start_time = datetime.now()
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all tasks
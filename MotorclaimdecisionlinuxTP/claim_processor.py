@@ -5,7 +5,7 @@ Processes accident claim information (XML/JSON) and returns decisions based on r
 
 import json
 import xml.etree.ElementTree as ET
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 import requests
 from datetime import datetime
 from config_manager import config_manager
@@ -1456,13 +1456,13 @@ OUTPUT (JSON only):
         # Should not reach here, but just in case
         raise ConnectionError(f"Failed to connect to Ollama after {max_retries + 1} attempts: {str(last_exception)}")
     
-    def process_claim(self, claim_input: str, input_format: str = "auto", process_parties_separately: bool = True) -> Dict[str, Any]:
+    def process_claim(self, claim_input: Union[str, Dict[str, Any]], input_format: str = "auto", process_parties_separately: bool = True) -> Dict[str, Any]:
         """
         Process a claim from XML or JSON input
         
         Args:
-            claim_input: XML or JSON string containing claim information
-            input_format: 'xml', 'json', or 'auto' (auto-detect)
+            claim_input: XML or JSON string containing claim information, or an already-parsed claim dict
+            input_format: 'xml', 'json', 'dict' (claim_input is parsed already), or 'auto' (auto-detect)
             process_parties_separately: If True, process each party separately (default: True)
         
         Returns:
@@ -1486,8 +1486,11 @@ OUTPUT (JSON only):
             claim_data = self.parse_xml(claim_input)
         elif input_format.lower() == "json":
             claim_data = self.parse_json(claim_input)
+        elif input_format.lower() == "dict":
+            # Already converted by the caller (e.g. Excel rows in UnifiedClaimProcessor) - read only
+            claim_data = claim_input
         else:
-            raise ValueError(f"Unsupported format: {input_format}. Use 'xml' or 'json'")
+            raise ValueError(f"Unsupported format: {input_format}. Use 'xml', 'json' or 'dict'")
         
         # Extract case info and parties (handle different XML structures)
         case_info = None